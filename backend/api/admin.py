@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import CustomUser, Book, Review
+from .models import CustomUser, Book, Review, BackgroundJob, SummaryCacheEntry
 
 class CustomUserAdmin(UserAdmin):
     model = CustomUser
@@ -37,3 +37,17 @@ class ReviewAdmin(admin.ModelAdmin):
     search_fields = ('book__title', 'user__username', 'review_text')
     list_filter = ('rating', 'created_at')
     ordering = ('id',)
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'book', 'status', 'priority', 'attempts', 'run_after', 'finished_at')
+    search_fields = ('kind', 'book__title', 'last_error')
+    list_filter = ('kind', 'status')
+    ordering = ('-id',)
+
+@admin.register(SummaryCacheEntry)
+class SummaryCacheEntryAdmin(admin.ModelAdmin):
+    list_display = ('id', 'provider', 'model', 'hit_count', 'source_is_sampled', 'created_at', 'last_used_at')
+    search_fields = ('cache_key', 'model', 'summary')
+    list_filter = ('provider',)
+    ordering = ('-last_used_at',)
@@ -1,6 +1,32 @@
+import logging
+import sys
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Management commands that serve requests or run jobs; the rest (migrate, collectstatic, ...) never summarize.
+SUMMARIZER_PRELOAD_COMMANDS = {'runserver', 'run_jobs'}
+
+
+def preload_summarizer():
+    if not getattr(settings, 'SUMMARIZER_PRELOAD', False):
+        return
+
+    from .views import SummarizerModelRegistry
+
+    try:
+        SummarizerModelRegistry.get()
+    except Exception as exc:
+        logger.warning(f'Unable to preload the summarization model: {str(exc)}')
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # Gunicorn workers preload from backend/wsgi.py.
+        if sys.argv[1:2] and sys.argv[1] in SUMMARIZER_PRELOAD_COMMANDS:
+            preload_summarizer()
@@ -0,0 +1,140 @@
+"""Vectorized extractive summarization.
+
+Sentences become rows of a sparse sentence-term TF-IDF matrix held as parallel
+NumPy arrays (row, column, weight), so every step is a ``bincount`` over the
+non-zero entries and the cost grows with the length of the book rather than the
+square of its sentence count. Like ``pdf_extraction`` this module does not
+import Django.
+"""
+
+import re
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z'\-]+")
+MIN_SENTENCE_TOKENS = 4
+MAX_SENTENCE_WORDS = 60
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_ITERATIONS = 30
+TEXTRANK_TOLERANCE = 1e-6
+
+
+def build_sentence_term_matrix(sentences, stop_words=frozenset()):
+    """Return ``(rows, columns, weights, token_counts)`` for an L2-normalised TF-IDF matrix."""
+    vocabulary = {}
+    row_ids = []
+    term_ids = []
+    token_counts = np.zeros(len(sentences), dtype=np.int64)
+    for sentence_index, sentence in enumerate(sentences):
+        tokens = [token for token in TOKEN_PATTERN.findall(sentence.lower()) if len(token) > 2 and token not in stop_words]
+        token_counts[sentence_index] = len(tokens)
+        row_ids.extend([sentence_index] * len(tokens))
+        term_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+
+    if not term_ids:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0), token_counts
+
+    # Collapse repeated (sentence, term) pairs into term frequencies.
+    vocabulary_size = len(vocabulary)
+    keys, term_frequencies = np.unique(
+        np.asarray(row_ids, dtype=np.int64) * vocabulary_size + np.asarray(term_ids, dtype=np.int64),
+        return_counts=True,
+    )
+    rows = keys // vocabulary_size
+    columns = keys % vocabulary_size
+
+    sentence_count = len(sentences)
+    document_frequencies = np.bincount(columns, minlength=vocabulary_size)
+    idf = np.log((1 + sentence_count) / (1 + document_frequencies)) + 1.0
+    weights = (1.0 + np.log(term_frequencies)) * idf[columns]
+
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=sentence_count))
+    weights = weights / norms[rows]
+    return rows, columns, weights, token_counts
+
+
+def multiply(rows, columns, weights, vector, sentence_count):
+    """Sentence-term matrix times a term vector."""
+    return np.bincount(rows, weights=weights * vector[columns], minlength=sentence_count)
+
+
+def multiply_transposed(rows, columns, weights, vector, term_count):
+    """Transposed sentence-term matrix times a sentence vector."""
+    return np.bincount(columns, weights=weights * vector[rows], minlength=term_count)
+
+
+def score_by_centrality(rows, columns, weights, sentence_count):
+    """Cosine similarity of every sentence to the centroid of the whole book."""
+    centroid = multiply_transposed(rows, columns, weights, np.ones(sentence_count), columns.max() + 1)
+    return multiply(rows, columns, weights, centroid, sentence_count)
+
+
+def score_by_textrank(rows, columns, weights, sentence_count):
+    """PageRank over the cosine-similarity graph without building the sentence-by-sentence matrix.
+
+    With ``M`` the normalised sentence-term matrix, the similarity graph is ``M @ M.T`` minus its
+    unit diagonal, so each product with it is two sparse passes.
+    """
+    term_count = columns.max() + 1
+    self_similarity = np.bincount(rows, weights=weights * weights, minlength=sentence_count)
+
+    def similarity_times(vector):
+        product = multiply(rows, columns, weights, multiply_transposed(rows, columns, weights, vector, term_count), sentence_count)
+        return product - self_similarity * vector
+
+    out_degree = similarity_times(np.ones(sentence_count))
+    connected = out_degree > 0
+    safe_degree = np.where(connected, out_degree, 1.0)
+
+    ranks = np.full(sentence_count, 1.0 / sentence_count)
+    for _ in range(TEXTRANK_ITERATIONS):
+        # Sentences with no neighbours spread their rank evenly instead of leaking it.
+        dangling = ranks[~connected].sum()
+        updated = (1 - TEXTRANK_DAMPING) / sentence_count + TEXTRANK_DAMPING * (
+            similarity_times(np.where(connected, ranks / safe_degree, 0.0)) + dangling / sentence_count
+        )
+        converged = np.abs(updated - ranks).sum() < TEXTRANK_TOLERANCE
+        ranks = updated
+        if converged:
+            break
+    return ranks
+
+
+def select_diverse_sentences(scores, limit, min_gap):
+    """Pick the best scoring sentences while keeping picks at least ``min_gap`` sentences apart."""
+    selected = []
+    for index in np.argsort(-scores, kind='stable'):
+        if not np.isfinite(scores[index]):
+            break
+        if all(abs(int(index) - chosen) >= min_gap for chosen in selected):
+            selected.append(int(index))
+            if len(selected) == limit:
+                break
+    return sorted(selected)
+
+
+def summarize_sentences(sentences, limit=5, method='textrank', stop_words=frozenset()):
+    """Return the indexes of ``limit`` representative sentences, in reading order."""
+    sentence_count = len(sentences)
+    if sentence_count <= limit:
+        return list(range(sentence_count))
+
+    rows, columns, weights, token_counts = build_sentence_term_matrix(sentences, stop_words)
+    if not len(weights):
+        return list(range(limit))
+
+    if method == 'tfidf':
+        scores = score_by_centrality(rows, columns, weights, sentence_count)
+    else:
+        scores = score_by_textrank(rows, columns, weights, sentence_count)
+
+    word_counts = np.fromiter((len(sentence.split()) for sentence in sentences), dtype=np.int64, count=sentence_count)
+    # Fragments and run-on sentences (often tables of contents or OCR noise) make poor summary lines.
+    usable = (token_counts >= MIN_SENTENCE_TOKENS) & (word_counts <= MAX_SENTENCE_WORDS)
+    if usable.any():
+        scores = np.where(usable, scores, -np.inf)
+
+    # Spread picks across the book so the summary is not drawn from a single chapter.
+    min_gap = max(1, sentence_count // (limit * 2))
+    return select_diverse_sentences(scores, limit, min_gap)
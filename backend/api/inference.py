@@ -0,0 +1,93 @@
+"""CPU inference profile for the local summarization model.
+
+Kept free of Django imports so the benchmark can measure each profile in a
+fresh ``spawn`` process, where peak RSS belongs to that profile alone.
+"""
+
+import sys
+import time
+from contextlib import nullcontext
+from importlib import import_module
+
+QUANTIZATION_MODES = {'none', 'int8'}
+
+
+def build_cpu_inference_profile(threads=0, quantize='none', max_input_tokens=0, inference_mode=True):
+    quantize = (quantize or 'none').strip().lower()
+    if quantize not in QUANTIZATION_MODES:
+        raise ValueError(f'quantize must be one of: {", ".join(sorted(QUANTIZATION_MODES))}.')
+    return {
+        'threads': max(0, int(threads or 0)),
+        'quantize': quantize,
+        'max_input_tokens': max(0, int(max_input_tokens or 0)),
+        'inference_mode': bool(inference_mode),
+    }
+
+
+def apply_cpu_inference_profile(summarizer, torch, profile):
+    """Tune a CPU summarization pipeline in place and return it."""
+    if profile['threads']:
+        torch.set_num_threads(profile['threads'])
+
+    if profile['quantize'] == 'int8':
+        # Dynamic quantization stores Linear weights as int8 and quantizes activations on the fly,
+        # which is where most of a seq2seq model's CPU time goes.
+        summarizer.model = torch.quantization.quantize_dynamic(summarizer.model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    tokenizer = getattr(summarizer, 'tokenizer', None)
+    if profile['max_input_tokens'] and tokenizer is not None:
+        # Inputs are called with truncation=True, so this caps the encoder sequence length.
+        tokenizer.model_max_length = min(tokenizer.model_max_length, profile['max_input_tokens'])
+    return summarizer
+
+
+def inference_context(profile):
+    if not profile.get('inference_mode'):
+        return nullcontext()
+    torch = sys.modules.get('torch')
+    if torch is None or not hasattr(torch, 'inference_mode'):
+        return nullcontext()
+    return torch.inference_mode()
+
+
+def load_cpu_summarizer(model_name, profile):
+    pipeline = import_module('transformers').pipeline
+    torch = import_module('torch')
+    summarizer = pipeline('summarization', model=model_name, device=-1)
+    return apply_cpu_inference_profile(summarizer, torch, profile)
+
+
+def get_peak_rss_mb():
+    """Peak resident memory of this process in MB, or ``None`` where ``resource`` is unavailable (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_profile_benchmark(model_name, profile, texts, max_length, min_length, repeat=1):
+    """Load the model with ``profile`` and summarize ``texts``; meant to run in its own process."""
+    started = time.perf_counter()
+    summarizer = load_cpu_summarizer(model_name, profile)
+    load_seconds = time.perf_counter() - started
+
+    latencies = []
+    outputs = []
+    for _ in range(max(1, repeat)):
+        outputs = []
+        for text in texts:
+            started = time.perf_counter()
+            with inference_context(profile):
+                result = summarizer(text, max_length=max_length, min_length=min_length, truncation=True, do_sample=False)
+            latencies.append(time.perf_counter() - started)
+            outputs.append(result[0]['summary_text'])
+
+    return {
+        'load_seconds': load_seconds,
+        'latencies': latencies,
+        'outputs': outputs,
+        'peak_rss_mb': get_peak_rss_mb(),
+    }
@@ -0,0 +1,525 @@
+"""Database-backed background job queue.
+
+Jobs are rows in ``BackgroundJob``; ``python manage.py run_jobs`` claims and runs
+them. No external broker is required, so the queue works on every database the
+project supports.
+"""
+
+import logging
+import math
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from datetime import time as dt_time, timedelta
+from urllib.parse import urljoin, urlparse
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
+
+from .models import BackgroundJob, Book
+
+logger = logging.getLogger(__name__)
+
+JOB_PAGE_COUNT = 'page_count'
+JOB_EXTRACT_TEXT = 'extract_text'
+JOB_ANALYTICS = 'analytics'
+JOB_AI_SUMMARY_AUDIO = 'ai_summary_audio'
+JOB_FULL_AUDIO = 'full_audio'
+JOB_PREGENERATE_AUDIO = 'pregenerate_audio'
+
+JOB_PRIORITIES = {
+    # Someone is waiting on the result, so it goes ahead of ingestion work.
+    JOB_AI_SUMMARY_AUDIO: 40,
+    JOB_FULL_AUDIO: 35,
+    JOB_PAGE_COUNT: 30,
+    JOB_EXTRACT_TEXT: 20,
+    JOB_ANALYTICS: 10,
+    # Speculative work only runs when nothing else is waiting.
+    JOB_PREGENERATE_AUDIO: 5,
+}
+JOB_RETRY_BASE_DELAY_SECONDS = 30
+# Used when a book's page statistics are not known yet, and for the short narrated summary.
+PREGENERATION_DEFAULT_PAGE_CHARACTERS = 2000
+PREGENERATION_SUMMARY_CHARACTERS = 1000
+
+JOB_HANDLERS = {}
+
+
+def register_job_handler(kind):
+    def decorator(func):
+        JOB_HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+def get_worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def enqueue_job(kind, book=None, payload=None, priority=None, max_attempts=None):
+    """Queue a job unless an identical one is already waiting to run.
+
+    The book row is locked while checking, so concurrent callers for the same book queue one job.
+    """
+    with transaction.atomic():
+        if book is not None:
+            Book.objects.select_for_update().filter(pk=book.pk).exists()
+        existing = BackgroundJob.objects.filter(kind=kind, book=book, status='queued').first()
+        if existing is not None:
+            return existing
+
+        return BackgroundJob.objects.create(
+            kind=kind,
+            book=book,
+            payload=payload or {},
+            priority=JOB_PRIORITIES.get(kind, 0) if priority is None else priority,
+            max_attempts=max_attempts or getattr(settings, 'BACKGROUND_JOB_MAX_ATTEMPTS', 3),
+        )
+
+
+def enqueue_book_ingestion(book):
+    """Queue page counting, text extraction and analytics for a newly saved book."""
+    if not (book.pdf_document or book.pdf_document_url):
+        return []
+    return [enqueue_job(kind, book=book) for kind in (JOB_PAGE_COUNT, JOB_EXTRACT_TEXT, JOB_ANALYTICS)]
+
+
+def enqueue_book_ingestion_on_commit(book):
+    transaction.on_commit(lambda: enqueue_book_ingestion(book))
+
+
+def enqueue_ai_summary_audio_job(book, base_url, force_refresh=False, summary_mode=None):
+    """Start summary and audio generation for ``book``, or attach to the job already working on it.
+
+    Returns ``(job, created)``. The book row is locked for the check and insert, so concurrent
+    callers serialise and only one of them creates a job, even when the book is already ``processing``.
+    """
+    with transaction.atomic():
+        Book.objects.select_for_update().filter(pk=book.pk).exists()
+        Book.objects.filter(pk=book.pk).exclude(ai_processing_status='processing').update(
+            ai_processing_status='processing',
+        )
+        active_job = (
+            BackgroundJob.objects.select_for_update()
+            .filter(kind=JOB_AI_SUMMARY_AUDIO, book=book, status__in=('queued', 'running'))
+            .order_by('id')
+            .first()
+        )
+        if active_job is not None:
+            return active_job, False
+
+        job = BackgroundJob.objects.create(
+            kind=JOB_AI_SUMMARY_AUDIO,
+            book=book,
+            payload={
+                'base_url': base_url,
+                'refresh': force_refresh,
+                'mode': summary_mode,
+            },
+            priority=JOB_PRIORITIES[JOB_AI_SUMMARY_AUDIO],
+            # Failures are recorded on the book for the client to see, so a retry would only repeat them.
+            max_attempts=1,
+        )
+        return job, True
+
+
+def enqueue_full_audio_job(book, base_url, force_refresh=False, user_id=None):
+    """Start narrating the whole of ``book``, or attach to the job already doing it; returns ``(job, created)``."""
+    with transaction.atomic():
+        Book.objects.select_for_update().filter(pk=book.pk).exists()
+        active_job = (
+            BackgroundJob.objects.filter(kind=JOB_FULL_AUDIO, book=book, status__in=('queued', 'running'))
+            .order_by('id')
+            .first()
+        )
+        if active_job is not None:
+            return active_job, False
+
+        job = BackgroundJob.objects.create(
+            kind=JOB_FULL_AUDIO,
+            book=book,
+            payload={
+                'base_url': base_url,
+                'refresh': force_refresh,
+                'user_id': user_id,
+            },
+            priority=JOB_PRIORITIES[JOB_FULL_AUDIO],
+            # Failures are shown to the client, and finished segments stay cached for the next request.
+            max_attempts=1,
+        )
+        return job, True
+
+
+def parse_time_windows(value):
+    """Parse ``"01:00-06:00,22:30-23:30"`` into ``[(start, end), ...]``; a window may wrap past midnight."""
+    windows = []
+    for window in (value or '').split(','):
+        window = window.strip()
+        if not window:
+            continue
+        start_text, separator, end_text = window.partition('-')
+        if not separator:
+            raise ValueError(f'Time window "{window}" must look like HH:MM-HH:MM.')
+        try:
+            start_hour, start_minute = (int(part) for part in start_text.strip().split(':'))
+            end_hour, end_minute = (int(part) for part in end_text.strip().split(':'))
+            windows.append((dt_time(start_hour, start_minute), dt_time(end_hour, end_minute)))
+        except ValueError as exc:
+            raise ValueError(f'Time window "{window}" must look like HH:MM-HH:MM.') from exc
+    return windows
+
+
+def is_within_windows(moment, windows):
+    """True when ``moment`` falls inside any window; no windows means any time is allowed."""
+    if not windows:
+        return True
+    current = moment.time()
+    for start, end in windows:
+        if start <= end and start <= current < end:
+            return True
+        if start > end and (current >= start or current < end):
+            return True
+    return False
+
+
+def rank_popular_books(since, limit):
+    """Books with library activity since ``since``, most distinct readers first, then most recently touched."""
+    return list(
+        Book.objects.filter(library__last_accessed__gte=since)
+        # Only books with a PDF to narrate; ``> ''`` excludes both empty strings and NULLs.
+        .filter(Q(pdf_document__gt='') | Q(pdf_document_url__gt=''))
+        # A reader has one library row per format, so count users rather than rows.
+        .annotate(recent_readers=Count('library__user', distinct=True), last_activity=Max('library__last_accessed'))
+        .order_by('-recent_readers', '-last_activity', 'id')[:limit]
+    )
+
+
+def build_pregeneration_chapter_ranges(total_pages):
+    """The opening page ranges readers start with; none until the page count is known."""
+    chapter_pages = max(1, getattr(settings, 'PREGENERATION_CHAPTER_PAGES', 5))
+    ranges = []
+    for index in range(max(0, getattr(settings, 'PREGENERATION_CHAPTERS', 2))):
+        start_page = index * chapter_pages + 1
+        if start_page > total_pages:
+            break
+        ranges.append([start_page, min(total_pages, start_page + chapter_pages - 1)])
+    return ranges
+
+
+def estimate_pregeneration_characters(book, chapter_ranges, include_summary=True):
+    """Upper bound on the characters sent to TTS; cached pages and segments cost less in practice."""
+    if book.character_count and book.total_pages:
+        page_characters = book.character_count / book.total_pages
+    else:
+        page_characters = PREGENERATION_DEFAULT_PAGE_CHARACTERS
+    pages = sum(end_page - start_page + 1 for start_page, end_page in chapter_ranges)
+    return math.ceil(pages * page_characters) + (PREGENERATION_SUMMARY_CHARACTERS if include_summary else 0)
+
+
+def validate_pregeneration_base_url(base_url):
+    """Jobs store audio links built from this URL, so it must be the absolute address of the site serving media."""
+    parsed_url = urlparse(base_url or '')
+    if parsed_url.scheme not in {'http', 'https'} or not parsed_url.netloc:
+        raise ValueError('PREGENERATION_BASE_URL must be set to the absolute URL of the site that serves /media/.')
+    return base_url
+
+
+def schedule_pregeneration(now=None, base_url=None, ignore_windows=False, dry_run=False):
+    """Queue summary and opening-chapter audio for the most active books.
+
+    Runs only inside ``PREGENERATION_WINDOWS`` and stops at ``PREGENERATION_DAILY_CHARACTER_BUDGET``
+    estimated TTS characters per rolling day. Books with pre-generation queued, running, or completed
+    within ``PREGENERATION_REFRESH_HOURS`` are skipped. Returns ``[(book, estimated_characters), ...]``.
+    Raises ``ValueError`` unless ``base_url`` (default ``PREGENERATION_BASE_URL``) is absolute.
+    """
+    if base_url is None:
+        base_url = getattr(settings, 'PREGENERATION_BASE_URL', '')
+    if not dry_run:
+        validate_pregeneration_base_url(base_url)
+
+    now = now or timezone.now()
+    windows = parse_time_windows(getattr(settings, 'PREGENERATION_WINDOWS', ''))
+    if not ignore_windows and not is_within_windows(timezone.localtime(now), windows):
+        return []
+
+    recent_jobs = BackgroundJob.objects.filter(kind=JOB_PREGENERATE_AUDIO, created_at__gte=now - timedelta(days=1))
+    remaining_budget = getattr(settings, 'PREGENERATION_DAILY_CHARACTER_BUDGET', 500000) - sum(
+        job.payload.get('estimated_characters', 0) for job in recent_jobs.only('payload')
+    )
+    refresh_after = now - timedelta(hours=getattr(settings, 'PREGENERATION_REFRESH_HOURS', 24))
+    skipped_book_ids = set(
+        BackgroundJob.objects.filter(kind=JOB_PREGENERATE_AUDIO)
+        .filter(Q(status__in=('queued', 'running')) | Q(status='completed', finished_at__gte=refresh_after))
+        .values_list('book_id', flat=True)
+    )
+
+    scheduled = []
+    candidates = rank_popular_books(
+        now - timedelta(days=getattr(settings, 'PREGENERATION_ACTIVITY_DAYS', 7)),
+        getattr(settings, 'PREGENERATION_MAX_BOOKS', 20),
+    )
+    for book in candidates:
+        if book.id in skipped_book_ids:
+            continue
+        chapter_ranges = build_pregeneration_chapter_ranges(book.total_pages)
+        estimate = estimate_pregeneration_characters(book, chapter_ranges)
+        if estimate > remaining_budget:
+            # A smaller book further down may still fit.
+            continue
+        remaining_budget -= estimate
+        if not dry_run:
+            enqueue_job(JOB_PREGENERATE_AUDIO, book=book, payload={
+                'base_url': base_url,
+                'summary': True,
+                'chapters': chapter_ranges,
+                'estimated_characters': estimate,
+            })
+        scheduled.append((book, estimate))
+    return scheduled
+
+
+def get_retry_delay(attempts):
+    return timedelta(seconds=JOB_RETRY_BASE_DELAY_SECONDS * (2 ** max(0, attempts - 1)))
+
+
+def claim_next_job(worker_id=None, kinds=None):
+    """Atomically move the next runnable job to ``running`` and return it, or ``None``."""
+    worker_id = worker_id or get_worker_id()
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=getattr(settings, 'BACKGROUND_JOB_LOCK_TIMEOUT', 1800))
+    stale = Q(status='running', locked_at__lt=stale_before)
+
+    # A job whose worker died mid-run already spent an attempt; stop reclaiming it once they run out.
+    BackgroundJob.objects.filter(stale, attempts__gte=F('max_attempts')).update(
+        status='failed',
+        last_error='Worker stopped before the job finished.',
+        locked_by='',
+        locked_at=None,
+        finished_at=now,
+        updated_at=now,
+    )
+    runnable = Q(status='queued', run_after__lte=now) | (stale & Q(attempts__lt=F('max_attempts')))
+
+    candidates = BackgroundJob.objects.filter(runnable)
+    if kinds:
+        candidates = candidates.filter(kind__in=kinds)
+    candidate_ids = list(candidates.order_by('-priority', 'run_after', 'id').values_list('id', flat=True)[:10])
+
+    for job_id in candidate_ids:
+        # The conditional update is the lock: only one worker can flip a given row to running.
+        # Counting the attempt here means it sticks even if the worker is killed before the handler returns.
+        claimed = BackgroundJob.objects.filter(runnable, id=job_id).update(
+            status='running',
+            attempts=F('attempts') + 1,
+            locked_by=worker_id,
+            locked_at=now,
+            updated_at=now,
+        )
+        if claimed:
+            return BackgroundJob.objects.select_related('book').get(id=job_id)
+    return None
+
+
+@contextmanager
+def job_lock_heartbeat(job):
+    """Refresh ``locked_at`` while ``job`` runs, so a long handler is not mistaken for a dead worker."""
+    interval = max(1, getattr(settings, 'BACKGROUND_JOB_LOCK_TIMEOUT', 1800) / 3)
+    stop_event = threading.Event()
+
+    def beat():
+        try:
+            while not stop_event.wait(interval):
+                BackgroundJob.objects.filter(id=job.id, status='running', locked_by=job.locked_by).update(
+                    locked_at=timezone.now(),
+                )
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f'job-heartbeat-{job.id}', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop_event.set()
+        thread.join()
+
+
+def run_job(job):
+    """Run a job returned by ``claim_next_job``, which has already counted this attempt."""
+    handler = JOB_HANDLERS.get(job.kind)
+    try:
+        if handler is None:
+            raise RuntimeError(f'No handler registered for job kind "{job.kind}".')
+        with job_lock_heartbeat(job):
+            result = handler(job) or {}
+    except Exception as exc:
+        logger.error(f'Background job {job.kind} #{job.id} failed: {str(exc)}')
+        job.last_error = str(exc)
+        job.locked_by = ''
+        job.locked_at = None
+        if job.attempts < job.max_attempts:
+            job.status = 'queued'
+            job.run_after = timezone.now() + get_retry_delay(job.attempts)
+        else:
+            job.status = 'failed'
+            job.finished_at = timezone.now()
+        job.save()
+        return job
+
+    job.status = 'completed'
+    job.result = result
+    job.last_error = ''
+    job.locked_by = ''
+    job.locked_at = None
+    job.finished_at = timezone.now()
+    job.save()
+    return job
+
+
+def run_pending_jobs(max_jobs=None, worker_id=None, kinds=None):
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        job = claim_next_job(worker_id=worker_id, kinds=kinds)
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
+
+
+@register_job_handler(JOB_PAGE_COUNT)
+def handle_page_count(job):
+    from .views import PDFProcessor, get_book_pdf_source
+
+    book = job.book
+    pdf_source = get_book_pdf_source(book)
+    if not pdf_source:
+        raise ValueError('No PDF available for this book.')
+
+    page_count = PDFProcessor.get_page_count(pdf_source)
+    if page_count and page_count != book.total_pages:
+        book.total_pages = page_count
+        book.save(update_fields=['total_pages'])
+    return {'page_count': page_count}
+
+
+@register_job_handler(JOB_EXTRACT_TEXT)
+def handle_extract_text(job):
+    from .views import PDFProcessor, get_book_pdf_source
+
+    pdf_source = get_book_pdf_source(job.book)
+    if not pdf_source:
+        raise ValueError('No PDF available for this book.')
+
+    # Filling the page text store also builds the page offset index.
+    extraction = PDFProcessor.extract_text_from_page_range(pdf_source)
+    return {
+        'page_count': extraction['page_count'],
+        'word_count': extraction['word_count'],
+        'character_count': extraction['character_count'],
+    }
+
+
+@register_job_handler(JOB_ANALYTICS)
+def handle_analytics(job):
+    from .views import PDFProcessor, apply_book_analytics, get_book_pdf_source
+
+    book = job.book
+    pdf_source = get_book_pdf_source(book)
+    if not pdf_source:
+        raise ValueError('No PDF available for this book.')
+
+    analytics = PDFProcessor.analyze_page_range(pdf_source)
+    if not analytics['word_count']:
+        raise ValueError('No readable text found in PDF.')
+    apply_book_analytics(book, analytics)
+    return {key: analytics[key] for key in ('page_count', 'word_count', 'character_count')}
+
+
+@register_job_handler(JOB_AI_SUMMARY_AUDIO)
+def handle_ai_summary_audio(job):
+    from .views import generate_ai_summary_audio
+
+    book = job.book
+    base_url = job.payload.get('base_url') or '/'
+    try:
+        payload, status_code = generate_ai_summary_audio(
+            book,
+            lambda path: urljoin(base_url, path),
+            force_refresh=job.payload.get('refresh', False),
+            summary_mode=job.payload.get('mode'),
+        )
+    except Exception:
+        # Never leave the book stuck in processing, or later requests would attach to a dead job.
+        Book.objects.filter(pk=book.pk).update(ai_processing_status='failed')
+        raise
+    if status_code >= 400:
+        raise RuntimeError(payload.get('detail') or 'Unable to generate the AI summary.')
+    return payload
+
+
+@register_job_handler(JOB_PREGENERATE_AUDIO)
+def handle_pregenerate_audio(job):
+    from .views import (
+        AudioCache,
+        build_media_path,
+        build_summary_audio_filename,
+        generate_ai_summary_audio,
+        generate_chapter_audio,
+        synthesize_cached_audio,
+    )
+
+    book = job.book
+    base_url = validate_pregeneration_base_url(job.payload.get('base_url'))
+    result = {'summary': None, 'chapters': []}
+
+    if job.payload.get('summary'):
+        if book.ai_summary and book.ai_processing_status == 'completed':
+            # The summary is kept on the book, but its audio may have been evicted since.
+            filename = build_summary_audio_filename(book, book.ai_summary)
+            if AudioCache.lookup(filename):
+                result['summary'] = 'cached'
+            else:
+                audio_error, _, _ = synthesize_cached_audio(book.ai_summary, filename)
+                if audio_error:
+                    raise RuntimeError(audio_error)
+                Book.objects.filter(pk=book.pk).update(
+                    ai_summary_audio_url=urljoin(base_url, build_media_path('audio', AudioCache.get_relative_path(filename))),
+                )
+                result['summary'] = 'generated'
+        elif book.ai_processing_status == 'processing':
+            # A reader's summary job is already on it.
+            result['summary'] = 'in_progress'
+        else:
+            payload, status_code = generate_ai_summary_audio(book, lambda path: urljoin(base_url, path))
+            if status_code >= 400:
+                raise RuntimeError(payload.get('detail') or 'Unable to generate the AI summary.')
+            result['summary'] = 'generated'
+
+    for start_page, end_page in job.payload.get('chapters', []):
+        payload, status_code = generate_chapter_audio(book, start_page, end_page, lambda path: urljoin(base_url, path))
+        if status_code >= 400:
+            raise RuntimeError(payload.get('detail') or f'Unable to generate audio for pages {start_page}-{end_page}.')
+        result['chapters'].append({'start_page': start_page, 'end_page': end_page, 'cached': payload['cached']})
+    return result
+
+
+@register_job_handler(JOB_FULL_AUDIO)
+def handle_full_audio(job):
+    from .views import generate_full_audio, record_audio_library_entry
+
+    book = job.book
+    base_url = job.payload.get('base_url') or '/'
+    payload, status_code = generate_full_audio(
+        book,
+        lambda path: urljoin(base_url, path),
+        force_refresh=job.payload.get('refresh', False),
+    )
+    if status_code >= 400:
+        raise RuntimeError(payload.get('detail') or 'Unable to generate full audio.')
+    if job.payload.get('user_id') and not payload['cached']:
+        record_audio_library_entry(job.payload['user_id'], book, payload['estimated_duration_minutes'])
+    return payload
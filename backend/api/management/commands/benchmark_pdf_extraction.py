@@ -0,0 +1,69 @@
+import os
+import tempfile
+import time
+from importlib import import_module
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.pdf_extraction import extract_page_shard, extract_pages_parallel, get_default_worker_count
+
+
+class Command(BaseCommand):
+    help = 'Compare serial and process-pool PDF text extraction on a synthetic PDF.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, default=1000, help='Number of pages in the synthetic PDF.')
+        parser.add_argument('--workers', type=int, default=0, help='Process pool size (defaults to the CPU count).')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per mode; the best time is reported.')
+
+    def build_synthetic_pdf(self, path, page_count):
+        fitz = import_module('fitz')
+        doc = fitz.open()
+        paragraph = (
+            'The lighthouse keeper counted the ships that passed each evening and wrote their names '
+            'in a ledger that nobody else ever read. '
+        ) * 6
+        for page_number in range(1, page_count + 1):
+            page = doc.new_page()
+            page.insert_textbox(fitz.Rect(54, 54, 558, 738), f'Page {page_number}. {paragraph}', fontsize=10)
+        doc.save(path)
+        doc.close()
+
+    def time_best(self, repeat, func):
+        best = None
+        result = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def handle(self, *args, **options):
+        try:
+            import_module('fitz')
+        except ModuleNotFoundError as exc:
+            raise CommandError('PyMuPDF is required for this benchmark.') from exc
+
+        page_count = options['pages']
+        workers = options['workers'] or get_default_worker_count()
+        repeat = max(1, options['repeat'])
+        page_numbers = list(range(1, page_count + 1))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, 'synthetic.pdf')
+            self.build_synthetic_pdf(pdf_path, page_count)
+
+            serial_time, serial_pages = self.time_best(repeat, lambda: dict(extract_page_shard(pdf_path, page_numbers)))
+            parallel_time, parallel_pages = self.time_best(
+                repeat,
+                lambda: extract_pages_parallel(pdf_path, page_numbers, workers),
+            )
+
+        if serial_pages != parallel_pages:
+            raise CommandError('Parallel extraction returned different text than the serial path.')
+
+        self.stdout.write(f'Pages: {page_count}, workers: {workers}, best of {repeat}')
+        self.stdout.write(f'Serial:   {serial_time:.3f}s ({page_count / serial_time:.0f} pages/s)')
+        self.stdout.write(f'Parallel: {parallel_time:.3f}s ({page_count / parallel_time:.0f} pages/s)')
+        self.stdout.write(f'Speedup:  {serial_time / parallel_time:.2f}x')
@@ -0,0 +1,80 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.views import (
+    OptionalDependencyError,
+    SummarizationBatcher,
+    SummarizerModelRegistry,
+    get_summarizer_model_name,
+)
+
+
+class Command(BaseCommand):
+    help = 'Compare sequential and micro-batched transformer summarization throughput on synthetic chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', default='', help='Summarization model (defaults to SUMMARIZER_MODEL).')
+        parser.add_argument('--requests', type=int, default=4, help='Concurrent summary requests to simulate.')
+        parser.add_argument('--chunks', type=int, default=3, help='Chunks summarized by each request.')
+        parser.add_argument('--batch-size', type=int, default=0, help='Batch size (defaults to SUMMARIZER_BATCH_SIZE).')
+        parser.add_argument('--wait-ms', type=int, default=0, help='Batching window (defaults to SUMMARIZER_BATCH_WAIT_MS).')
+        parser.add_argument('--max-length', type=int, default=150)
+        parser.add_argument('--min-length', type=int, default=50)
+
+    def build_chunks(self, count):
+        sentence = (
+            'The lighthouse keeper counted the ships that passed each evening and wrote their names '
+            'in a ledger that nobody else ever read. '
+        )
+        # Vary the length a little so batches need real padding.
+        return [f'Chapter {index + 1}. ' + sentence * (14 + index % 7) for index in range(count)]
+
+    def handle(self, *args, **options):
+        model_name = options['model'] or get_summarizer_model_name()
+        request_count = max(1, options['requests'])
+        chunks_per_request = max(1, options['chunks'])
+        batch_size = options['batch_size'] or getattr(settings, 'SUMMARIZER_BATCH_SIZE', 8)
+        wait_ms = options['wait_ms'] or getattr(settings, 'SUMMARIZER_BATCH_WAIT_MS', 25)
+        max_length = options['max_length']
+        min_length = options['min_length']
+
+        try:
+            summarizer = SummarizerModelRegistry.get(model_name)
+        except OptionalDependencyError as exc:
+            raise CommandError(str(exc)) from exc
+
+        requests = [self.build_chunks(chunks_per_request) for _ in range(request_count)]
+        total_chunks = request_count * chunks_per_request
+
+        # Warm up once so neither mode pays for lazy initialization.
+        summarizer(requests[0][0], max_length=max_length, min_length=min_length, do_sample=False)
+
+        def run_sequential(chunks):
+            return [
+                summarizer(chunk, max_length=max_length, min_length=min_length, do_sample=False)[0]['summary_text']
+                for chunk in chunks
+            ]
+
+        batcher = SummarizationBatcher(model_name, max(1, batch_size), wait_ms / 1000)
+
+        def run_batched(chunks):
+            futures = [batcher.submit(chunk, max_length, min_length) for chunk in chunks]
+            return [future.result() for future in futures]
+
+        results = {}
+        for label, runner in (('Sequential', run_sequential), ('Batched', run_batched)):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=request_count) as executor:
+                list(executor.map(runner, requests))
+            results[label] = time.perf_counter() - started
+
+        self.stdout.write(
+            f'Model: {model_name}, requests: {request_count}, chunks/request: {chunks_per_request}, '
+            f'batch size: {batch_size}, window: {wait_ms}ms'
+        )
+        for label, elapsed in results.items():
+            self.stdout.write(f'{label + ":":<11} {elapsed:.2f}s ({total_chunks / elapsed:.2f} chunks/s)')
+        self.stdout.write(f'Speedup:    {results["Sequential"] / results["Batched"]:.2f}x')
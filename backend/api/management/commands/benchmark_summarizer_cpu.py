@@ -0,0 +1,119 @@
+import multiprocessing
+import re
+import statistics
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.inference import build_cpu_inference_profile, run_profile_benchmark
+from api.views import get_summarizer_model_name
+
+
+def unigram_f1(reference, candidate):
+    """ROUGE-1 style overlap between two summaries, from 0 to 1."""
+    reference_counts = Counter(re.findall(r'\w+', reference.lower()))
+    candidate_counts = Counter(re.findall(r'\w+', candidate.lower()))
+    overlap = sum((reference_counts & candidate_counts).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(candidate_counts.values())
+    recall = overlap / sum(reference_counts.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+class Command(BaseCommand):
+    help = 'Compare the default CPU summarizer with a tuned inference profile: latency, peak RSS and output similarity.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', default='', help='Summarization model (defaults to SUMMARIZER_MODEL).')
+        parser.add_argument('--chunks', type=int, default=4, help='Synthetic chunks to summarize.')
+        parser.add_argument('--repeat', type=int, default=2, help='Passes over the chunks per profile.')
+        parser.add_argument('--threads', type=int, default=None, help='torch threads (defaults to SUMMARIZER_TORCH_THREADS).')
+        parser.add_argument('--quantize', default=None, help='none or int8 (defaults to SUMMARIZER_QUANTIZE).')
+        parser.add_argument(
+            '--max-input-tokens',
+            type=int,
+            default=None,
+            help='Encoder input cap (defaults to SUMMARIZER_MAX_INPUT_TOKENS).',
+        )
+        parser.add_argument('--max-length', type=int, default=150)
+        parser.add_argument('--min-length', type=int, default=50)
+
+    def build_chunks(self, count):
+        paragraph = (
+            'The lighthouse keeper counted the ships that passed each evening and wrote their names in a ledger '
+            'that nobody else ever read. When the storm season came he kept the lamp burning through the night, '
+            'and in the morning he walked the shore looking for anything the sea had returned. '
+        )
+        return [f'Chapter {index + 1}. ' + paragraph * (6 + index % 4) for index in range(count)]
+
+    def run_in_fresh_process(self, model_name, profile, texts, options):
+        # A separate spawn process per profile keeps torch state and peak RSS from leaking between runs.
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            return executor.submit(
+                run_profile_benchmark,
+                model_name,
+                profile,
+                texts,
+                options['max_length'],
+                options['min_length'],
+                options['repeat'],
+            ).result()
+
+    def handle(self, *args, **options):
+        for package in ('transformers', 'torch'):
+            if find_spec(package) is None:
+                raise CommandError(f'{package} is required for this benchmark.')
+
+        model_name = options['model'] or get_summarizer_model_name()
+        try:
+            tuned_profile = build_cpu_inference_profile(
+                threads=options['threads'] if options['threads'] is not None else getattr(settings, 'SUMMARIZER_TORCH_THREADS', 0),
+                quantize=options['quantize'] or getattr(settings, 'SUMMARIZER_QUANTIZE', 'none'),
+                max_input_tokens=(
+                    options['max_input_tokens']
+                    if options['max_input_tokens'] is not None
+                    else getattr(settings, 'SUMMARIZER_MAX_INPUT_TOKENS', 0)
+                ),
+                inference_mode=True,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        baseline_profile = build_cpu_inference_profile(inference_mode=False)
+        texts = self.build_chunks(max(1, options['chunks']))
+
+        results = {
+            'Baseline': self.run_in_fresh_process(model_name, baseline_profile, texts, options),
+            'Tuned': self.run_in_fresh_process(model_name, tuned_profile, texts, options),
+        }
+
+        self.stdout.write(f'Model: {model_name}, chunks: {len(texts)}, passes: {options["repeat"]}')
+        self.stdout.write(
+            f'Tuned profile: threads={tuned_profile["threads"] or "default"}, quantize={tuned_profile["quantize"]}, '
+            f'max_input_tokens={tuned_profile["max_input_tokens"] or "model default"}, inference_mode=on'
+        )
+        for label, result in results.items():
+            latencies = sorted(result['latencies'])
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            peak_rss = 'n/a' if result['peak_rss_mb'] is None else f'{result["peak_rss_mb"]:.0f} MB'
+            self.stdout.write(
+                f'{label + ":":<10} load {result["load_seconds"]:.1f}s, '
+                f'p50 {statistics.median(latencies) * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms, '
+                f'peak RSS {peak_rss}'
+            )
+
+        similarities = [
+            unigram_f1(reference, candidate)
+            for reference, candidate in zip(results['Baseline']['outputs'], results['Tuned']['outputs'])
+        ]
+        identical = sum(
+            reference == candidate
+            for reference, candidate in zip(results['Baseline']['outputs'], results['Tuned']['outputs'])
+        )
+        self.stdout.write(
+            f'Output similarity: mean unigram F1 {statistics.mean(similarities):.3f}, '
+            f'identical {identical}/{len(similarities)}'
+        )
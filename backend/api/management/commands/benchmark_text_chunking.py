@@ -0,0 +1,74 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from api.text_spans import iter_chunk_spans
+from api.views import AIProcessor, select_balanced_chunk_indexes
+
+
+def chunk_words(text, max_chunk_size):
+    """The previous word-list chunker, kept here as the baseline."""
+    words = text.split()
+    chunks = []
+    current_chunk = []
+    current_size = 0
+    for word in words:
+        word_size = len(word) + 1
+        if current_size + word_size > max_chunk_size and current_chunk:
+            chunks.append(' '.join(current_chunk))
+            current_chunk = [word]
+            current_size = word_size
+        else:
+            current_chunk.append(word)
+            current_size += word_size
+    if current_chunk:
+        chunks.append(' '.join(current_chunk))
+    return chunks
+
+
+class Command(BaseCommand):
+    help = 'Compare peak memory and time of the word-list chunker and the span chunker on a synthetic book.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--words', type=int, default=200000, help='Words in the synthetic book.')
+        parser.add_argument('--chunk-chars', type=int, default=3000)
+        parser.add_argument('--samples', type=int, default=7, help='Chunks sampled, as build_summary_source_text does.')
+
+    def build_text(self, word_count):
+        sentence = 'The keeper wrote the names of the passing ships in a ledger that nobody read.'
+        words_per_sentence = len(sentence.split())
+        return ' '.join([sentence] * max(1, word_count // words_per_sentence))
+
+    def measure(self, func):
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak, result
+
+    def handle(self, *args, **options):
+        text = self.build_text(options['words'])
+        chunk_chars = options['chunk_chars']
+        samples = options['samples']
+
+        def sample_with_words():
+            chunks = chunk_words(text, chunk_chars)
+            return [chunks[index] for index in select_balanced_chunk_indexes(len(chunks), samples)]
+
+        def sample_with_spans():
+            spans = list(iter_chunk_spans(text, max_chars=chunk_chars))
+            return [text[spans[index][0]:spans[index][1]] for index in select_balanced_chunk_indexes(len(spans), samples)]
+
+        self.stdout.write(f'Text: {len(text):,} characters, {options["words"]:,} words, chunks of {chunk_chars} chars')
+        for label, func in (('Word lists', sample_with_words), ('Spans', sample_with_spans)):
+            elapsed, peak, _ = self.measure(func)
+            self.stdout.write(f'{label + ":":<12} sample {samples} chunks in {elapsed * 1000:.0f}ms, peak {peak / (1024 * 1024):.1f} MB')
+
+        elapsed, peak, (source_text, _) = self.measure(lambda: AIProcessor.build_summary_source_text(text))
+        self.stdout.write(
+            f'build_summary_source_text: {len(source_text):,} characters sampled in {elapsed * 1000:.0f}ms, '
+            f'peak {peak / (1024 * 1024):.1f} MB (includes the normalized copy of the text)'
+        )
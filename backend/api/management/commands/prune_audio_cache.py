@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from api.views import AudioCache
+
+
+class Command(BaseCommand):
+    help = 'Delete audio for superseded book versions and evict least recently used audio past the byte budget.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-bytes',
+            type=int,
+            default=None,
+            help='Byte budget for cached audio (defaults to AUDIO_CACHE_MAX_BYTES; 0 keeps everything current).',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be removed without deleting.')
+
+    def handle(self, *args, **options):
+        result = AudioCache.sweep(max_bytes=options['max_bytes'], dry_run=options['dry_run'])
+        prefix = 'Would remove' if options['dry_run'] else 'Removed'
+        self.stdout.write(
+            f'{prefix} {result["stale_deleted"]} superseded and {result["evicted"]} least recently used '
+            f'of {result["files"]} audio files.'
+        )
+        self.stdout.write(
+            f'Cache size: {result["bytes_before"] / (1024 * 1024):.1f} MB -> {result["bytes_after"] / (1024 * 1024):.1f} MB'
+        )
+        stats = AudioCache.stats()
+        self.stdout.write(
+            f'Counters: {stats["evictions"]} evictions, {stats["stale_deletions"]} superseded deletions '
+            f'(this process; request hits and misses are counted by the serving workers).'
+        )
@@ -0,0 +1,108 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from api.jobs import get_worker_id, run_pending_jobs, schedule_pregeneration, validate_pregeneration_base_url
+
+
+class Command(BaseCommand):
+    help = 'Process queued background jobs (text extraction, analytics, page counts, AI summaries, audio).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit.')
+        parser.add_argument('--max-jobs', type=int, default=None, help='Stop after processing this many jobs.')
+        parser.add_argument('--sleep', type=float, default=5.0, help='Seconds to wait when the queue is empty.')
+        parser.add_argument('--kind', action='append', dest='kinds', help='Only run jobs of this kind (repeatable).')
+        parser.add_argument('--worker-id', default=None, help='Identifier recorded on claimed jobs.')
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=1,
+            help='Jobs to run at once. Summary and audio jobs mostly wait on network calls, so threads overlap well.',
+        )
+        parser.add_argument(
+            '--pregenerate-every',
+            type=float,
+            default=0,
+            help='Seconds between pre-generation scheduling passes (0 disables; passes only queue work off-peak).',
+        )
+
+    def run_scheduler(self, interval, stop_event):
+        try:
+            while not stop_event.is_set():
+                try:
+                    scheduled = schedule_pregeneration()
+                    if scheduled:
+                        self.stdout.write(f'Queued audio pre-generation for {len(scheduled)} book(s).')
+                except Exception as exc:
+                    self.stderr.write(f'Pre-generation scheduling failed: {str(exc)}')
+                stop_event.wait(interval)
+        finally:
+            connections.close_all()
+
+    def run_worker(self, worker_id, options, counter):
+        try:
+            while True:
+                with counter['lock']:
+                    max_jobs = options['max_jobs']
+                    if max_jobs is not None and counter['claimed'] >= max_jobs:
+                        break
+                    counter['claimed'] += 1
+                batch = run_pending_jobs(max_jobs=1, worker_id=worker_id, kinds=options['kinds'])
+                with counter['lock']:
+                    # Give the reserved slot back when there was nothing to run.
+                    if batch == 0:
+                        counter['claimed'] -= 1
+                    counter['processed'] += batch
+                if batch == 0:
+                    if options['once']:
+                        break
+                    time.sleep(options['sleep'])
+        finally:
+            connections.close_all()
+
+    def handle(self, *args, **options):
+        pregenerate_every = options['pregenerate_every']
+        if pregenerate_every > 0:
+            try:
+                validate_pregeneration_base_url(getattr(settings, 'PREGENERATION_BASE_URL', ''))
+            except ValueError as exc:
+                # Queued jobs still need a worker, so only the scheduler waits for the setting.
+                self.stderr.write(f'Skipping audio pre-generation: {str(exc)}')
+                pregenerate_every = 0
+
+        worker_id = options['worker_id'] or get_worker_id()
+        concurrency = max(1, options['concurrency'])
+        counter = {'lock': threading.Lock(), 'claimed': 0, 'processed': 0}
+        self.stdout.write(f'Job worker {worker_id} started with {concurrency} thread(s).')
+
+        stop_scheduler = threading.Event()
+        if pregenerate_every > 0:
+            threading.Thread(
+                target=self.run_scheduler,
+                args=(pregenerate_every, stop_scheduler),
+                name='pregeneration-scheduler',
+                daemon=True,
+            ).start()
+
+        if concurrency == 1:
+            self.run_worker(worker_id, options, counter)
+        else:
+            threads = [
+                threading.Thread(
+                    target=self.run_worker,
+                    args=(f'{worker_id}:{index}', options, counter),
+                    name=f'job-worker-{index}',
+                )
+                for index in range(concurrency)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        stop_scheduler.set()
+
+        self.stdout.write(f'Job worker {worker_id} processed {counter["processed"]} job(s).')
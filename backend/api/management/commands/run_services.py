@@ -0,0 +1,88 @@
+import shlex
+import signal
+import subprocess
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_WEB_COMMAND = 'gunicorn backend.wsgi:application'
+DEFAULT_WORKER_COMMAND = f'{sys.executable} manage.py run_jobs'
+
+
+class Command(BaseCommand):
+    help = (
+        'Run the web server and the job worker side by side, restarting the worker when it exits. '
+        'Exits non-zero when either keeps failing, so the platform restarts the whole service.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--web', default=DEFAULT_WEB_COMMAND, help='Web server command line.')
+        parser.add_argument('--worker', default=DEFAULT_WORKER_COMMAND, help='Job worker command line.')
+        parser.add_argument(
+            '--max-restarts',
+            type=int,
+            default=5,
+            help='Worker restarts allowed within --restart-window before the whole service fails.',
+        )
+        parser.add_argument('--restart-window', type=float, default=600.0, help='Seconds over which restarts are counted.')
+        parser.add_argument('--poll', type=float, default=1.0, help='Seconds between checks on both processes.')
+
+    def start(self, label, command):
+        self.stdout.write(f'Starting {label}: {shlex.join(command)}')
+        return subprocess.Popen(command)
+
+    @staticmethod
+    def stop(processes, timeout=30):
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in processes:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def handle(self, *args, **options):
+        web_command = shlex.split(options['web'])
+        worker_command = shlex.split(options['worker'])
+        if not web_command or not worker_command:
+            raise CommandError('Both --web and --worker need a command.')
+
+        stopping = []
+
+        def request_stop(signum, frame):
+            stopping.append(signum)
+
+        previous_handlers = {signum: signal.signal(signum, request_stop) for signum in (signal.SIGTERM, signal.SIGINT)}
+
+        web = self.start('web server', web_command)
+        worker = self.start('job worker', worker_command)
+        restarts = []
+        try:
+            while not stopping:
+                time.sleep(options['poll'])
+                if web.poll() is not None:
+                    raise CommandError(f'Web server exited with status {web.returncode}.')
+                if worker.poll() is None:
+                    continue
+
+                now = time.monotonic()
+                restarts = [started for started in restarts if now - started < options['restart_window']]
+                if len(restarts) >= options['max_restarts']:
+                    # Failing loudly lets the platform restart the service and surface the crash.
+                    raise CommandError(
+                        f'Job worker exited with status {worker.returncode} '
+                        f'{len(restarts) + 1} times in {options["restart_window"]:.0f}s; giving up.'
+                    )
+                self.stderr.write(f'Job worker exited with status {worker.returncode}; restarting.')
+                # Back off a little more on each restart inside the window.
+                time.sleep(min(30, 2 ** len(restarts)))
+                restarts.append(time.monotonic())
+                worker = self.start('job worker', worker_command)
+        finally:
+            self.stop([web, worker])
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.jobs import schedule_pregeneration
+
+
+class Command(BaseCommand):
+    help = 'Queue summary and opening-chapter audio for the books with the most recent library activity.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default=None, help='Site URL for stored audio links (defaults to PREGENERATION_BASE_URL).')
+        parser.add_argument('--ignore-windows', action='store_true', help='Run outside PREGENERATION_WINDOWS.')
+        parser.add_argument('--dry-run', action='store_true', help='Show what would be queued without queueing it.')
+
+    def handle(self, *args, **options):
+        try:
+            scheduled = schedule_pregeneration(
+                base_url=options['base_url'],
+                ignore_windows=options['ignore_windows'],
+                dry_run=options['dry_run'],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        prefix = 'Would queue' if options['dry_run'] else 'Queued'
+        for book, estimate in scheduled:
+            self.stdout.write(f'{prefix} book {book.id} ({book.title}): ~{estimate:,} TTS characters')
+        self.stdout.write(
+            f'{prefix} pre-generation for {len(scheduled)} book(s), '
+            f'~{sum(estimate for _, estimate in scheduled):,} TTS characters.'
+        )
@@ -0,0 +1,37 @@
+# Generated by Django 4.2 on 2026-10-18 10:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_book_ai_processing_status_book_ai_summary_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PdfTextDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(help_text='SHA-256 of the PDF bytes', max_length=64, unique=True)),
+                ('page_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PdfPageText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('page_number', models.PositiveIntegerField()),
+                ('text', models.BinaryField(help_text='zlib-compressed UTF-8 page text')),
+                ('character_count', models.PositiveIntegerField(default=0)),
+                ('word_count', models.PositiveIntegerField(default=0)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pages', to='api.pdftextdocument')),
+            ],
+            options={
+                'unique_together': {('document', 'page_number')},
+            },
+        ),
+    ]
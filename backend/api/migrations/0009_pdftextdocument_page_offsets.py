@@ -0,0 +1,23 @@
+# Generated by Django 4.2 on 2026-10-18 10:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_pdf_text_store'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pdftextdocument',
+            name='char_offsets',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='pdftextdocument',
+            name='word_offsets',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseU
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.conf import settings
+from django.utils import timezone
 
 # Create your models here.
 
@@ -119,3 +120,69 @@ class Library(models.Model):
 
     class Meta:
         unique_together = ('user', 'book', 'type')
+
+class PdfTextDocument(models.Model):
+    content_hash = models.CharField(max_length=64, unique=True, help_text="SHA-256 of the PDF bytes")
+    page_count = models.PositiveIntegerField(default=0)
+    # Starting offsets of every page in the joined book text, plus the total as the last entry.
+    char_offsets = models.JSONField(default=list, blank=True)
+    word_offsets = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'{self.content_hash[:12]} ({self.page_count} pages)'
+
+class PdfPageText(models.Model):
+    document = models.ForeignKey(PdfTextDocument, related_name='pages', on_delete=models.CASCADE)
+    page_number = models.PositiveIntegerField()
+    text = models.BinaryField(help_text="zlib-compressed UTF-8 page text")
+    character_count = models.PositiveIntegerField(default=0)
+    word_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('document', 'page_number')
+
+class BackgroundJob(models.Model):
+    STATUS_CHOICES = (
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    )
+    kind = models.CharField(max_length=50)
+    book = models.ForeignKey('Book', related_name='background_jobs', on_delete=models.CASCADE, null=True, blank=True)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    priority = models.IntegerField(default=0, help_text="Higher priority jobs run first")
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=255, blank=True)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    result = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'priority', 'run_after']),
+            models.Index(fields=['book', 'kind', 'status']),
+        ]
+
+    def __str__(self):
+        return f'{self.kind} #{self.id} ({self.status})'
+
+class SummaryCacheEntry(models.Model):
+    cache_key = models.CharField(max_length=64, unique=True, help_text="SHA-256 of provider, model, prompt version and source text")
+    provider = models.CharField(max_length=50)
+    model = models.CharField(max_length=255, blank=True)
+    summary = models.TextField()
+    source_is_sampled = models.BooleanField(default=False)
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f'{self.provider} summary {self.cache_key[:12]}'
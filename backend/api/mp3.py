@@ -0,0 +1,195 @@
+"""Minimal MPEG audio Layer III frame handling for joining TTS segments.
+
+Joining MP3 files byte for byte leaves an ID3 tag and a Xing/Info header in
+the middle of the stream, which makes players misreport the duration or stop
+early. ``MP3Concatenator`` copies only the audio frames of each segment and can
+insert silent frames between them. ``build_segment_index`` and
+``build_hls_playlist`` describe a finished file as frame-aligned byte ranges so
+players can start and seek without downloading it from the beginning.
+"""
+
+import math
+
+MPEG_VERSION_1 = 3
+MPEG_VERSION_2 = 2
+MPEG_VERSION_25 = 0
+LAYER_3 = 1
+
+BITRATES_KBPS = {
+    MPEG_VERSION_1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    MPEG_VERSION_2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+BITRATES_KBPS[MPEG_VERSION_25] = BITRATES_KBPS[MPEG_VERSION_2]
+SAMPLE_RATES = {
+    MPEG_VERSION_1: (44100, 48000, 32000),
+    MPEG_VERSION_2: (22050, 24000, 16000),
+    MPEG_VERSION_25: (11025, 12000, 8000),
+}
+INFO_FRAME_MARKERS = (b'Xing', b'Info', b'VBRI')
+
+
+def get_id3v2_size(data):
+    if len(data) < 10 or data[:3] != b'ID3':
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    has_footer = data[5] & 0x10
+    return 10 + size + (10 if has_footer else 0)
+
+
+def parse_frame_header(data, offset):
+    """Return a dict describing the Layer III frame at ``offset``, or ``None`` if there is no valid header."""
+    if offset + 4 > len(data) or data[offset] != 0xFF or (data[offset + 1] & 0xE0) != 0xE0:
+        return None
+
+    version = (data[offset + 1] >> 3) & 0x03
+    layer = (data[offset + 1] >> 1) & 0x03
+    bitrate_index = data[offset + 2] >> 4
+    sample_rate_index = (data[offset + 2] >> 2) & 0x03
+    padding = (data[offset + 2] >> 1) & 0x01
+    if version == 1 or layer != LAYER_3 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    bitrate = BITRATES_KBPS[version][bitrate_index] * 1000
+    sample_rate = SAMPLE_RATES[version][sample_rate_index]
+    coefficient = 144 if version == MPEG_VERSION_1 else 72
+    return {
+        'version': version,
+        'sample_rate': sample_rate,
+        'channel_mode': data[offset + 3] >> 6,
+        'samples': 1152 if version == MPEG_VERSION_1 else 576,
+        'length': coefficient * bitrate // sample_rate + padding,
+        'header': bytes(data[offset:offset + 4]),
+    }
+
+
+def iter_frames(data):
+    """Yield ``(offset, header)`` for each audio frame, skipping tags and resynchronising over junk bytes."""
+    offset = get_id3v2_size(data)
+    end = len(data)
+    if end - offset >= 128 and data[end - 128:end - 125] == b'TAG':
+        end -= 128
+    while offset + 4 <= end:
+        header = parse_frame_header(data, offset)
+        if header is None:
+            offset += 1
+            continue
+        if offset + header['length'] > end:
+            break
+        yield offset, header
+        offset += header['length']
+
+
+def is_info_frame(data, offset, header):
+    # The Xing/Info tag sits after the side information, well inside the first 64 bytes of the frame.
+    frame_start = data[offset + 4:offset + min(header['length'], 64)]
+    return any(marker in frame_start for marker in INFO_FRAME_MARKERS)
+
+
+def build_silent_frame(header):
+    """A frame with empty side information decodes to silence with the same stream parameters."""
+    frame_header = bytearray(header['header'])
+    frame_header[1] |= 0x01  # no CRC
+    frame_header[2] &= 0xFD  # no padding
+    coefficient = 144 if header['version'] == MPEG_VERSION_1 else 72
+    bitrate = BITRATES_KBPS[header['version']][frame_header[2] >> 4] * 1000
+    length = coefficient * bitrate // header['sample_rate']
+    return bytes(frame_header) + bytes(length - 4)
+
+
+class MP3Concatenator:
+    """Write the audio frames of several MP3 segments into one stream, with optional silence between them"""
+
+    def __init__(self, output, silence_ms=0):
+        self.output = output
+        self.silence_ms = silence_ms
+        self.stream_format = None
+        self.silent_frame = None
+        self.segment_count = 0
+        self.frame_count = 0
+        self.sample_count = 0
+
+    def write_silence(self, duration_ms):
+        if not duration_ms or self.silent_frame is None:
+            return
+        samples_per_frame = self.stream_format['samples']
+        frames = max(1, round(duration_ms * self.stream_format['sample_rate'] / 1000 / samples_per_frame))
+        self.output.write(self.silent_frame * frames)
+        self.frame_count += frames
+        self.sample_count += frames * samples_per_frame
+
+    def append(self, data):
+        frames = [(offset, header) for offset, header in iter_frames(data)]
+        if frames and is_info_frame(data, *frames[0]):
+            frames = frames[1:]
+        if not frames:
+            raise ValueError('Audio segment does not contain any MP3 frames.')
+
+        first_header = frames[0][1]
+        stream_format = {key: first_header[key] for key in ('version', 'sample_rate', 'samples')}
+        if self.stream_format is None:
+            self.stream_format = stream_format
+            self.silent_frame = build_silent_frame(first_header)
+        elif stream_format != self.stream_format:
+            raise ValueError('Audio segments use different MP3 stream formats and cannot be joined.')
+
+        if self.segment_count:
+            self.write_silence(self.silence_ms)
+        view = memoryview(data)
+        for offset, header in frames:
+            self.output.write(view[offset:offset + header['length']])
+        self.segment_count += 1
+        self.frame_count += len(frames)
+        self.sample_count += len(frames) * first_header['samples']
+
+    @property
+    def duration_seconds(self):
+        if self.stream_format is None:
+            return 0.0
+        return self.sample_count / self.stream_format['sample_rate']
+
+
+def build_segment_index(data, segment_seconds=10):
+    """Group the audio frames of ``data`` into ``(offset, length, duration)`` segments of about ``segment_seconds``.
+
+    Segments always start on a frame boundary, so each one is a byte range a decoder can start from.
+    """
+    frames = iter_frames(data)
+    first = next(frames, None)
+    if first is not None and is_info_frame(data, *first):
+        first = next(frames, None)
+    if first is None:
+        return []
+
+    segments = []
+    offset, header = first
+    segment_start = offset
+    segment_end = offset + header['length']
+    segment_samples = header['samples']
+    sample_rate = header['sample_rate']
+    for offset, header in frames:
+        if segment_samples / sample_rate >= segment_seconds:
+            segments.append((segment_start, segment_end - segment_start, segment_samples / sample_rate))
+            segment_start = offset
+            segment_samples = 0
+        segment_end = offset + header['length']
+        segment_samples += header['samples']
+    segments.append((segment_start, segment_end - segment_start, segment_samples / sample_rate))
+    return segments
+
+
+def build_hls_playlist(segments, uri):
+    """An HLS media playlist that plays ``uri`` as byte ranges, one entry per ``build_segment_index`` segment."""
+    target_duration = max(1, math.ceil(max(duration for _, _, duration in segments)))
+    lines = [
+        '#EXTM3U',
+        '#EXT-X-VERSION:4',
+        f'#EXT-X-TARGETDURATION:{target_duration}',
+        '#EXT-X-MEDIA-SEQUENCE:0',
+        '#EXT-X-PLAYLIST-TYPE:VOD',
+    ]
+    for offset, length, duration in segments:
+        lines.append(f'#EXTINF:{duration:.3f},')
+        lines.append(f'#EXT-X-BYTERANGE:{length}@{offset}')
+        lines.append(uri)
+    lines.append('#EXT-X-ENDLIST')
+    return '\n'.join(lines) + '\n'
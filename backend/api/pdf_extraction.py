@@ -0,0 +1,68 @@
+"""Page-level PDF text extraction helpers.
+
+This module deliberately avoids importing Django so that process-pool workers
+started with the ``spawn`` method can import it without configuring settings.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+
+
+def extract_page_text(page):
+    page_text = page.get_text('text')
+    if page_text.strip():
+        return page_text
+
+    blocks = page.get_text('blocks')
+    block_texts = [block[4] for block in blocks if isinstance(block[4], str)]
+    return ' '.join(block_texts)
+
+
+def extract_page_shard(pdf_path, page_numbers):
+    """Open ``pdf_path`` in this process and return ``[(page_number, text), ...]`` for 1-based page numbers."""
+    fitz = import_module('fitz')
+    doc = fitz.open(pdf_path)
+    try:
+        return [(page_number, extract_page_text(doc.load_page(page_number - 1))) for page_number in page_numbers]
+    finally:
+        doc.close()
+
+
+def split_into_shards(page_numbers, shard_count):
+    page_numbers = sorted(page_numbers)
+    if not page_numbers:
+        return []
+
+    shard_count = max(1, min(shard_count, len(page_numbers)))
+    shard_size, remainder = divmod(len(page_numbers), shard_count)
+    shards = []
+    offset = 0
+    for shard_index in range(shard_count):
+        size = shard_size + (1 if shard_index < remainder else 0)
+        shards.append(page_numbers[offset:offset + size])
+        offset += size
+    return shards
+
+
+def get_default_worker_count():
+    return max(1, os.cpu_count() or 1)
+
+
+def extract_pages_parallel(pdf_path, page_numbers, max_workers=None):
+    """Extract pages across a process pool and return ``{page_number: text}``."""
+    max_workers = max_workers or get_default_worker_count()
+    # A few shards per worker keeps the pool busy when some pages are much heavier than others.
+    shards = split_into_shards(page_numbers, max_workers * 2)
+    page_texts = {}
+    # Callers run in threaded processes (job workers, the summarization batcher), where fork can
+    # copy a lock some other thread holds; spawned children start clean.
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(shards) or 1),
+        mp_context=multiprocessing.get_context('spawn'),
+    ) as executor:
+        futures = [executor.submit(extract_page_shard, pdf_path, shard) for shard in shards]
+        for future in futures:
+            page_texts.update(future.result())
+    return page_texts
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from .models import CustomUser, Book, Review, Library
+from .jobs import enqueue_book_ingestion_on_commit
 import re
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -175,6 +176,7 @@ class BookSerializer(serializers.ModelSerializer):
         if total_pages is not None:
             book.total_pages = total_pages
             book.save()
+        enqueue_book_ingestion_on_commit(book)
         return book
 
     def update(self, instance, validated_data):
@@ -184,11 +186,29 @@ class BookSerializer(serializers.ModelSerializer):
                 total_pages = int(total_pages)
             except Exception:
                 total_pages = 0
+        pdf_changed = any(
+            field in validated_data and validated_data[field] != getattr(instance, field)
+            for field in ('pdf_document', 'pdf_document_url')
+        )
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         if total_pages is not None:
             instance.total_pages = total_pages
+        if pdf_changed:
+            # Everything derived from the old PDF would otherwise keep being served as cached.
+            instance.ai_summary = None
+            instance.ai_summary_audio_url = None
+            instance.full_audio_url = None
+            instance.ai_processing_status = 'pending'
+            instance.last_ai_processed = None
+            instance.word_count = 0
+            instance.character_count = 0
+            instance.estimated_reading_time = 0
+            instance.estimated_audio_duration = 0
+            instance.top_keywords = []
         instance.save()
+        if pdf_changed:
+            enqueue_book_ingestion_on_commit(instance)
         return instance
 
 class ReviewSerializer(serializers.ModelSerializer):
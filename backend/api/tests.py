@@ -1,16 +1,81 @@
-from datetime import datetime, timezone
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import Future
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from importlib import import_module
+from importlib.util import find_spec
 from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-from django.test import SimpleTestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
 
+from .jobs import (
+    JOB_HANDLERS,
+    JOB_PREGENERATE_AUDIO,
+    claim_next_job,
+    enqueue_book_ingestion,
+    enqueue_job,
+    is_within_windows,
+    parse_time_windows,
+    run_job,
+    schedule_pregeneration,
+)
+from .models import BackgroundJob, Book, Library, SummaryCacheEntry
+from .serializers import BookSerializer
+from .extractive import summarize_sentences
+from .text_spans import iter_chunk_spans, iter_sentence_spans
+from .inference import apply_cpu_inference_profile, build_cpu_inference_profile
+from .mp3 import MP3Concatenator, build_hls_playlist, build_segment_index, iter_frames
+from .pdf_extraction import split_into_shards
 from .views import (
     AIProcessor,
+    AudioCache,
+    AudioProcessor,
+    OpenAIClientManager,
+    SpeechSegmentCache,
+    BookAnalyticsAccumulator,
+    BookTextExtractionView,
+    PDFProcessor,
+    PageTextStore,
+    RemotePDFCache,
+    ResolvedPDF,
+    SummarizationBatcher,
+    SummaryCache,
+    group_section_summaries,
+    SummarizerModelRegistry,
+    split_text_into_stable_chunks,
+    summarize_chunks,
+    apply_book_analytics,
     build_audio_cache_filename,
+    build_summary_audio_filename,
+    build_file_response,
+    build_page_offsets,
+    decode_page_cursor,
+    encode_page_cursor,
     estimate_minutes,
+    find_page_for_offset,
+    get_pdf_content_hash,
+    join_page_texts,
     normalize_page_range,
     parse_bool_param,
+    parse_range_header,
     parse_positive_int,
     select_balanced_chunk_indexes,
+    serve_audio,
+    synthesize_cached_audio,
 )
 
 
@@ -47,14 +112,19 @@ class FeatureHelperTests(SimpleTestCase):
         self.assertEqual(estimate_minutes(151, 150), 2)
         self.assertEqual(estimate_minutes(0, 150), 0)
 
-    def test_build_audio_cache_filename_includes_book_version(self):
+    def test_build_audio_cache_filename_is_versioned_by_inputs(self):
         book = SimpleNamespace(
             id=7,
             updated_at=datetime(2026, 5, 20, 12, 0, tzinfo=timezone.utc),
         )
-        filename = build_audio_cache_filename(book, 'chapter_audio', 2, 6)
+        filename = build_audio_cache_filename(book, 'chapter_audio', 2, 6, source='a' * 64)
 
-        self.assertEqual(filename, 'book_7_chapter_audio_2_6_v1779278400.mp3')
+        self.assertRegex(filename, r'^book_7_chapter_audio_2_6_v[0-9a-f]{16}\.mp3$')
+        book.updated_at = datetime(2026, 6, 1, 8, 30, tzinfo=timezone.utc)
+        self.assertEqual(build_audio_cache_filename(book, 'chapter_audio', 2, 6, source='a' * 64), filename)
+        self.assertNotEqual(build_audio_cache_filename(book, 'chapter_audio', 2, 6, source='b' * 64), filename)
+        with override_settings(OPENAI_TTS_VOICE='alloy'):
+            self.assertNotEqual(build_audio_cache_filename(book, 'chapter_audio', 2, 6, source='a' * 64), filename)
 
     def test_select_balanced_chunk_indexes_spans_full_range(self):
         self.assertEqual(select_balanced_chunk_indexes(7, 4), [0, 2, 4, 6])
@@ -72,3 +142,1311 @@ class FeatureHelperTests(SimpleTestCase):
         self.assertLessEqual(len(summary_source), 2000)
         self.assertIn('word0', summary_source)
         self.assertIn('word11999', summary_source)
+
+    def test_join_page_texts_skips_blank_pages(self):
+        self.assertEqual(join_page_texts(['  first page\n', '', '   ', 'second page ']), 'first page second page')
+
+    def test_page_text_store_compression_round_trips(self):
+        text = 'Chapter one\nIt was a bright cold day in April. ' * 50
+        payload = PageTextStore.compress_text(text)
+
+        self.assertLess(len(payload), len(text))
+        self.assertEqual(PageTextStore.decompress_text(memoryview(payload)), text)
+
+    def test_get_pdf_content_hash_tracks_file_contents(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, 'book.pdf')
+            with open(pdf_path, 'wb') as pdf_file:
+                pdf_file.write(b'%PDF-1.4 first')
+            first_hash = get_pdf_content_hash(pdf_path)
+
+            with open(pdf_path, 'wb') as pdf_file:
+                pdf_file.write(b'%PDF-1.4 second edition')
+            second_hash = get_pdf_content_hash(pdf_path)
+
+        self.assertEqual(len(first_hash), 64)
+        self.assertNotEqual(first_hash, second_hash)
+
+    def test_get_pdf_content_hash_memo_is_bounded(self):
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                mock.patch('api.views.PDF_CONTENT_HASH_CACHE_SIZE', 2), \
+                mock.patch('api.views._PDF_CONTENT_HASHES', OrderedDict()) as memo:
+            for index in range(3):
+                pdf_path = os.path.join(temp_dir, f'book_{index}.pdf')
+                with open(pdf_path, 'wb') as pdf_file:
+                    pdf_file.write(f'%PDF-1.4 {index}'.encode())
+                get_pdf_content_hash(pdf_path)
+
+            self.assertEqual(len(memo), 2)
+            self.assertEqual([key[0] for key in memo], [os.path.join(temp_dir, 'book_1.pdf'), os.path.join(temp_dir, 'book_2.pdf')])
+
+    def test_split_into_shards_keeps_page_order_and_balances_sizes(self):
+        shards = split_into_shards([5, 1, 2, 3, 4, 6, 7], 3)
+
+        self.assertEqual(shards, [[1, 2, 3], [4, 5], [6, 7]])
+
+    @override_settings(PDF_PARALLEL_EXTRACTION_MIN_PAGES=200)
+    def test_should_extract_in_parallel_only_above_threshold(self):
+        self.assertFalse(PDFProcessor.should_extract_in_parallel(199, worker_count=4))
+        self.assertTrue(PDFProcessor.should_extract_in_parallel(200, worker_count=4))
+        self.assertFalse(PDFProcessor.should_extract_in_parallel(1000, worker_count=1))
+
+    def test_iter_ndjson_records_emits_one_record_per_page(self):
+        page_stream = {
+            'page_count': 3,
+            'start_page': 1,
+            'end_page': 3,
+            'pages': iter([(1, ' Call me Ishmael.\n'), (2, '   '), (3, 'Some years ago ')]),
+        }
+
+        records = [json.loads(line) for line in BookTextExtractionView.iter_ndjson_records(page_stream)]
+
+        self.assertEqual([record['type'] for record in records], ['meta', 'page', 'page', 'page', 'summary'])
+        self.assertEqual(records[1], {
+            'type': 'page', 'page': 1, 'text': 'Call me Ishmael.', 'character_count': 16, 'word_count': 3,
+        })
+        self.assertEqual(records[-1], {
+            'type': 'summary',
+            'character_count': len('Call me Ishmael. Some years ago'),
+            'word_count': 6,
+        })
+
+    def test_parse_range_header_merges_and_clamps_ranges(self):
+        self.assertEqual(parse_range_header('bytes=0-9,5-19,-10', 100), [(0, 19), (90, 99)])
+        self.assertEqual(parse_range_header('bytes=95-', 100), [(95, 99)])
+        self.assertEqual(parse_range_header('bytes=200-300', 100), [])
+        self.assertIsNone(parse_range_header('bytes=9-3', 100))
+        self.assertIsNone(parse_range_header('items=0-1', 100))
+
+    def test_build_page_offsets_matches_joined_text(self):
+        pages = ['Call me Ishmael.', '', 'Some years ago', 'never mind how long']
+        joined = ' '.join(page for page in pages if page)
+
+        char_offsets, word_offsets = build_page_offsets([(len(page), len(page.split())) for page in pages])
+
+        self.assertEqual(char_offsets, [0, 16, 17, 32, len(joined)])
+        self.assertEqual(word_offsets, [0, 3, 3, 6, 10])
+        self.assertEqual(joined[char_offsets[2]:char_offsets[2] + len(pages[2])], 'Some years ago')
+
+    def test_find_page_for_offset_uses_page_boundaries(self):
+        char_offsets = [0, 16, 17, 32, 51]
+
+        self.assertEqual(find_page_for_offset(char_offsets, 0), 1)
+        self.assertEqual(find_page_for_offset(char_offsets, 17), 3)
+        self.assertEqual(find_page_for_offset(char_offsets, 50), 4)
+        with self.assertRaisesMessage(ValueError, 'Offset must be between 0 and 50.'):
+            find_page_for_offset(char_offsets, 51)
+
+    def test_page_cursor_round_trips_and_rejects_garbage(self):
+        self.assertEqual(decode_page_cursor(encode_page_cursor(42)), 42)
+        with self.assertRaisesMessage(ValueError, 'Invalid cursor.'):
+            decode_page_cursor('not-a-cursor')
+
+    def test_analytics_accumulator_matches_joined_text_and_merges_shards(self):
+        pages = {1: 'The whale, the WHALE! ', 2: '   ', 3: 'Ahab hunted the whale across oceans.'}
+        joined = ' '.join(text.strip() for text in pages.values() if text.strip())
+
+        first_shard = BookAnalyticsAccumulator().add_page(1, pages[1]).add_page(2, pages[2])
+        second_shard = BookAnalyticsAccumulator().add_page(3, pages[3])
+        analytics = first_shard.merge(second_shard).as_analytics(page_count=3, keyword_limit=2)
+
+        self.assertEqual(analytics['word_count'], len(joined.split()))
+        self.assertEqual(analytics['character_count'], len(joined))
+        self.assertEqual(analytics['top_keywords'], [
+            {'word': 'whale', 'frequency': 3},
+            {'word': 'ahab', 'frequency': 1},
+        ])
+        self.assertEqual(first_shard.page_stats[2], {'characters': 0, 'words': 0})
+
+
+@override_settings(FILE_SENDFILE_MODE='')
+class FileResponseTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.file_path = os.path.join(temp_dir.name, 'book.pdf')
+        with open(self.file_path, 'wb') as pdf_file:
+            pdf_file.write(bytes(range(256)) * 4)
+        self.factory = RequestFactory()
+
+    def test_single_range_returns_partial_content(self):
+        request = self.factory.get('/', HTTP_RANGE='bytes=10-19')
+        response = build_file_response(request, self.file_path, 'application/pdf', etag='"abc"')
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 10-19/1024')
+        self.assertEqual(b''.join(response.streaming_content), bytes(range(10, 20)))
+
+    def test_multiple_ranges_return_multipart_body(self):
+        request = self.factory.get('/', HTTP_RANGE='bytes=0-1,100-101')
+        response = build_file_response(request, self.file_path, 'application/pdf', etag='"abc"')
+        body = b''.join(response.streaming_content)
+
+        self.assertEqual(response.status_code, 206)
+        self.assertTrue(response['Content-Type'].startswith('multipart/byteranges; boundary='))
+        self.assertEqual(int(response['Content-Length']), len(body))
+        self.assertIn(b'Content-Range: bytes 100-101/1024\r\n\r\n\x64\x65\r\n', body)
+
+    def test_matching_etag_returns_not_modified(self):
+        request = self.factory.get('/', HTTP_IF_NONE_MATCH='"abc"')
+        response = build_file_response(request, self.file_path, 'application/pdf', etag='"abc"')
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], '"abc"')
+
+    def test_stale_if_range_serves_full_file(self):
+        request = self.factory.get('/', HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"old"')
+        response = build_file_response(request, self.file_path, 'application/pdf', etag='"abc"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(b''.join(response.streaming_content)), 1024)
+        response.close()
+
+    @override_settings(FILE_SENDFILE_MODE='x-accel-redirect', FILE_ACCEL_REDIRECT_PREFIX='/protected-media/')
+    def test_accel_redirect_mode_hands_file_to_front_end_server(self):
+        with override_settings(MEDIA_ROOT=os.path.dirname(self.file_path)):
+            response = build_file_response(self.factory.get('/'), self.file_path, 'application/pdf', etag='"abc"')
+
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/book.pdf')
+        self.assertEqual(response.content, b'')
+
+
+class FakePDFResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f'HTTP {self.status_code}')
+
+    def iter_content(self, chunk_size=8192):
+        for offset in range(0, len(self.content), chunk_size):
+            yield self.content[offset:offset + chunk_size]
+
+
+class RemotePDFCacheTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_settings = override_settings(
+            PDF_DOWNLOAD_CACHE_DIR=temp_dir.name,
+            PDF_DOWNLOAD_CACHE_MAX_BYTES=1024,
+            PDF_DOWNLOAD_CACHE_REVALIDATE_SECONDS=0,
+        )
+        self.cache_settings.enable()
+        self.addCleanup(self.cache_settings.disable)
+
+    def test_fetch_revalidates_with_etag_instead_of_downloading_again(self):
+        url = 'https://example.com/book.pdf'
+        responses = [
+            FakePDFResponse(200, b'%PDF-1.4 body', headers={'ETag': '"v1"'}),
+            FakePDFResponse(304),
+        ]
+        with mock.patch('api.views.requests.get', side_effect=responses) as mocked_get:
+            first_path, first_hash = RemotePDFCache.fetch(url)
+            second_path, second_hash = RemotePDFCache.fetch(url)
+
+        self.assertEqual((first_path, first_hash), (second_path, second_hash))
+        self.assertEqual(mocked_get.call_args_list[1].kwargs['headers'], {'If-None-Match': '"v1"'})
+        with open(second_path, 'rb') as cached_file:
+            self.assertEqual(cached_file.read(), b'%PDF-1.4 body')
+
+    def test_enforce_budget_evicts_least_recently_used_blobs(self):
+        blob_dir = os.path.join(RemotePDFCache.get_cache_dir(), 'blobs')
+        os.makedirs(blob_dir)
+        for index, name in enumerate(['old', 'recent']):
+            blob_path = os.path.join(blob_dir, f'{name}.pdf')
+            with open(blob_path, 'wb') as blob_file:
+                blob_file.write(b'x' * 600)
+            os.utime(blob_path, (1000 + index, 1000 + index))
+
+        evicted = RemotePDFCache.enforce_budget()
+
+        self.assertEqual([os.path.basename(path) for path in evicted], ['old.pdf'])
+        self.assertTrue(os.path.exists(os.path.join(blob_dir, 'recent.pdf')))
+
+
+class PDFDownloadTests(SimpleTestCase):
+    url = 'https://example.com/book.pdf'
+    body = b'%PDF-1.4 ' + b'x' * 4096
+
+    @override_settings(PDF_IN_MEMORY_MAX_BYTES=1024 * 1024)
+    def test_small_remote_pdf_is_kept_in_memory(self):
+        with mock.patch('api.views.requests.get', return_value=FakePDFResponse(200, self.body)):
+            resolved = PDFProcessor._download_pdf(self.url)
+
+        self.assertIsNone(resolved.path)
+        self.assertEqual(bytes(resolved.data), self.body)
+        self.assertEqual(resolved.get_content_hash(), hashlib.sha256(self.body).hexdigest())
+        resolved.release()
+
+    @override_settings(PDF_IN_MEMORY_MAX_BYTES=1024)
+    def test_large_remote_pdf_spills_to_temp_file(self):
+        with mock.patch('api.views.requests.get', return_value=FakePDFResponse(200, self.body)):
+            resolved = PDFProcessor._download_pdf(self.url)
+
+        self.assertIsNone(resolved.data)
+        with open(resolved.path, 'rb') as spilled_file:
+            self.assertEqual(spilled_file.read(), self.body)
+        resolved.release()
+        self.assertFalse(os.path.exists(resolved.path))
+
+    @skipUnless(find_spec('fitz'), 'PyMuPDF is not installed')
+    @override_settings(PDF_MMAP_LOCAL_FILES=True)
+    def test_local_pdf_is_opened_from_a_memory_map(self):
+        fitz = import_module('fitz')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, 'book.pdf')
+            source = fitz.open()
+            source.new_page().insert_text((72, 72), 'Mapped page')
+            source.save(pdf_path)
+            source.close()
+
+            resolved = ResolvedPDF(path=pdf_path)
+            doc = resolved.open(fitz)
+            self.assertIn('Mapped page', doc.load_page(0).get_text())
+            self.assertEqual(len(resolved._mappings), 1)
+            doc.close()
+            resolved.release()
+
+
+class FakeSummarizer:
+    model = None
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, **kwargs):
+        self.calls.append(texts)
+        if isinstance(texts, str):
+            return [{'summary_text': texts[:10]}]
+        if any('broken' in text for text in texts):
+            raise RuntimeError('batch failed')
+        return [{'summary_text': text[:10]} for text in texts]
+
+
+class FakeSummarizationStack:
+    def __init__(self):
+        self.loaded = []
+        self.torch = SimpleNamespace(cuda=SimpleNamespace(is_available=lambda: False))
+
+    def pipeline(self, task, model, device):
+        self.loaded.append(model)
+        return FakeSummarizer()
+
+    def __call__(self):
+        return self.pipeline, self.torch
+
+
+class SummarizerModelRegistryTests(SimpleTestCase):
+    def setUp(self):
+        SummarizerModelRegistry.clear()
+        self.addCleanup(SummarizerModelRegistry.clear)
+        self.stack = FakeSummarizationStack()
+        patcher = mock.patch('api.views.load_summarization_stack', self.stack)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(SUMMARIZER_MODEL_IDLE_SECONDS=0)
+    def test_model_is_loaded_once_across_threads(self):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(SummarizerModelRegistry.get('tiny-model')))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.stack.loaded, ['tiny-model'])
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    @override_settings(SUMMARIZER_MODEL_IDLE_SECONDS=0)
+    def test_idle_models_are_evicted(self):
+        SummarizerModelRegistry.get('tiny-model')
+        with mock.patch('api.views.time.monotonic', return_value=time.monotonic() + 120):
+            evicted = SummarizerModelRegistry.evict_idle(idle_seconds=60)
+
+        self.assertEqual(evicted, ['tiny-model'])
+        self.assertEqual(SummarizerModelRegistry.loaded_models(), {})
+
+    @override_settings(SUMMARIZER_MODEL_IDLE_SECONDS=0)
+    def test_batcher_groups_concurrent_chunks_into_one_call(self):
+        summarizer = SummarizerModelRegistry.get('tiny-model')
+        batcher = SummarizationBatcher('tiny-model', max_batch_size=8, max_wait_seconds=0.5)
+        futures = [batcher.submit(f'chunk number {index}', 60, 10) for index in range(3)]
+
+        self.assertEqual([future.result(timeout=5) for future in futures], ['chunk numb'] * 3)
+        self.assertEqual(len(summarizer.calls), 1)
+        self.assertEqual(len(summarizer.calls[0]), 3)
+
+    @override_settings(SUMMARIZER_MODEL_IDLE_SECONDS=0)
+    def test_batcher_isolates_a_failing_chunk(self):
+        SummarizerModelRegistry.get('tiny-model')
+        batcher = SummarizationBatcher('tiny-model', max_batch_size=8, max_wait_seconds=0.5)
+        futures = [batcher.submit(text, 60, 10) for text in ('first chunk', 'broken chunk')]
+
+        self.assertEqual(futures[0].result(timeout=5), 'first chun')
+        self.assertEqual(futures[1].result(timeout=5), 'broken chu')
+
+    @override_settings(SUMMARIZER_MODEL_IDLE_SECONDS=0)
+    def test_batcher_survives_unexpected_failures(self):
+        SummarizerModelRegistry.get('tiny-model')
+        batcher = SummarizationBatcher('tiny-model', max_batch_size=8, max_wait_seconds=0.5)
+
+        # A pipeline that returns the wrong shape fails the affected chunks instead of killing the thread.
+        with mock.patch.object(FakeSummarizer, '__call__', lambda self, texts, **kwargs: [{'text': 'no summary key'}]):
+            futures = [batcher.submit(f'chunk number {index}', 60, 10) for index in range(2)]
+            for future in futures:
+                with self.assertRaises(KeyError):
+                    future.result(timeout=5)
+
+        with mock.patch.object(batcher, 'run_group', side_effect=RuntimeError('scheduler bug')):
+            with self.assertRaisesMessage(RuntimeError, 'scheduler bug'):
+                batcher.submit('lost chunk', 60, 10).result(timeout=5)
+
+        self.assertEqual(batcher.submit('still working', 60, 10).result(timeout=5), 'still work')
+
+    @override_settings(SUMMARIZER_BATCH_SIZE=8, SUMMARIZER_BATCH_RESULT_TIMEOUT_SECONDS=0.05)
+    def test_summarize_chunks_gives_up_on_a_stuck_batcher(self):
+        stuck_batcher = SimpleNamespace(submit=lambda text, max_length, min_length: Future())
+        with mock.patch('api.views.SummarizationBatcher.for_model', return_value=stuck_batcher):
+            self.assertEqual(summarize_chunks('tiny-model', ['first', 'second'], 60, 10), [None, None])
+
+
+class BackgroundJobQueueTests(TestCase):
+    def setUp(self):
+        self.book = Book.objects.create(
+            title='Moby-Dick',
+            author='Herman Melville',
+            genre='Fiction',
+            published_year=1851,
+            pdf_document_url='https://example.com/moby-dick.pdf',
+        )
+
+    def test_enqueue_book_ingestion_queues_each_job_once(self):
+        first = enqueue_book_ingestion(self.book)
+        second = enqueue_book_ingestion(self.book)
+
+        self.assertEqual([job.kind for job in first], ['page_count', 'extract_text', 'analytics'])
+        self.assertEqual([job.id for job in first], [job.id for job in second])
+
+    def test_claim_next_job_prefers_higher_priority(self):
+        enqueue_job('analytics', book=self.book)
+        enqueue_job('page_count', book=self.book)
+
+        job = claim_next_job(worker_id='test-worker')
+
+        self.assertEqual(job.kind, 'page_count')
+        self.assertEqual(job.status, 'running')
+        self.assertEqual(job.locked_by, 'test-worker')
+
+    def test_failed_job_is_retried_then_marked_failed(self):
+        calls = []
+
+        def failing_handler(job):
+            calls.append(job.id)
+            raise RuntimeError('boom')
+
+        with mock.patch.dict(JOB_HANDLERS, {'test_failure': failing_handler}):
+            job = enqueue_job('test_failure', book=self.book, max_attempts=2)
+            run_job(claim_next_job(worker_id='test-worker'))
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.attempts, job.last_error), ('queued', 1, 'boom'))
+            self.assertGreater(job.run_after, job.created_at)
+
+            BackgroundJob.objects.filter(id=job.id).update(run_after=job.created_at)
+            run_job(claim_next_job(worker_id='test-worker'))
+            job.refresh_from_db()
+
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+        self.assertEqual(len(calls), 2)
+
+    def test_run_services_restarts_a_crashing_worker_then_fails(self):
+        worker = f'{sys.executable} -c "raise SystemExit(3)"'
+        web = f'{sys.executable} -c "import time; time.sleep(30)"'
+        with mock.patch('api.management.commands.run_services.time.sleep'), \
+                self.assertRaisesMessage(CommandError, 'exited with status 3 2 times'):
+            call_command('run_services', web=web, worker=worker, max_restarts=1, poll=0, stdout=io.StringIO(), stderr=io.StringIO())
+
+    def test_replacing_the_pdf_clears_results_derived_from_the_old_one(self):
+        Book.objects.filter(pk=self.book.pk).update(
+            ai_summary='About the old edition.',
+            ai_summary_audio_url='https://books.example.com/media/audio/ab/summary.mp3',
+            full_audio_url='https://books.example.com/media/audio/cd/full.mp3',
+            ai_processing_status='completed',
+            word_count=1000,
+        )
+        self.book.refresh_from_db()
+        serializer = BookSerializer(self.book, data={
+            'title': self.book.title,
+            'author': self.book.author,
+            'genre': self.book.genre,
+            'published_year': self.book.published_year,
+            'cover_image_url': 'https://example.com/cover.jpg',
+            'pdf_document_url': 'https://example.com/moby-dick-annotated.pdf',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            serializer.save()
+
+        self.book.refresh_from_db()
+        self.assertEqual(
+            (self.book.ai_summary, self.book.ai_summary_audio_url, self.book.full_audio_url),
+            (None, None, None),
+        )
+        self.assertEqual((self.book.ai_processing_status, self.book.word_count), ('pending', 0))
+        self.assertTrue(BackgroundJob.objects.filter(book=self.book, kind='extract_text', status='queued').exists())
+
+    @override_settings(BACKGROUND_JOB_LOCK_TIMEOUT=60)
+    def test_job_abandoned_by_a_dead_worker_counts_its_attempts(self):
+        job = enqueue_job('analytics', book=self.book, max_attempts=2)
+        for expected_attempts in (1, 2):
+            claimed = claim_next_job(worker_id='doomed-worker')
+            self.assertEqual((claimed.id, claimed.attempts), (job.id, expected_attempts))
+            # The worker is killed before run_job saves anything; age the lock past the timeout.
+            BackgroundJob.objects.filter(id=job.id).update(locked_at=claimed.locked_at - timedelta(minutes=5))
+
+        self.assertIsNone(claim_next_job(worker_id='next-worker'))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+
+    def test_analytics_save_keeps_fields_written_by_other_jobs(self):
+        stale_book = Book.objects.get(pk=self.book.pk)
+        Book.objects.filter(pk=self.book.pk).update(ai_summary='Fresh summary', ai_processing_status='completed')
+
+        apply_book_analytics(stale_book, {
+            'word_count': 120,
+            'character_count': 640,
+            'estimated_reading_time_minutes': 1,
+            'estimated_audio_duration_minutes': 1,
+            'top_keywords': [],
+            'page_count': 3,
+        })
+
+        self.book.refresh_from_db()
+        self.assertEqual((self.book.ai_summary, self.book.ai_processing_status), ('Fresh summary', 'completed'))
+        self.assertEqual((self.book.word_count, self.book.total_pages), (120, 3))
+
+
+class SummaryCacheTests(TestCase):
+    def test_transformers_summary_is_reused_without_loading_the_model(self):
+        source_text = 'A quiet harbour town waits for the storm. ' * 10
+        with mock.patch('api.views.summarize_chunks', return_value=['The town braces for a storm.']) as summarize, \
+                mock.patch('api.views.SummarizerModelRegistry.get') as load_model:
+            first = AIProcessor.generate_summary_with_transformers(source_text, False)
+            second = AIProcessor.generate_summary_with_transformers(source_text, False)
+
+        self.assertEqual(first['summary'], 'The town braces for a storm.')
+        self.assertNotIn('cache_hit', first)
+        self.assertTrue(second['cache_hit'])
+        self.assertEqual(second['summary'], first['summary'])
+        self.assertEqual(summarize.call_count, 1)
+        self.assertEqual(load_model.call_count, 1)
+        self.assertEqual(SummaryCacheEntry.objects.get().hit_count, 1)
+
+    def test_cache_key_depends_on_provider_model_and_source(self):
+        key = SummaryCache.build_key('openai', 'model-a', 'text')
+        self.assertEqual(key, SummaryCache.build_key('openai', 'model-a', 'text'))
+        self.assertNotEqual(key, SummaryCache.build_key('transformers', 'model-a', 'text'))
+        self.assertNotEqual(key, SummaryCache.build_key('openai', 'model-b', 'text'))
+        self.assertNotEqual(key, SummaryCache.build_key('openai', 'model-a', 'other text'))
+
+    @override_settings(SUMMARY_CACHE_MAX_ENTRIES=2)
+    def test_least_recently_used_entries_are_evicted(self):
+        for index in range(3):
+            SummaryCache.set(f'key-{index}', {'summary': f'summary {index}', 'provider': 'openai', 'model': 'm'})
+            SummaryCacheEntry.objects.filter(cache_key=f'key-{index}').update(
+                last_used_at=datetime(2024, 1, 1 + index, tzinfo=timezone.utc),
+            )
+
+        self.assertIsNone(SummaryCache.get('key-0'))
+        self.assertEqual(
+            sorted(SummaryCacheEntry.objects.values_list('cache_key', flat=True)),
+            ['key-1', 'key-2'],
+        )
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f'status {status_code}')
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers={'retry-after': retry_after} if retry_after else {})
+
+
+class OpenAIClientManagerTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(OpenAIClientManager, 'get_client', return_value=object())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(OPENAI_MAX_RETRIES=3, OPENAI_SUMMARY_TIMEOUT=12)
+    def test_rate_limited_calls_are_retried_with_the_operation_timeout(self):
+        outcomes = [FakeAPIError(429, retry_after='2'), FakeAPIError(503), 'done']
+        timeouts = []
+
+        def func(client, timeout):
+            timeouts.append(timeout)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with mock.patch('api.views.time.sleep') as sleep:
+            self.assertEqual(OpenAIClientManager.call('summary', func), 'done')
+
+        self.assertEqual(timeouts, [12, 12, 12])
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(sleep.call_args_list[0].args[0], 2.0)
+
+    @override_settings(OPENAI_MAX_RETRIES=3)
+    def test_client_errors_are_not_retried(self):
+        func = mock.Mock(side_effect=FakeAPIError(400))
+        with mock.patch('api.views.time.sleep') as sleep, self.assertRaises(FakeAPIError):
+            OpenAIClientManager.call('summary', func)
+
+        self.assertEqual(func.call_count, 1)
+        sleep.assert_not_called()
+
+
+def build_book_text(word_count, seed=0):
+    words = ['harbour', 'storm', 'lantern', 'ledger', 'keeper', 'ship', 'evening', 'tide', 'rope', 'gull']
+    return ' '.join(f'{words[(index * 7 + seed) % len(words)]}{index % 97}' for index in range(word_count))
+
+
+class MapReduceSummaryTests(TestCase):
+    def test_stable_chunks_resynchronise_after_an_early_edit(self):
+        text = build_book_text(4000)
+        edited = 'Prologue added later. ' + text
+        original_chunks = split_text_into_stable_chunks(text, 600)
+        edited_chunks = split_text_into_stable_chunks(edited, 600)
+
+        self.assertTrue(all(len(chunk) <= 620 for chunk in original_chunks))
+        self.assertEqual(' '.join(original_chunks), text)
+        changed = set(edited_chunks) - set(original_chunks)
+        self.assertLessEqual(len(changed), 3)
+
+    def test_groups_hold_at_least_two_summaries(self):
+        groups = group_section_summaries(['a' * 50, 'b' * 50, 'c' * 50], max_group_size=60)
+        self.assertEqual(groups, ['a' * 50 + '\n\n' + 'b' * 50 + '\n\n' + 'c' * 50])
+
+    @override_settings(SUMMARY_MAP_REDUCE_CHUNK_CHARS=600)
+    def test_refresh_only_resummarizes_changed_sections(self):
+        calls = []
+
+        def fake_summarize_chunks(model_name, chunks, max_length, min_length):
+            calls.append(len(chunks))
+            return [f'summary {zlib.crc32(chunk.encode())} ' + 'x' * 60 for chunk in chunks]
+
+        book = SimpleNamespace(title='Harbour', author='A. Keeper', genre='', published_year=None)
+        text = build_book_text(4000)
+        with mock.patch('api.views.load_openai_client', return_value=None), \
+                mock.patch('api.views.SummarizerModelRegistry.get'), \
+                mock.patch('api.views.summarize_chunks', side_effect=fake_summarize_chunks):
+            first = AIProcessor.generate_summary(book, text, mode='map_reduce')
+            first_calls = list(calls)
+            calls.clear()
+            AIProcessor.generate_summary(book, 'Prologue added later. ' + text, mode='map_reduce')
+
+        self.assertEqual(first['provider'], 'transformers-map-reduce')
+        self.assertGreaterEqual(first['tree_depth'], 2)
+        self.assertEqual(first_calls[0], first['section_count'])
+        # Only the sections around the edit and the reduce path above them run again.
+        self.assertLessEqual(calls[0], 3)
+        self.assertLess(sum(calls), sum(first_calls) / 2)
+
+
+class AISummaryAudioJobAPITests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='reader',
+            name='Reader',
+            mobile='5550100',
+            email='reader@example.com',
+            password='secret-pass-123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.book = Book.objects.create(
+            title='Moby-Dick',
+            author='Herman Melville',
+            genre='Fiction',
+            published_year=1851,
+            pdf_document_url='https://example.com/moby-dick.pdf',
+        )
+        self.jobs_url = f'/api/books/{self.book.id}/ai-summary-audio/jobs/'
+
+    def test_second_request_attaches_to_the_running_job(self):
+        first = self.client.post(self.jobs_url)
+        second = self.client.post(self.jobs_url)
+
+        self.assertEqual(first.status_code, 202)
+        self.assertEqual(second.status_code, 202)
+        self.assertFalse(first.data['attached'])
+        self.assertTrue(second.data['attached'])
+        self.assertEqual(first.data['job_id'], second.data['job_id'])
+        self.assertEqual(first['Location'], first.data['status_url'])
+        self.assertEqual(BackgroundJob.objects.filter(kind='ai_summary_audio').count(), 1)
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.ai_processing_status, 'processing')
+
+    def test_status_endpoint_reports_the_job_result(self):
+        job_id = self.client.post(self.jobs_url, {'mode': 'map_reduce'}).data['job_id']
+        status_url = f'{self.jobs_url}{job_id}/'
+        self.assertEqual(self.client.get(status_url).data['job_status'], 'queued')
+
+        def fake_generate(book, build_absolute_uri, force_refresh=False, summary_mode=None):
+            book.ai_summary = 'A whale of a tale.'
+            book.ai_processing_status = 'completed'
+            book.save()
+            return {'summary': book.ai_summary, 'summary_mode': summary_mode}, 200
+
+        with mock.patch('api.views.generate_ai_summary_audio', side_effect=fake_generate):
+            run_job(claim_next_job(worker_id='test-worker'))
+
+        response = self.client.get(status_url)
+        self.assertEqual(response.data['job_status'], 'completed')
+        self.assertEqual(response.data['processing_status'], 'completed')
+        self.assertEqual(response.data['result'], {'summary': 'A whale of a tale.', 'summary_mode': 'map_reduce'})
+
+    def test_invalid_mode_is_rejected(self):
+        response = self.client.post(self.jobs_url, {'mode': 'everything'})
+        self.assertEqual(response.status_code, 400)
+
+
+class FullAudioJobAPITests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='listener',
+            name='Listener',
+            mobile='5550101',
+            email='listener@example.com',
+            password='secret-pass-123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.book = Book.objects.create(
+            title='Moby-Dick',
+            author='Herman Melville',
+            genre='Fiction',
+            published_year=1851,
+            pdf_document_url='https://example.com/moby-dick.pdf',
+        )
+        self.url = f'/api/books/{self.book.id}/full-audio/'
+
+    @staticmethod
+    def fake_generate(book, build_absolute_uri, force_refresh=False, cached_only=False):
+        if cached_only:
+            return None, None
+        audio_url = build_absolute_uri('/media/audio/ab/book_full.mp3')
+        return {'audio_url': audio_url, 'estimated_duration_minutes': 42, 'cached': False}, 200
+
+    def test_uncached_book_is_narrated_by_a_background_job(self):
+        with mock.patch('api.views.generate_full_audio', side_effect=self.fake_generate):
+            first = self.client.get(self.url)
+            second = self.client.get(self.url)
+
+            self.assertEqual(first.status_code, 202)
+            self.assertEqual(first['Location'], first.data['status_url'])
+            self.assertTrue(second.data['attached'])
+            self.assertEqual(first.data['job_id'], second.data['job_id'])
+            run_job(claim_next_job(worker_id='test-worker'))
+
+        response = self.client.get(f'{self.url}jobs/{first.data["job_id"]}/')
+        self.assertEqual(response.data['job_status'], 'completed')
+        self.assertEqual(response.data['result']['audio_url'], 'http://testserver/media/audio/ab/book_full.mp3')
+        self.assertEqual(Library.objects.get(user=self.user, book=self.book, type='audio').total, 42)
+
+    def test_book_known_to_be_too_long_is_refused_without_a_job(self):
+        Book.objects.filter(pk=self.book.pk).update(character_count=5000)
+
+        with override_settings(FULL_AUDIO_MAX_CHARACTERS=1000):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(BackgroundJob.objects.filter(kind='full_audio').exists())
+
+
+class ExtractiveSummaryTests(SimpleTestCase):
+    def build_sentences(self):
+        themes = [
+            'The whaling ship sailed through the cold northern sea toward the distant ice.',
+            'Captain Ahab paced the deck and searched the sea for the white whale.',
+            'The crew of the whaling ship feared the captain and the white whale.',
+        ]
+        def word(number):
+            letters = ''
+            for _ in range(4):
+                number, remainder = divmod(number, 26)
+                letters += chr(ord('a') + remainder)
+            return letters
+
+        filler = [
+            ' '.join(word(index * 11 + offset + 1000) for offset in range(8)).capitalize() + '.'
+            for index in range(60)
+        ]
+        # The themed sentences recur across the book; the filler never repeats its subject.
+        return filler[:20] + themes + filler[20:40] + themes[::-1] + filler[40:] + themes
+
+    def test_textrank_prefers_central_sentences(self):
+        sentences = self.build_sentences()
+        selected = summarize_sentences(sentences, limit=3, method='textrank')
+        self.assertTrue(all('whale' in sentences[index] or 'ship' in sentences[index] for index in selected))
+
+    def test_picks_are_spread_across_the_book(self):
+        sentences = self.build_sentences()
+        for method in ('textrank', 'tfidf'):
+            selected = summarize_sentences(sentences, limit=3, method=method)
+            self.assertEqual(selected, sorted(selected))
+            self.assertGreaterEqual(min(b - a for a, b in zip(selected, selected[1:])), len(sentences) // 6)
+            self.assertGreater(selected[-1], len(sentences) // 2)
+
+    def test_short_inputs_are_returned_whole(self):
+        self.assertEqual(summarize_sentences(['One sentence.', 'Two sentences.'], limit=5), [0, 1])
+
+
+class CPUInferenceProfileTests(SimpleTestCase):
+    def test_profile_tunes_threads_quantization_and_input_length(self):
+        quantized_model = object()
+        torch = SimpleNamespace(
+            set_num_threads=mock.Mock(),
+            quantization=SimpleNamespace(quantize_dynamic=mock.Mock(return_value=quantized_model)),
+            nn=SimpleNamespace(Linear=object),
+            qint8='qint8',
+        )
+        summarizer = SimpleNamespace(model=object(), tokenizer=SimpleNamespace(model_max_length=1024))
+        profile = build_cpu_inference_profile(threads=2, quantize='INT8', max_input_tokens=512)
+
+        apply_cpu_inference_profile(summarizer, torch, profile)
+
+        torch.set_num_threads.assert_called_once_with(2)
+        self.assertIs(summarizer.model, quantized_model)
+        self.assertEqual(summarizer.tokenizer.model_max_length, 512)
+
+    def test_default_profile_leaves_the_pipeline_alone(self):
+        torch = SimpleNamespace(set_num_threads=mock.Mock())
+        model = object()
+        summarizer = SimpleNamespace(model=model, tokenizer=SimpleNamespace(model_max_length=1024))
+
+        apply_cpu_inference_profile(summarizer, torch, build_cpu_inference_profile())
+
+        torch.set_num_threads.assert_not_called()
+        self.assertIs(summarizer.model, model)
+        self.assertEqual(summarizer.tokenizer.model_max_length, 1024)
+
+    def test_unknown_quantization_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            build_cpu_inference_profile(quantize='int4')
+
+
+class TextSpanTests(SimpleTestCase):
+    def test_sentence_spans_skip_surrounding_whitespace(self):
+        text = '  First one. Second one!  Third?  '
+        self.assertEqual(
+            [text[start:end] for start, end in iter_sentence_spans(text)],
+            ['First one.', 'Second one!', 'Third?'],
+        )
+
+    def test_chunks_end_on_sentence_boundaries_within_budget(self):
+        text = ' '.join(f'Sentence number {index} is here.' for index in range(200))
+        spans = list(iter_chunk_spans(text, max_chars=120))
+
+        self.assertTrue(all(end - start <= 120 for start, end in spans))
+        self.assertTrue(all(text[end - 1] == '.' for _, end in spans))
+        self.assertEqual(' '.join(text[start:end] for start, end in spans), text)
+
+    def test_long_sentences_are_split_between_words(self):
+        text = 'word ' * 100 + 'end.'
+        spans = list(iter_chunk_spans(text, max_chars=50))
+
+        self.assertTrue(all(end - start <= 50 for start, end in spans))
+        self.assertTrue(all(not text[start:end].startswith(' ') for start, end in spans))
+        self.assertEqual(' '.join(text[start:end] for start, end in spans), text.strip())
+
+    def test_token_budget_uses_the_given_counter(self):
+        text = 'One two three. Four five six. Seven eight nine.'
+        spans = list(iter_chunk_spans(text, max_tokens=6, count_tokens=lambda chunk: len(chunk.split())))
+        self.assertEqual([text[start:end] for start, end in spans], ['One two three. Four five six.', 'Seven eight nine.'])
+
+
+def build_mp3_frame(marker=0, header=b'\xff\xf3\x44\xc4', length=96):
+    # Defaults to MPEG-2 Layer III, 32 kbps, 24 kHz: 96-byte frames of 576 samples.
+    return header + bytes([marker]) * (length - 4)
+
+
+class MP3ConcatenatorTests(SimpleTestCase):
+    def test_tags_and_info_frames_are_dropped_and_silence_inserted(self):
+        info_frame = b'\xff\xf3\x44\xc4' + bytes(9) + b'Info' + bytes(79)
+        id3_tag = b'ID3\x03\x00\x00\x00\x00\x00\x05' + bytes(5)
+        output = io.BytesIO()
+        concatenator = MP3Concatenator(output, silence_ms=48)
+
+        concatenator.append(id3_tag + info_frame + build_mp3_frame(1) * 2)
+        concatenator.append(build_mp3_frame(2) + b'TAG' + bytes(125))
+
+        frames = [output.getvalue()[offset + 4] for offset, _ in iter_frames(output.getvalue())]
+        self.assertEqual(frames, [1, 1, 0, 0, 2])
+        self.assertEqual(concatenator.frame_count, 5)
+        self.assertAlmostEqual(concatenator.duration_seconds, 5 * 576 / 24000)
+
+    def test_mismatched_stream_formats_are_rejected(self):
+        concatenator = MP3Concatenator(io.BytesIO())
+        concatenator.append(build_mp3_frame())
+
+        # 8 kbps at 16 kHz.
+        with self.assertRaisesMessage(ValueError, 'different MP3 stream formats'):
+            concatenator.append(build_mp3_frame(header=b'\xff\xf3\x18\xc4', length=36))
+        with self.assertRaisesMessage(ValueError, 'does not contain any MP3 frames'):
+            concatenator.append(b'not audio')
+
+
+@override_settings(TTS_SEGMENT_CHARS=40, TTS_MAX_WORKERS=3, TTS_SEGMENT_SILENCE_MS=0)
+class SegmentedSpeechTests(SimpleTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.output_path = os.path.join(self.temp_dir.name, 'book.mp3')
+        self.text = ' '.join(f'Sentence {index} of the book.' for index in range(12))
+        segment_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(segment_dir.cleanup)
+        segment_settings = override_settings(TTS_SEGMENT_CACHE_DIR=segment_dir.name)
+        segment_settings.enable()
+        self.addCleanup(segment_settings.disable)
+
+    def fake_speech(self, text, output_file, language='en', slow=False):
+        # Later segments finish first, so the output order must come from the spans.
+        index = int(text.split()[1])
+        time.sleep(0.002 * (12 - index))
+        output_file.write(build_mp3_frame(index) * 2)
+        return None, 200, 'gtts'
+
+    def test_segments_are_joined_in_text_order(self):
+        with mock.patch('api.views.load_openai_client', return_value=None), \
+                mock.patch.object(AudioProcessor, 'text_to_speech_gtts', side_effect=self.fake_speech) as speech:
+            error, status_code, provider = AudioProcessor.text_to_speech_to_file(self.text, self.output_path)
+
+        self.assertIsNone(error)
+        self.assertEqual((status_code, provider), (200, 'gtts'))
+        self.assertGreater(speech.call_count, 1)
+        with open(self.output_path, 'rb') as audio_file:
+            data = audio_file.read()
+        markers = [data[offset + 4] for offset, _ in iter_frames(data)]
+        self.assertEqual(markers, sorted(markers))
+        self.assertEqual(sorted(set(markers)), list(range(12)))
+
+    def test_failed_segment_leaves_no_partial_file(self):
+        def failing_speech(text, output_file, language='en', slow=False):
+            if 'Sentence 7 ' in text:
+                return 'Provider unavailable.', 503, 'gtts'
+            return self.fake_speech(text, output_file)
+
+        with mock.patch('api.views.load_openai_client', return_value=None), \
+                mock.patch.object(AudioProcessor, 'text_to_speech_gtts', side_effect=failing_speech):
+            error, status_code, provider = AudioProcessor.text_to_speech_to_file(self.text, self.output_path)
+
+        self.assertEqual((error, status_code, provider), ('Provider unavailable.', 503, None))
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_short_text_streams_directly_and_replaces_the_previous_file(self):
+        with open(self.output_path, 'wb') as audio_file:
+            audio_file.write(b'old audio')
+
+        def streaming_speech(text, output_file, language='en', slow=False):
+            # The cache path keeps the previous audio until the new file is complete.
+            with open(self.output_path, 'rb') as audio_file:
+                self.assertEqual(audio_file.read(), b'old audio')
+            output_file.write(b'new audio')
+            return None, 200, 'gtts'
+
+        with mock.patch('api.views.load_openai_client', return_value=None), \
+                mock.patch.object(AudioProcessor, 'text_to_speech_gtts', side_effect=streaming_speech):
+            error, _, _ = AudioProcessor.text_to_speech_to_file('A short summary.', self.output_path)
+
+        self.assertIsNone(error)
+        with open(self.output_path, 'rb') as audio_file:
+            self.assertEqual(audio_file.read(), b'new audio')
+        self.assertEqual(os.listdir(self.temp_dir.name), ['book.mp3'])
+
+    def test_segments_do_not_cross_page_breaks(self):
+        text = 'Page one ends here. Page two starts here and goes on.'
+        spans = AudioProcessor.build_segment_spans(text, segment_breaks=[0, text.index('Page two')])
+        self.assertEqual([text[start:end] for start, end in spans], ['Page one ends here.', 'Page two starts here and goes on.'])
+
+    def test_overlapping_page_ranges_reuse_cached_segments(self):
+        pages = [f'Sentence {index} of the book.' for index in range(6)]
+
+        def narrate(page_count):
+            text = ' '.join(pages[:page_count])
+            offsets = [sum(len(page) + 1 for page in pages[:index]) for index in range(page_count)]
+            with mock.patch('api.views.load_openai_client', return_value=None), \
+                    mock.patch.object(AudioProcessor, 'text_to_speech_gtts', side_effect=self.fake_speech) as speech:
+                error, _, _ = AudioProcessor.text_to_speech_to_file(text, self.output_path, segment_breaks=offsets)
+            self.assertIsNone(error)
+            return [call.args[0] for call in speech.call_args_list]
+
+        self.assertEqual(len(narrate(5)), 5)
+        self.assertEqual(narrate(6), [pages[5]])
+        with open(self.output_path, 'rb') as audio_file:
+            data = audio_file.read()
+        self.assertEqual(sorted({data[offset + 4] for offset, _ in iter_frames(data)}), list(range(6)))
+
+        with override_settings(OPENAI_TTS_VOICE='other', TTS_SEGMENT_CACHE_ENABLED=False):
+            self.assertEqual(len(narrate(6)), 6)
+
+    def test_segment_cache_key_depends_on_voice(self):
+        openai_key = SpeechSegmentCache.build_key('openai', AudioProcessor.get_voice_signature('openai'), 'Hello.')
+        with override_settings(OPENAI_TTS_VOICE='alloy'):
+            other_voice_key = SpeechSegmentCache.build_key('openai', AudioProcessor.get_voice_signature('openai'), 'Hello.')
+        gtts_key = SpeechSegmentCache.build_key('gtts', AudioProcessor.get_voice_signature('gtts'), 'Hello.')
+        self.assertEqual(len({openai_key, other_voice_key, gtts_key}), 3)
+
+
+class AudioCacheTests(TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.audio_dir = os.path.join(temp_dir.name, 'audio')
+        os.makedirs(self.audio_dir)
+        storage_patch = mock.patch('api.views.get_audio_storage_dir', return_value=self.audio_dir)
+        storage_patch.start()
+        self.addCleanup(storage_patch.stop)
+        segment_settings = override_settings(TTS_SEGMENT_CACHE_DIR=os.path.join(self.audio_dir, 'segments'))
+        segment_settings.enable()
+        self.addCleanup(segment_settings.disable)
+        self.book = Book.objects.create(
+            title='Moby-Dick',
+            author='Herman Melville',
+            genre='Fiction',
+            published_year=1851,
+            pdf_document_url='https://example.com/moby-dick.pdf',
+        )
+
+    def write_audio(self, filename, size=100, accessed=None):
+        path = AudioCache.get_path(filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as audio_file:
+            audio_file.write(bytes(size))
+        if accessed is not None:
+            os.utime(path, (accessed, accessed))
+        return path
+
+    def test_files_are_sharded_and_legacy_files_move_on_lookup(self):
+        filename = build_audio_cache_filename(self.book, 'ai_summary_audio')
+        with open(os.path.join(self.audio_dir, filename), 'wb') as audio_file:
+            audio_file.write(b'audio')
+
+        path = AudioCache.lookup(filename)
+
+        self.assertEqual(path, os.path.join(self.audio_dir, *AudioCache.get_relative_path(filename).split('/')))
+        self.assertTrue(os.path.exists(path))
+        self.assertFalse(os.path.exists(os.path.join(self.audio_dir, filename)))
+        self.assertIsNone(AudioCache.lookup('book_0_missing_v0.mp3'))
+
+    def test_sweep_deletes_superseded_summary_audio_and_audio_of_deleted_books(self):
+        self.book.ai_summary = 'A whale hunt.'
+        self.book.save()
+        current = self.write_audio(build_summary_audio_filename(self.book, 'A whale hunt.'))
+        superseded = self.write_audio(build_summary_audio_filename(self.book, 'An older summary.'))
+        chapter = self.write_audio(build_audio_cache_filename(self.book, 'chapter_audio', 1, 2, source='a' * 64))
+        orphaned = self.write_audio('book_999999_full_audio_v1.mp3')
+
+        result = AudioCache.sweep(max_bytes=0)
+
+        self.assertEqual(result['stale_deleted'], 2)
+        self.assertTrue(os.path.exists(current))
+        self.assertTrue(os.path.exists(chapter))
+        self.assertFalse(os.path.exists(superseded))
+        self.assertFalse(os.path.exists(orphaned))
+
+    def test_sweep_evicts_least_recently_used_past_budget(self):
+        now = time.time()
+        oldest = self.write_audio(build_audio_cache_filename(self.book, 'chapter_audio', 1, 2), accessed=now - 300)
+        segment = os.path.join(self.audio_dir, 'segments', 'ab', f'{"ab" * 32}.mp3')
+        os.makedirs(os.path.dirname(segment))
+        with open(segment, 'wb') as segment_file:
+            segment_file.write(bytes(100))
+        os.utime(segment, (now - 200, now - 200))
+        newest = self.write_audio(build_audio_cache_filename(self.book, 'chapter_audio', 3, 4), accessed=now)
+
+        dry_run = AudioCache.sweep(max_bytes=150, dry_run=True)
+        self.assertEqual(dry_run['evicted'], 2)
+        self.assertTrue(os.path.exists(oldest))
+
+        evictions_before = AudioCache.stats()['evictions']
+        result = AudioCache.sweep(max_bytes=150)
+
+        self.assertEqual((result['evicted'], result['bytes_after']), (2, 100))
+        self.assertFalse(os.path.exists(oldest))
+        self.assertFalse(os.path.exists(segment))
+        self.assertTrue(os.path.exists(newest))
+        self.assertEqual(AudioCache.stats()['evictions'] - evictions_before, 2)
+
+    def test_full_audio_view_drops_a_stored_url_whose_file_was_evicted(self):
+        user = get_user_model().objects.create_user(
+            username='listener',
+            name='Listener',
+            mobile='5550102',
+            email='listener@example.com',
+            password='secret-pass-123',
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+        kept = build_audio_cache_filename(self.book, 'full_audio', source='a' * 64)
+        self.write_audio(kept)
+        url = f'/api/books/{self.book.id}/full-audio/'
+        Book.objects.filter(pk=self.book.pk).update(
+            full_audio_url=f'http://testserver/media/audio/{AudioCache.get_relative_path(kept)}',
+        )
+
+        self.assertEqual(client.get(url).status_code, 200)
+
+        os.remove(AudioCache.get_path(kept))
+        with mock.patch('api.views.generate_full_audio', return_value=(None, None)):
+            response = client.get(url)
+
+        self.assertEqual(response.status_code, 202)
+        self.book.refresh_from_db()
+        self.assertIsNone(self.book.full_audio_url)
+
+    def test_summary_audio_whose_file_was_evicted_is_narrated_again(self):
+        user = get_user_model().objects.create_user(
+            username='listener',
+            name='Listener',
+            mobile='5550102',
+            email='listener@example.com',
+            password='secret-pass-123',
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+        filename = build_summary_audio_filename(self.book, 'A whale hunt.')
+        Book.objects.filter(pk=self.book.pk).update(
+            ai_summary='A whale hunt.',
+            ai_processing_status='completed',
+            ai_summary_audio_url=f'http://testserver/media/audio/{AudioCache.get_relative_path(filename)}',
+        )
+        url = f'/api/books/{self.book.id}/ai-summary-audio/'
+
+        with mock.patch('api.views.AudioProcessor.text_to_speech_to_file', return_value=('TTS is down.', 503, None)):
+            response = client.get(url)
+        self.assertEqual((response.data['audio_url'], response.data['audio_available']), (None, False))
+        self.book.refresh_from_db()
+        self.assertIsNone(self.book.ai_summary_audio_url)
+
+        def narrate(text, output_path, **kwargs):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(output_path, 'wb') as audio_file:
+                audio_file.write(b'audio')
+            return None, 200, 'gtts'
+
+        with mock.patch('api.views.AudioProcessor.text_to_speech_to_file', side_effect=narrate), \
+                mock.patch('api.views.AudioCache.schedule_sweep'):
+            response = client.get(url)
+        self.assertTrue(response.data['audio_available'])
+        self.assertEqual(response.data['audio_provider'], 'gtts')
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.ai_summary_audio_url, response.data['audio_url'])
+
+
+@override_settings(AUDIO_PLAYLIST_SEGMENT_SECONDS=1, FILE_SENDFILE_MODE='')
+class AudioDeliveryTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.audio_dir = temp_dir.name
+        storage_patch = mock.patch('api.views.get_audio_storage_dir', return_value=self.audio_dir)
+        storage_patch.start()
+        self.addCleanup(storage_patch.stop)
+        self.filename = 'book_1_full_audio_v0123456789abcdef.mp3'
+        self.audio = b'ID3\x03\x00\x00\x00\x00\x00\x02\x00\x00' + b''.join(build_mp3_frame(index % 256) for index in range(100))
+        self.audio_path = AudioCache.get_path(self.filename)
+        os.makedirs(os.path.dirname(self.audio_path))
+        with open(self.audio_path, 'wb') as audio_file:
+            audio_file.write(self.audio)
+        self.factory = RequestFactory()
+
+    def test_segment_index_groups_frames_into_byte_ranges(self):
+        segments = build_segment_index(self.audio, segment_seconds=1)
+
+        self.assertEqual([length // 96 for _, length, _ in segments], [42, 42, 16])
+        self.assertEqual(segments[0][0], 12)
+        self.assertEqual(segments[1][0], segments[0][0] + segments[0][1])
+        playlist = build_hls_playlist(segments, 'book.mp3')
+        self.assertIn('#EXT-X-TARGETDURATION:2', playlist)
+        self.assertIn(f'#EXT-X-BYTERANGE:{segments[1][1]}@{segments[1][0]}', playlist)
+        self.assertTrue(playlist.endswith('#EXT-X-ENDLIST\n'))
+
+    def test_range_requests_return_partial_content_with_immutable_caching(self):
+        path = AudioCache.get_relative_path(self.filename)
+        response = serve_audio(self.factory.get(f'/media/audio/{path}', HTTP_RANGE='bytes=1000-1999'), path)
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), self.audio[1000:2000])
+        self.assertEqual(response['Content-Range'], f'bytes 1000-1999/{len(self.audio)}')
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_playlist_is_built_on_first_request(self):
+        path = AudioCache.get_relative_path(self.filename)[:-len('.mp3')] + '.m3u8'
+        response = serve_audio(self.factory.get(f'/media/audio/{path}'), path)
+
+        self.assertEqual(response['Content-Type'], 'application/vnd.apple.mpegurl')
+        playlist = b''.join(response.streaming_content).decode('utf-8')
+        self.assertEqual(playlist.count(self.filename), 3)
+        self.assertTrue(os.path.exists(AudioCache.get_playlist_path(self.audio_path)))
+
+    def test_regenerated_audio_gets_a_fresh_playlist(self):
+        path = AudioCache.get_relative_path(self.filename)[:-len('.mp3')] + '.m3u8'
+        first = b''.join(serve_audio(self.factory.get(f'/media/audio/{path}'), path).streaming_content)
+        shorter = b''.join(build_mp3_frame(index % 256) for index in range(50))
+
+        def narrate(text, output_path, **kwargs):
+            with open(output_path, 'wb') as audio_file:
+                audio_file.write(shorter)
+            return None, 200, 'gtts'
+
+        with mock.patch('api.views.AudioProcessor.text_to_speech_to_file', side_effect=narrate), \
+                mock.patch('api.views.AudioCache.schedule_sweep'):
+            self.assertIsNone(synthesize_cached_audio('Call me Ishmael.', self.filename)[0])
+        second = b''.join(serve_audio(self.factory.get(f'/media/audio/{path}'), path).streaming_content)
+
+        self.assertNotEqual(first, second)
+        segments = build_segment_index(shorter, segment_seconds=1)
+        self.assertIn(f'#EXT-X-BYTERANGE:{segments[-1][1]}@{segments[-1][0]}'.encode(), second)
+
+    def test_flat_legacy_urls_and_paths_outside_the_audio_directory(self):
+        response = serve_audio(self.factory.head(f'/media/audio/{self.filename}'), self.filename)
+        self.assertEqual(response.status_code, 200)
+        with self.assertRaises(Http404):
+            serve_audio(self.factory.get('/media/audio/../secret.mp3'), '../secret.mp3')
+
+
+@override_settings(
+    PREGENERATION_WINDOWS='',
+    PREGENERATION_CHAPTERS=2,
+    PREGENERATION_CHAPTER_PAGES=5,
+    PREGENERATION_DAILY_CHARACTER_BUDGET=50000,
+    PREGENERATION_BASE_URL='https://books.example.com/',
+)
+class PregenerationSchedulerTests(TestCase):
+    def setUp(self):
+        self.users = [
+            get_user_model().objects.create_user(
+                username=f'reader{index}',
+                name=f'Reader {index}',
+                mobile=f'555010{index}',
+                email=f'reader{index}@example.com',
+                password='secret-pass-123',
+            )
+            for index in range(3)
+        ]
+
+    def create_book(self, title, readers, total_pages=100, character_count=200000):
+        book = Book.objects.create(
+            title=title,
+            author='Author',
+            genre='Fiction',
+            published_year=1900,
+            pdf_document_url=f'https://example.com/{title}.pdf',
+            total_pages=total_pages,
+            character_count=character_count,
+        )
+        for user in self.users[:readers]:
+            Library.objects.create(user=user, book=book, type='pdf')
+        return book
+
+    def test_time_windows_can_wrap_past_midnight(self):
+        windows = parse_time_windows('22:00-02:00, 12:00-12:30')
+        self.assertTrue(is_within_windows(datetime(2026, 1, 1, 23, 15), windows))
+        self.assertTrue(is_within_windows(datetime(2026, 1, 1, 1, 59), windows))
+        self.assertFalse(is_within_windows(datetime(2026, 1, 1, 2, 0), windows))
+        self.assertTrue(is_within_windows(datetime(2026, 1, 1, 12, 10), windows))
+        self.assertTrue(is_within_windows(datetime(2026, 1, 1, 8, 0), []))
+        with self.assertRaises(ValueError):
+            parse_time_windows('late')
+
+    def test_busiest_books_are_queued_within_the_character_budget(self):
+        quiet = self.create_book('quiet', readers=1)
+        busy = self.create_book('busy', readers=3)
+        # Ten pages at 20,000 characters each would blow the budget on their own.
+        dense = self.create_book('dense', readers=2, character_count=2000000)
+        self.create_book('unread', readers=0)
+
+        scheduled = schedule_pregeneration(base_url='https://books.example.com/')
+
+        self.assertEqual([book for book, _ in scheduled], [busy, quiet])
+        self.assertEqual(scheduled[0][1], 10 * 2000 + 1000)
+        job = BackgroundJob.objects.get(kind=JOB_PREGENERATE_AUDIO, book=busy)
+        self.assertEqual(job.payload['chapters'], [[1, 5], [6, 10]])
+        self.assertFalse(BackgroundJob.objects.filter(book=dense).exists())
+        # Queued books are not scheduled twice, and the day's budget is already partly spent.
+        self.assertEqual(schedule_pregeneration(), [])
+
+    def test_books_are_ranked_by_distinct_readers(self):
+        shared = self.create_book('shared', readers=2)
+        # One reader with both the PDF and the audio in their library is still one reader.
+        devoted = self.create_book('devoted', readers=1)
+        Library.objects.create(user=self.users[0], book=devoted, type='audio')
+
+        scheduled = schedule_pregeneration(base_url='https://books.example.com/', dry_run=True)
+
+        self.assertEqual([book for book, _ in scheduled], [shared, devoted])
+
+    @override_settings(PREGENERATION_WINDOWS='01:00-02:00')
+    def test_nothing_is_queued_outside_the_windows(self):
+        self.create_book('busy', readers=3)
+        noon = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        self.assertEqual(schedule_pregeneration(now=noon), [])
+        self.assertEqual(len(schedule_pregeneration(now=noon, ignore_windows=True)), 1)
+
+    @override_settings(PREGENERATION_BASE_URL='')
+    def test_scheduling_requires_an_absolute_base_url(self):
+        self.create_book('busy', readers=3)
+        with self.assertRaises(ValueError):
+            schedule_pregeneration()
+        with self.assertRaises(ValueError):
+            schedule_pregeneration(base_url='/')
+        self.assertEqual(len(schedule_pregeneration(dry_run=True)), 1)
+        self.assertFalse(BackgroundJob.objects.exists())
+
+    @override_settings(PREGENERATION_BASE_URL='')
+    def test_worker_runs_without_a_base_url_but_skips_pregeneration(self):
+        self.create_book('busy', readers=3)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command('run_jobs', once=True, pregenerate_every=60, stdout=stdout, stderr=stderr)
+        self.assertIn('Skipping audio pre-generation', stderr.getvalue())
+        self.assertIn('processed 0 job(s)', stdout.getvalue())
+        self.assertFalse(BackgroundJob.objects.exists())
+
+    def test_handler_fills_the_summary_and_chapter_caches(self):
+        book = self.create_book('busy', readers=1)
+        job = enqueue_job(JOB_PREGENERATE_AUDIO, book=book, payload={
+            'base_url': 'https://books.example.com/',
+            'summary': True,
+            'chapters': [[1, 5], [6, 10]],
+        })
+
+        def fake_summary(book, build_absolute_uri, **kwargs):
+            return {'audio_url': build_absolute_uri('/media/audio/summary.mp3')}, 200
+
+        def fake_chapter(book, start_page, end_page, build_absolute_uri, force_refresh=False):
+            return {'cached': start_page == 1}, 200
+
+        with mock.patch('api.views.generate_ai_summary_audio', side_effect=fake_summary) as summary, \
+                mock.patch('api.views.generate_chapter_audio', side_effect=fake_chapter) as chapter:
+            run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.result['summary'], 'generated')
+        self.assertEqual([entry['cached'] for entry in job.result['chapters']], [True, False])
+        self.assertEqual(summary.call_count, 1)
+        self.assertEqual([call.args[1:3] for call in chapter.call_args_list], [(1, 5), (6, 10)])
@@ -0,0 +1,121 @@
+"""Offset-based text chunking.
+
+Chunkers here yield ``(start, end)`` offsets into the text they are given
+instead of building word lists and re-joined strings, so chunking a whole book
+does not hold extra copies of it. Callers slice only the chunks they use.
+"""
+
+import re
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+NON_SPACE = re.compile(r'\S')
+WORD = re.compile(r'\S+')
+TOKEN = re.compile(r'\w+|[^\w\s]')
+
+
+def approximate_token_count(text):
+    """Cheap stand-in for a subword tokenizer: words and punctuation marks."""
+    return len(TOKEN.findall(text))
+
+
+def iter_sentence_spans(text, start=0, end=None):
+    """Yield ``(start, end)`` for each sentence, without surrounding whitespace."""
+    end = len(text) if end is None else end
+    first = NON_SPACE.search(text, start, end)
+    if first is None:
+        return
+    position = first.start()
+    for boundary in SENTENCE_BOUNDARY.finditer(text, position, end):
+        yield position, boundary.start()
+        position = boundary.end()
+    tail_end = end
+    while tail_end > position and text[tail_end - 1].isspace():
+        tail_end -= 1
+    if tail_end > position:
+        yield position, tail_end
+
+
+def iter_chunk_spans(text, max_chars=4000, max_tokens=None, count_tokens=None, start=0, end=None):
+    """Yield ``(start, end)`` chunks that end on sentence boundaries.
+
+    The budget is ``max_chars`` characters, or ``max_tokens`` tokens as measured by ``count_tokens``
+    (a tokenizer's length function, for example) when a token budget is given. A sentence that does not
+    fit on its own is split between words. ``start`` and ``end`` limit chunking to part of ``text``.
+    """
+    if max_tokens:
+        budget = max_tokens
+        count_tokens = count_tokens or approximate_token_count
+
+        def measure(span_start, span_end):
+            return count_tokens(text[span_start:span_end])
+    else:
+        budget = max(1, max_chars)
+
+        def measure(span_start, span_end):
+            # Count the separating space too, matching the old word-joining chunker.
+            return span_end - span_start + 1
+
+    chunk_start = None
+    chunk_end = None
+    chunk_cost = 0
+    for sentence_start, sentence_end in iter_sentence_spans(text, start, end):
+        cost = measure(sentence_start, sentence_end)
+        if cost > budget:
+            if chunk_start is not None:
+                yield chunk_start, chunk_end
+                chunk_start = None
+                chunk_cost = 0
+            yield from iter_word_spans(text, sentence_start, sentence_end, budget, measure)
+            continue
+
+        if chunk_start is not None and chunk_cost + cost > budget:
+            yield chunk_start, chunk_end
+            chunk_start = None
+            chunk_cost = 0
+        if chunk_start is None:
+            chunk_start = sentence_start
+        chunk_end = sentence_end
+        chunk_cost += cost
+
+    if chunk_start is not None:
+        yield chunk_start, chunk_end
+
+
+def iter_word_spans(text, start, end, budget, measure):
+    """Split one over-long span between words; a single word longer than the budget is cut at the budget."""
+    chunk_start = None
+    chunk_end = None
+    chunk_cost = 0
+    for word in WORD.finditer(text, start, end):
+        word_start, word_end = word.span()
+        cost = measure(word_start, word_end)
+        while cost > budget and word_end - word_start > 1:
+            if chunk_start is not None:
+                yield chunk_start, chunk_end
+                chunk_start = None
+                chunk_cost = 0
+            # Shrink the piece until it fits; only pathological "words" (URLs, base64) reach this.
+            piece_end = word_start + max(1, (word_end - word_start) * budget // cost)
+            while piece_end - word_start > 1 and measure(word_start, piece_end) > budget:
+                piece_end -= max(1, (piece_end - word_start) // 10)
+            yield word_start, piece_end
+            word_start = piece_end
+            cost = measure(word_start, word_end)
+
+        if chunk_start is not None and chunk_cost + cost > budget:
+            yield chunk_start, chunk_end
+            chunk_start = None
+            chunk_cost = 0
+        if chunk_start is None:
+            chunk_start = word_start
+        chunk_end = word_end
+        chunk_cost += cost
+
+    if chunk_start is not None:
+        yield chunk_start, chunk_end
+
+
+def iter_chunks(text, max_chars=4000, max_tokens=None, count_tokens=None):
+    """Yield chunk strings one at a time; only the chunk being consumed is materialised."""
+    for start, end in iter_chunk_spans(text, max_chars=max_chars, max_tokens=max_tokens, count_tokens=count_tokens):
+        yield text[start:end]
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import RegisterView, LoginView, BookListCreateView, BookDetailView, ReviewListCreateView, ReviewDeleteView, ReviewAdminListView, BookSearchView, BookPDFView, UserLibraryView, UpdateLibraryProgressView, BookRecommendationView,TopReviewsView, get_audio_progress, UserProfileView, BookAISummaryAudioView, BookFullAudioView, BookTextExtractionView, BookChapterAudioView, BookAnalyticsView
+from .views import RegisterView, LoginView, BookListCreateView, BookDetailView, ReviewListCreateView, ReviewDeleteView, ReviewAdminListView, BookSearchView, BookPDFView, UserLibraryView, UpdateLibraryProgressView, BookRecommendationView,TopReviewsView, get_audio_progress, UserProfileView, BookAISummaryAudioView, BookAISummaryAudioJobView, BookAISummaryAudioJobStatusView, BookFullAudioView, BookFullAudioJobStatusView, BookTextExtractionView, BookPageTextView, BookChapterAudioView, BookAnalyticsView
 
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
@@ -13,10 +13,14 @@ urlpatterns = [
     path('books/search/', BookSearchView.as_view(), name='book-search'),
     path('books/<int:id>/pdf/', BookPDFView.as_view(), name='book-pdf'),
     path('books/<int:id>/text/', BookTextExtractionView.as_view(), name='book-text-extraction'),
+    path('books/<int:id>/pages/', BookPageTextView.as_view(), name='book-page-text'),
     path('books/<int:id>/analytics/', BookAnalyticsView.as_view(), name='book-analytics'),
     path('books/<int:id>/chapter-audio/', BookChapterAudioView.as_view(), name='book-chapter-audio'),
     path('books/<int:id>/ai-summary-audio/', BookAISummaryAudioView.as_view(), name='book-ai-summary-audio'),
+    path('books/<int:id>/ai-summary-audio/jobs/', BookAISummaryAudioJobView.as_view(), name='book-ai-summary-audio-jobs'),
+    path('books/<int:id>/ai-summary-audio/jobs/<int:job_id>/', BookAISummaryAudioJobStatusView.as_view(), name='book-ai-summary-audio-job-status'),
     path('books/<int:id>/full-audio/', BookFullAudioView.as_view(), name='book-full-audio'),
+    path('books/<int:id>/full-audio/jobs/<int:job_id>/', BookFullAudioJobStatusView.as_view(), name='book-full-audio-job-status'),
     path('library/', UserLibraryView.as_view(), name='user-library'),
     path('library/update/', UpdateLibraryProgressView.as_view(), name='update-library-progress'),
     path('recommendations/', BookRecommendationView.as_view(), name='book-recommendations'),
@@ -4,11 +4,21 @@ from rest_framework import status, viewsets, permissions
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from .serializers import RegisterSerializer, LoginSerializer, BookSerializer, ReviewSerializer, LibrarySerializer
-from .models import Book, Review, Library
+from .models import BackgroundJob, Book, Review, Library, PdfTextDocument, PdfPageText, SummaryCacheEntry
+from .jobs import JOB_AI_SUMMARY_AUDIO, JOB_FULL_AUDIO, enqueue_ai_summary_audio_job, enqueue_full_audio_job
+from .extractive import summarize_sentences
+from .text_spans import iter_chunk_spans, iter_chunks
+from .mp3 import MP3Concatenator, build_hls_playlist, build_segment_index
+from .inference import apply_cpu_inference_profile, build_cpu_inference_profile, inference_context
+from .pdf_extraction import extract_page_text, extract_pages_parallel, get_default_worker_count
 from django.shortcuts import get_object_or_404
 from rest_framework.generics import ListAPIView
-from django.db.models import Q
-from django.http import FileResponse, Http404
+from django.db import DatabaseError, connections
+from django.db.models import F, Q
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
 import os
 from django.conf import settings
 import tempfile
@@ -17,13 +27,39 @@ from importlib import import_module
 
 import requests
 from django.shortcuts import redirect
+from django.urls import reverse
 from rest_framework.decorators import api_view, permission_classes
 
 import io
 import urllib.request
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 import logging
 import re
+import hashlib
+import zlib
+import json
+import mmap
+import gc
+import threading
+from collections import OrderedDict
+import base64
+import heapq
+from collections import Counter, deque
+from operator import itemgetter
+from itertools import islice
+import secrets
+from bisect import bisect_right
+import time
+import queue
+import random
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows development machines
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +68,12 @@ class OptionalDependencyError(RuntimeError):
     """Raised when an optional AI/PDF dependency is unavailable."""
 
 
+class SegmentSynthesisError(RuntimeError):
+    """Raised when a speech provider fails on one segment of a long text."""
+
+    status_code = 500
+
+
 def load_pymupdf():
     try:
         return import_module('fitz')
@@ -68,27 +110,143 @@ def load_summarization_stack():
     return pipeline, torch
 
 
-def load_openai_client():
-    api_key = getattr(settings, 'OPENAI_API_KEY', '')
-    if not api_key:
-        return None
+OPENAI_RETRYABLE_STATUS_CODES = {408, 409, 429}
 
-    try:
-        OpenAI = import_module('openai').OpenAI
-    except ModuleNotFoundError as exc:
-        raise OptionalDependencyError(
-            'openai is not installed. Install the package `openai` to enable API-backed AI summaries and speech.'
-        ) from exc
 
-    return OpenAI(api_key=api_key)
+class OpenAIClientManager:
+    """Process-wide OpenAI client with a keep-alive connection pool, bounded concurrency and retry/backoff"""
+
+    _lock = threading.Lock()
+    _client = None
+    _client_key = None
+    _semaphore = None
+    _semaphore_size = None
+
+    @classmethod
+    def get_client(cls):
+        api_key = getattr(settings, 'OPENAI_API_KEY', '')
+        if not api_key:
+            return None
+
+        with cls._lock:
+            if cls._client is not None and cls._client_key == api_key:
+                return cls._client
+
+            try:
+                openai = import_module('openai')
+            except ModuleNotFoundError as exc:
+                raise OptionalDependencyError(
+                    'openai is not installed. Install the package `openai` to enable API-backed AI summaries and speech.'
+                ) from exc
+
+            httpx = import_module('httpx')
+            max_connections = max(1, getattr(settings, 'OPENAI_MAX_CONNECTIONS', 20))
+            http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=getattr(settings, 'OPENAI_KEEPALIVE_SECONDS', 60),
+                ),
+                timeout=httpx.Timeout(getattr(settings, 'OPENAI_TIMEOUT', 60), connect=10),
+            )
+            # Retries are handled in call() so the backoff is jittered and bounded by our own concurrency limit.
+            cls._client = openai.OpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+            cls._client_key = api_key
+            return cls._client
+
+    @classmethod
+    def get_semaphore(cls):
+        size = max(1, getattr(settings, 'OPENAI_MAX_CONCURRENCY', 4))
+        with cls._lock:
+            if cls._semaphore is None or cls._semaphore_size != size:
+                cls._semaphore = threading.BoundedSemaphore(size)
+                cls._semaphore_size = size
+            return cls._semaphore
+
+    @staticmethod
+    def is_retryable(exc):
+        status_code = getattr(exc, 'status_code', None)
+        if status_code is not None:
+            return status_code in OPENAI_RETRYABLE_STATUS_CODES or status_code >= 500
+        try:
+            openai = import_module('openai')
+        except ModuleNotFoundError:
+            return False
+        return isinstance(exc, openai.APIConnectionError)
+
+    @staticmethod
+    def get_retry_delay(exc, attempt):
+        response = getattr(exc, 'response', None)
+        retry_after = getattr(response, 'headers', {}).get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), getattr(settings, 'OPENAI_RETRY_MAX_DELAY', 20))
+            except ValueError:
+                pass
+        base_delay = getattr(settings, 'OPENAI_RETRY_BASE_DELAY', 0.5)
+        cap = getattr(settings, 'OPENAI_RETRY_MAX_DELAY', 20)
+        # Full jitter spreads retries out so a backfill does not hit the rate limit again in lockstep.
+        return random.uniform(0, min(cap, base_delay * (2 ** attempt)))
+
+    @classmethod
+    def call(cls, operation, func):
+        """Run ``func(client, timeout)`` inside the concurrency limit, retrying 429/5xx and connection errors."""
+        client = cls.get_client()
+        if client is None:
+            return None
+
+        timeout = getattr(settings, f'OPENAI_{operation.upper()}_TIMEOUT', None) or getattr(settings, 'OPENAI_TIMEOUT', 60)
+        max_retries = max(0, getattr(settings, 'OPENAI_MAX_RETRIES', 3))
+        semaphore = cls.get_semaphore()
+        for attempt in range(max_retries + 1):
+            try:
+                with semaphore:
+                    return func(client, timeout)
+            except Exception as exc:
+                if attempt >= max_retries or not cls.is_retryable(exc):
+                    raise
+                delay = cls.get_retry_delay(exc, attempt)
+                logger.warning(f'OpenAI {operation} call failed ({str(exc)}), retrying in {delay:.1f}s')
+                time.sleep(delay)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            if cls._client is not None:
+                cls._client.close()
+            cls._client = None
+            cls._client_key = None
+
+
+def load_openai_client():
+    return OpenAIClientManager.get_client()
 
 
 TRUE_VALUES = {'1', 'true', 'yes', 'y', 'on'}
 DEFAULT_HTTP_TIMEOUT = 20
 MAX_CHAPTER_AUDIO_PAGES = 20
-MAX_FULL_AUDIO_CHARACTERS = 50000
+PAGE_STREAM_BATCH_SIZE = 25
+MAX_BYTE_RANGES = 16
+FILE_STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_PAGE_TEXT_LIMIT = 10
+MAX_PAGE_TEXT_LIMIT = 50
+MAX_FULL_AUDIO_CHARACTERS = 2000000
+# Remembered (path, size, mtime) -> SHA-256 entries; enough for every PDF a worker serves in a typical day.
+PDF_CONTENT_HASH_CACHE_SIZE = 1024
 MAX_SUMMARY_SOURCE_CHARS = 24000
+AI_SUMMARY_JOB_POLL_SECONDS = 3
+FULL_AUDIO_JOB_POLL_SECONDS = 10
 SUMMARY_SAMPLE_CHUNKS = 7
+DEFAULT_SUMMARIZER_MODEL = 'sshleifer/distilbart-cnn-12-6'
+# Bump when the summary prompt or post-processing changes so cached summaries are regenerated.
+SUMMARY_PROMPT_VERSION = 1
+SUMMARY_MODES = {'sampled', 'map_reduce'}
+DEFAULT_MAP_REDUCE_CHUNK_CHARS = 3000
+OPENAI_SUMMARY_INSTRUCTIONS = (
+    'You are a careful book summarizer. Summaries must stay grounded in the source text, '
+    'read naturally, and avoid made-up plot points or unsupported claims.'
+)
+KEYWORD_STRIP_CHARS = '.,!?";:()[]{}'
 COMMON_STOP_WORDS = {
     'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is',
     'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
@@ -113,6 +271,16 @@ def parse_positive_int(value, param_name, default=None):
     return parsed
 
 
+def parse_non_negative_int(value, param_name):
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f'{param_name} must be a whole number.') from exc
+    if parsed < 0:
+        raise ValueError(f'{param_name} cannot be negative.')
+    return parsed
+
+
 def get_book_pdf_source(book):
     if book.pdf_document:
         return book.pdf_document.path
@@ -122,28 +290,75 @@ def get_book_pdf_source(book):
 
 
 def get_audio_storage_dir():
-    return os.path.join(settings.BASE_DIR, 'media', 'audio')
+    return os.path.join(settings.MEDIA_ROOT, 'media', 'audio')
 
 
-def build_media_url(request, *parts):
+def build_media_path(*parts):
     relative_path = '/'.join(str(part).strip('/') for part in parts if part is not None)
     media_prefix = settings.MEDIA_URL.rstrip('/')
     if media_prefix:
-        return request.build_absolute_uri(f'{media_prefix}/{relative_path}')
-    return request.build_absolute_uri(f'/{relative_path}')
+        return f'{media_prefix}/{relative_path}'
+    return f'/{relative_path}'
+
+
+def build_media_url(request, *parts):
+    return request.build_absolute_uri(build_media_path(*parts))
+
+
+def build_artifact_version(*inputs):
+    """Short digest of everything a derived artifact is built from; it changes only when those inputs do."""
+    digest = hashlib.sha256()
+    for part in inputs:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
 
+def build_audio_cache_filename(book, audio_kind, *extra_parts, source=''):
+    """Name the cached audio for ``book`` by its inputs rather than ``updated_at``.
 
-def build_audio_cache_filename(book, audio_kind, *extra_parts):
-    version = int(book.updated_at.timestamp()) if getattr(book, 'updated_at', None) else 0
-    parts = [f'book_{book.id}', audio_kind, *[str(part) for part in extra_parts], f'v{version}']
+    ``source`` identifies the narrated text (a PDF content hash, or a hash of the summary); together with the
+    kind, page range and narration settings it forms the version, so unrelated book saves keep the cache.
+    """
+    extra_parts = [str(part) for part in extra_parts]
+    version = build_artifact_version(audio_kind, *extra_parts, source, *AudioProcessor.get_narration_signature())
+    parts = [f'book_{book.id}', audio_kind, *extra_parts, f'v{version}']
     return '_'.join(part for part in parts if part) + '.mp3'
 
 
-def get_cached_audio_url(request, filename):
-    audio_path = os.path.join(get_audio_storage_dir(), filename)
-    if os.path.exists(audio_path):
-        return audio_path, build_media_url(request, 'audio', filename)
-    return None, None
+def build_summary_audio_filename(book, summary):
+    # Summary audio is narrated from the summary alone, so the summary text is its source.
+    return build_audio_cache_filename(
+        book,
+        'ai_summary_audio',
+        source=hashlib.sha256((summary or '').encode('utf-8')).hexdigest(),
+    )
+
+
+def build_playlist_url(audio_url):
+    """The HLS playlist published beside a cached MP3 (see ``serve_audio``)."""
+    if audio_url and audio_url.endswith('.mp3'):
+        return audio_url[:-len('.mp3')] + '.m3u8'
+    return None
+
+
+def get_audio_filename_from_url(audio_url):
+    """The cache filename a stored audio URL points at."""
+    return os.path.basename(urlparse(audio_url).path) if audio_url else ''
+
+
+def synthesize_cached_audio(text, filename, segment_breaks=None):
+    """Narrate ``text`` into the audio cache under ``filename``; returns ``(audio_error, audio_status, audio_provider)``."""
+    audio_error, audio_status, audio_provider = AudioProcessor.text_to_speech_to_file(
+        text,
+        AudioCache.get_path(filename),
+        segment_breaks=segment_breaks,
+    )
+    if not audio_error:
+        AudioCache.discard_playlist(AudioCache.get_path(filename))
+        AudioCache.record_store()
+        AudioCache.schedule_sweep()
+    return audio_error, audio_status, audio_provider
 
 
 def normalize_page_range(start_page, end_page, page_count, max_pages=None):
@@ -179,6 +394,295 @@ def split_into_sentences(text):
     return [sentence.strip() for sentence in re.split(r'(?<=[.!?])\s+', text.strip()) if sentence.strip()]
 
 
+def join_page_texts(page_texts):
+    return ' '.join(part.strip() for part in page_texts if part and part.strip()).strip()
+
+
+def compute_file_sha256(file_path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as source:
+        for chunk in iter(lambda: source.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def exclusive_file_lock(lock_path):
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def write_json_atomic(file_path, payload):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(file_path), suffix='.tmp', delete=False) as temp_file:
+        json.dump(payload, temp_file)
+    os.replace(temp_file.name, file_path)
+
+
+@contextmanager
+def atomic_output_file(file_path):
+    """Yield a binary temp file beside ``file_path`` that replaces it only once fully written and fsynced.
+
+    Readers see either the previous file or the complete new one; if the block raises, the temp file is removed.
+    """
+    directory = os.path.dirname(file_path)
+    os.makedirs(directory, exist_ok=True)
+    temp_file = tempfile.NamedTemporaryFile(dir=directory, suffix='.part', delete=False)
+    try:
+        with temp_file:
+            yield temp_file
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_file.name, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_file.name)
+        except OSError:
+            pass
+        raise
+
+
+_PDF_CONTENT_HASHES = OrderedDict()
+_PDF_CONTENT_HASHES_LOCK = threading.Lock()
+
+
+def get_pdf_content_hash(file_path, memoize=True):
+    if not memoize:
+        return compute_file_sha256(file_path)
+
+    # Hashing a large PDF is cheap compared to parsing it, but still worth skipping when the file is unchanged.
+    stat_result = os.stat(file_path)
+    cache_key = (os.path.abspath(file_path), stat_result.st_size, stat_result.st_mtime_ns)
+    with _PDF_CONTENT_HASHES_LOCK:
+        content_hash = _PDF_CONTENT_HASHES.get(cache_key)
+        if content_hash is not None:
+            _PDF_CONTENT_HASHES.move_to_end(cache_key)
+            return content_hash
+
+    content_hash = compute_file_sha256(file_path)
+    with _PDF_CONTENT_HASHES_LOCK:
+        _PDF_CONTENT_HASHES[cache_key] = content_hash
+        _PDF_CONTENT_HASHES.move_to_end(cache_key)
+        # Replaced or re-uploaded files leave old keys behind, so keep only the most recently used.
+        while len(_PDF_CONTENT_HASHES) > PDF_CONTENT_HASH_CACHE_SIZE:
+            _PDF_CONTENT_HASHES.popitem(last=False)
+    return content_hash
+
+
+def parse_range_header(range_header, file_size):
+    """Parse ``Range: bytes=...`` into merged, inclusive ``(start, end)`` pairs.
+
+    Returns ``None`` when the header is absent or malformed (serve the whole file)
+    and an empty list when none of the requested ranges can be satisfied.
+    """
+    if not range_header:
+        return None
+    units, _, range_set = range_header.partition('=')
+    if units.strip().lower() != 'bytes' or not range_set.strip():
+        return None
+
+    ranges = []
+    for spec in range_set.split(','):
+        spec = spec.strip()
+        if not spec:
+            continue
+        start_text, separator, end_text = spec.partition('-')
+        if not separator:
+            return None
+        try:
+            if not start_text.strip():
+                suffix_length = int(end_text)
+                if suffix_length <= 0 or file_size <= 0:
+                    continue
+                start, end = max(0, file_size - suffix_length), file_size - 1
+            else:
+                start = int(start_text)
+                end = int(end_text) if end_text.strip() else file_size - 1
+                if start < 0 or end < start:
+                    return None
+                if start >= file_size:
+                    continue
+                end = min(end, file_size - 1)
+        except ValueError:
+            return None
+        ranges.append((start, end))
+
+    if len(ranges) > MAX_BYTE_RANGES:
+        return None
+
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def if_range_matches(if_range, etag, last_modified):
+    if not if_range:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('W/'):
+        # If-Range requires a strong comparison, so weak validators never match.
+        return False
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == int(last_modified)
+
+
+def iter_file_range(file_path, start, end, chunk_size=FILE_STREAM_CHUNK_SIZE):
+    with open(file_path, 'rb') as source:
+        source.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = source.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def iter_multipart_ranges(file_path, ranges, part_headers, closing):
+    for (start, end), header in zip(ranges, part_headers):
+        yield header
+        yield from iter_file_range(file_path, start, end)
+        yield b'\r\n'
+    yield closing
+
+
+def get_sendfile_mode():
+    return (getattr(settings, 'FILE_SENDFILE_MODE', '') or '').strip().lower()
+
+
+def build_sendfile_response(file_path, content_type):
+    mode = get_sendfile_mode()
+    response = HttpResponse(content_type=content_type)
+    if mode == 'x-accel-redirect':
+        relative_path = os.path.relpath(file_path, settings.MEDIA_ROOT).replace(os.sep, '/')
+        prefix = getattr(settings, 'FILE_ACCEL_REDIRECT_PREFIX', '/protected-media/').rstrip('/')
+        response['X-Accel-Redirect'] = quote(f'{prefix}/{relative_path}')
+    else:
+        response['X-Sendfile'] = file_path
+    return response
+
+
+def build_file_response(request, file_path, content_type, etag=None, cache_control='private, max-age=0, must-revalidate', filename=None):
+    """Serve a local file with validators, 304 handling and single or multi-range 206 responses."""
+    stat_result = os.stat(file_path)
+    file_size = stat_result.st_size
+    last_modified = int(stat_result.st_mtime)
+    if etag is None:
+        etag = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+    def apply_common_headers(response):
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        response['Cache-Control'] = cache_control
+        response['Accept-Ranges'] = 'bytes'
+        if filename and response.status_code < 300:
+            response['Content-Disposition'] = content_disposition_header(False, filename)
+        return response
+
+    conditional_response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if conditional_response is not None:
+        return apply_common_headers(conditional_response)
+
+    if get_sendfile_mode() in {'x-accel-redirect', 'x-sendfile'}:
+        # The front-end server handles Range requests itself once it owns the file.
+        return apply_common_headers(build_sendfile_response(file_path, content_type))
+
+    ranges = None
+    if request.method in {'GET', 'HEAD'} and if_range_matches(request.META.get('HTTP_IF_RANGE'), etag, last_modified):
+        ranges = parse_range_header(request.META.get('HTTP_RANGE'), file_size)
+
+    if ranges is None:
+        response = FileResponse(open(file_path, 'rb'), content_type=content_type)
+        return apply_common_headers(response)
+
+    if not ranges:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{file_size}'
+        return apply_common_headers(response)
+
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        response = StreamingHttpResponse(iter_file_range(file_path, start, end), status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{file_size}'
+        response['Content-Length'] = str(end - start + 1)
+        return apply_common_headers(response)
+
+    boundary = secrets.token_hex(16)
+    part_headers = [
+        (
+            f'--{boundary}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Range: bytes {start}-{end}/{file_size}\r\n\r\n'
+        ).encode('ascii')
+        for start, end in ranges
+    ]
+    closing = f'--{boundary}--\r\n'.encode('ascii')
+    content_length = sum(len(header) + (end - start + 1) + 2 for header, (start, end) in zip(part_headers, ranges)) + len(closing)
+    response = StreamingHttpResponse(
+        iter_multipart_ranges(file_path, ranges, part_headers, closing),
+        status=206,
+        content_type=f'multipart/byteranges; boundary={boundary}',
+    )
+    response['Content-Length'] = str(content_length)
+    return apply_common_headers(response)
+
+
+def build_page_offsets(page_counts):
+    """Build cumulative offsets from ``[(character_count, word_count), ...]`` in page order.
+
+    Character offsets index into the joined book text, where non-empty pages are
+    separated by a single space. Each list has one extra trailing entry holding the total.
+    """
+    char_offsets = []
+    word_offsets = []
+    char_position = 0
+    word_position = 0
+    for character_count, word_count in page_counts:
+        if character_count and char_position:
+            char_position += 1
+        char_offsets.append(char_position)
+        word_offsets.append(word_position)
+        char_position += character_count
+        word_position += word_count
+    char_offsets.append(char_position)
+    word_offsets.append(word_position)
+    return char_offsets, word_offsets
+
+
+def find_page_for_offset(offsets, offset):
+    """Return the 1-based page containing ``offset`` using a binary search over page start offsets."""
+    if offset < 0 or offset >= offsets[-1]:
+        raise ValueError(f'Offset must be between 0 and {max(0, offsets[-1] - 1)}.')
+    return bisect_right(offsets, offset, 0, len(offsets) - 1)
+
+
+def encode_page_cursor(page_number):
+    return base64.urlsafe_b64encode(f'p={page_number}'.encode('ascii')).decode('ascii')
+
+
+def decode_page_cursor(cursor):
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('ascii')
+        key, _, value = decoded.partition('=')
+        if key != 'p':
+            raise ValueError
+        return parse_positive_int(value, 'cursor')
+    except (UnicodeError, ValueError, TypeError) as exc:
+        raise ValueError('Invalid cursor.') from exc
+
+
 def select_balanced_chunk_indexes(total_chunks, max_chunks):
     if total_chunks <= 0:
         return []
@@ -400,79 +904,390 @@ class BookPDFView(APIView):
             pdf_path = book.pdf_document.path
             if not os.path.exists(pdf_path):
                 return Response({'detail': 'PDF file not found.'}, status=status.HTTP_404_NOT_FOUND)
-            return FileResponse(open(pdf_path, 'rb'), content_type='application/pdf')
+            return build_file_response(
+                request,
+                pdf_path,
+                'application/pdf',
+                etag=f'"{get_pdf_content_hash(pdf_path)}"',
+                cache_control=f'private, max-age={getattr(settings, "PDF_CACHE_MAX_AGE", 0)}, must-revalidate',
+                filename=os.path.basename(pdf_path),
+            )
         elif book.pdf_document_url:
             return redirect(book.pdf_document_url)
         else:
             return Response({'detail': 'No PDF available for this book.'}, status=status.HTTP_404_NOT_FOUND)
 
+@require_safe
+def serve_audio(request, path):
+    """Serve cached audio and its HLS playlists with byte ranges and long-lived caching.
+
+    Cached audio file names carry a content version, so both kinds of file are immutable. Playlists are built
+    from the MP3 frames the first time they are requested.
+    """
+    audio_dir = os.path.realpath(get_audio_storage_dir())
+    requested_path = os.path.realpath(os.path.join(audio_dir, path))
+    if not requested_path.startswith(audio_dir + os.sep):
+        raise Http404('Audio file not found.')
+
+    is_playlist = requested_path.endswith('.m3u8')
+    audio_path = requested_path[:-len('.m3u8')] + '.mp3' if is_playlist else requested_path
+    if not audio_path.endswith('.mp3'):
+        raise Http404('Audio file not found.')
+    if not os.path.isfile(audio_path) and os.path.dirname(audio_path) == audio_dir:
+        # URLs saved before sharding point at the flat directory.
+        audio_path = AudioCache.lookup(os.path.basename(audio_path))
+    if not audio_path or not os.path.isfile(audio_path):
+        raise Http404('Audio file not found.')
+    AudioCache._touch(audio_path)
+
+    cache_control = f'public, max-age={getattr(settings, "AUDIO_CACHE_MAX_AGE", 31536000)}, immutable'
+    if is_playlist:
+        playlist_path = AudioCache.ensure_playlist(audio_path)
+        if not playlist_path:
+            raise Http404('Audio file not found.')
+        return build_file_response(request, playlist_path, 'application/vnd.apple.mpegurl', cache_control=cache_control)
+    return build_file_response(request, audio_path, 'audio/mpeg', cache_control=cache_control)
+
+class RemotePDFCache:
+    """Content-addressed on-disk cache for remote PDFs, shared by every worker on the host"""
+
+    @staticmethod
+    def is_enabled():
+        return getattr(settings, 'PDF_DOWNLOAD_CACHE_MAX_BYTES', 0) > 0
+
+    @staticmethod
+    def get_cache_dir():
+        return getattr(settings, 'PDF_DOWNLOAD_CACHE_DIR', '') or os.path.join(settings.MEDIA_ROOT, 'media', 'pdf_cache')
+
+    @staticmethod
+    def _blob_path(content_hash):
+        return os.path.join(RemotePDFCache.get_cache_dir(), 'blobs', f'{content_hash}.pdf')
+
+    @staticmethod
+    def _metadata_path(pdf_url):
+        url_key = hashlib.sha256(pdf_url.encode('utf-8')).hexdigest()
+        return os.path.join(RemotePDFCache.get_cache_dir(), 'urls', f'{url_key}.json')
+
+    @staticmethod
+    def _read_metadata(metadata_path):
+        try:
+            with open(metadata_path, 'r') as metadata_file:
+                return json.load(metadata_file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _touch(blob_path):
+        # Access time drives LRU eviction; set it explicitly because many hosts mount with noatime.
+        try:
+            os.utime(blob_path, (time.time(), os.stat(blob_path).st_mtime))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _store_response(response):
+        blob_dir = os.path.join(RemotePDFCache.get_cache_dir(), 'blobs')
+        os.makedirs(blob_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        temp_file = tempfile.NamedTemporaryFile(dir=blob_dir, suffix='.part', delete=False)
+        try:
+            with temp_file:
+                for chunk in response.iter_content(chunk_size=65536):
+                    if chunk:
+                        digest.update(chunk)
+                        temp_file.write(chunk)
+                        size += len(chunk)
+            content_hash = digest.hexdigest()
+            blob_path = RemotePDFCache._blob_path(content_hash)
+            os.replace(temp_file.name, blob_path)
+            return content_hash, blob_path, size
+        except Exception:
+            try:
+                os.unlink(temp_file.name)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def fetch(pdf_url):
+        """Return ``(local_path, content_hash)`` for a remote PDF, downloading only when it changed."""
+        parsed_url = urlparse(pdf_url)
+        if parsed_url.scheme not in {'http', 'https'}:
+            raise ValueError('Only http and https PDF URLs are supported.')
+
+        metadata_path = RemotePDFCache._metadata_path(pdf_url)
+        with exclusive_file_lock(f'{metadata_path}.lock'):
+            metadata = RemotePDFCache._read_metadata(metadata_path) or {}
+            content_hash = metadata.get('content_hash')
+            blob_path = RemotePDFCache._blob_path(content_hash) if content_hash else None
+            if blob_path and not os.path.exists(blob_path):
+                blob_path = None
+
+            revalidate_after = getattr(settings, 'PDF_DOWNLOAD_CACHE_REVALIDATE_SECONDS', 300)
+            if blob_path and time.time() - metadata.get('validated_at', 0) < revalidate_after:
+                RemotePDFCache._touch(blob_path)
+                return blob_path, content_hash
+
+            headers = {}
+            if blob_path and metadata.get('etag'):
+                headers['If-None-Match'] = metadata['etag']
+            if blob_path and metadata.get('last_modified'):
+                headers['If-Modified-Since'] = metadata['last_modified']
+
+            try:
+                with requests.get(pdf_url, headers=headers, timeout=DEFAULT_HTTP_TIMEOUT, stream=True) as response:
+                    if blob_path and response.status_code == 304:
+                        metadata['validated_at'] = time.time()
+                        write_json_atomic(metadata_path, metadata)
+                        RemotePDFCache._touch(blob_path)
+                        return blob_path, content_hash
+
+                    response.raise_for_status()
+                    content_hash, blob_path, size = RemotePDFCache._store_response(response)
+                    write_json_atomic(metadata_path, {
+                        'url': pdf_url,
+                        'content_hash': content_hash,
+                        'size': size,
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                        'validated_at': time.time(),
+                    })
+            except requests.RequestException as exc:
+                if not blob_path:
+                    raise
+                logger.warning(f'Serving cached copy of {pdf_url} after revalidation failed: {str(exc)}')
+                RemotePDFCache._touch(blob_path)
+                return blob_path, content_hash
+
+        RemotePDFCache.enforce_budget(keep_paths={blob_path})
+        return blob_path, content_hash
+
+    @staticmethod
+    def enforce_budget(max_bytes=None, keep_paths=()):
+        if max_bytes is None:
+            max_bytes = getattr(settings, 'PDF_DOWNLOAD_CACHE_MAX_BYTES', 0)
+        blob_dir = os.path.join(RemotePDFCache.get_cache_dir(), 'blobs')
+        if max_bytes <= 0 or not os.path.isdir(blob_dir):
+            return []
+
+        evicted = []
+        with exclusive_file_lock(os.path.join(RemotePDFCache.get_cache_dir(), 'evict.lock')):
+            entries = []
+            for entry in os.scandir(blob_dir):
+                if entry.is_file() and entry.name.endswith('.pdf'):
+                    stat_result = entry.stat()
+                    entries.append((stat_result.st_atime, stat_result.st_size, entry.path))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= max_bytes:
+                    break
+                if path in keep_paths:
+                    continue
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total_size -= size
+                evicted.append(path)
+
+        return evicted
+
+class ResolvedPDF:
+    """A PDF ready to open with PyMuPDF: a local file, or downloaded bytes held in memory"""
+
+    def __init__(self, path=None, data=None, temp_path=None, content_hash=None):
+        self.path = path
+        self.data = data
+        self.temp_path = temp_path
+        self.content_hash = content_hash
+        self._mappings = []
+
+    def get_content_hash(self):
+        if not self.content_hash:
+            self.content_hash = get_pdf_content_hash(self.path, memoize=self.temp_path is None)
+        return self.content_hash
+
+    def _map_file(self):
+        source = open(self.path, 'rb')
+        try:
+            mapping = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            source.close()
+            return None
+        view = memoryview(mapping)
+        self._mappings.append((view, mapping, source))
+        return view
+
+    def open(self, fitz_module):
+        if self.data is not None:
+            return fitz_module.open(stream=self.data, filetype='pdf')
+        if getattr(settings, 'PDF_MMAP_LOCAL_FILES', True):
+            # A read-only mapping lets concurrent workers share the same page-cache pages.
+            view = self._map_file()
+            if view is not None:
+                return fitz_module.open(stream=view, filetype='pdf')
+        return fitz_module.open(self.path)
+
+    def release(self):
+        # Documents opened from a mapping must be closed before this is called.
+        while self._mappings:
+            view, mapping, source = self._mappings.pop()
+            view.release()
+            mapping.close()
+            source.close()
+        self.data = None
+        if self.temp_path:
+            try:
+                os.unlink(self.temp_path)
+            except OSError:
+                pass
+            self.temp_path = None
+
 class PDFProcessor:
     """Utility class for processing PDFs from both local files and URLs"""
 
     @staticmethod
-    def _download_pdf_to_tempfile(pdf_url):
+    def _download_pdf(pdf_url):
+        """Download a remote PDF into memory, spilling to a temp file once it passes ``PDF_IN_MEMORY_MAX_BYTES``."""
         parsed_url = urlparse(pdf_url)
         if parsed_url.scheme not in {'http', 'https'}:
             raise ValueError('Only http and https PDF URLs are supported.')
 
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
+        max_in_memory = getattr(settings, 'PDF_IN_MEMORY_MAX_BYTES', 0)
+        digest = hashlib.sha256()
+        buffer = io.BytesIO()
+        temp_file = None
         try:
             with requests.get(pdf_url, timeout=DEFAULT_HTTP_TIMEOUT, stream=True) as response:
                 response.raise_for_status()
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        temp_file.write(chunk)
-            temp_file.close()
-            return temp_file.name
+                declared_size = int(response.headers.get('Content-Length') or 0)
+                if declared_size > max_in_memory:
+                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
+                for chunk in response.iter_content(chunk_size=65536):
+                    if not chunk:
+                        continue
+                    digest.update(chunk)
+                    if temp_file is None and buffer.tell() + len(chunk) > max_in_memory:
+                        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
+                        temp_file.write(buffer.getbuffer())
+                        buffer = io.BytesIO()
+                    (temp_file or buffer).write(chunk)
+
+            if temp_file is not None:
+                temp_file.close()
+                return ResolvedPDF(path=temp_file.name, temp_path=temp_file.name, content_hash=digest.hexdigest())
+            return ResolvedPDF(data=buffer.getbuffer(), content_hash=digest.hexdigest())
         except Exception:
-            temp_file.close()
-            try:
-                os.unlink(temp_file.name)
-            except OSError:
-                pass
+            if temp_file is not None:
+                temp_file.close()
+                try:
+                    os.unlink(temp_file.name)
+                except OSError:
+                    pass
             raise
 
     @staticmethod
-    def _open_document(pdf_source, fitz_module):
-        temp_path = None
+    def resolve_source(pdf_source):
+        """Return a ``ResolvedPDF`` for a local path or URL; the caller must ``release()`` it."""
         if isinstance(pdf_source, str) and pdf_source.startswith(('http://', 'https://')):
-            temp_path = PDFProcessor._download_pdf_to_tempfile(pdf_source)
-            return fitz_module.open(temp_path), temp_path
+            if RemotePDFCache.is_enabled():
+                cached_path, content_hash = RemotePDFCache.fetch(pdf_source)
+                return ResolvedPDF(path=cached_path, content_hash=content_hash)
+            return PDFProcessor._download_pdf(pdf_source)
 
         if not os.path.exists(pdf_source):
             raise FileNotFoundError('PDF file not found.')
 
-        return fitz_module.open(pdf_source), temp_path
+        return ResolvedPDF(path=pdf_source)
+
+    @staticmethod
+    def _resolve(pdf_source):
+        """Return ``(resolved, owned)``; callers release only the resolutions they own."""
+        if isinstance(pdf_source, ResolvedPDF):
+            return pdf_source, False
+        return PDFProcessor.resolve_source(pdf_source), True
+
+    @staticmethod
+    def _release_document(doc, resolved, owned=True):
+        if doc is not None:
+            doc.close()
+        if resolved is not None and owned:
+            resolved.release()
 
     @staticmethod
     def _extract_page_text(page):
-        page_text = page.get_text('text')
-        if page_text.strip():
-            return page_text
+        return extract_page_text(page)
+
+    @staticmethod
+    def get_extraction_worker_count():
+        return getattr(settings, 'PDF_EXTRACTION_WORKERS', 0) or get_default_worker_count()
+
+    @staticmethod
+    def should_extract_in_parallel(page_total, worker_count=None):
+        worker_count = worker_count or PDFProcessor.get_extraction_worker_count()
+        min_pages = getattr(settings, 'PDF_PARALLEL_EXTRACTION_MIN_PAGES', 200)
+        return worker_count > 1 and min_pages > 0 and page_total >= min_pages
+
+    @staticmethod
+    def _extract_pages(doc, local_path, page_numbers):
+        # Pool workers open the file themselves, so documents held only in memory are extracted serially.
+        if local_path and PDFProcessor.should_extract_in_parallel(len(page_numbers)):
+            try:
+                return extract_pages_parallel(local_path, page_numbers, PDFProcessor.get_extraction_worker_count())
+            except Exception as exc:
+                logger.warning(f'Parallel PDF extraction failed, falling back to serial extraction: {str(exc)}')
 
-        blocks = page.get_text('blocks')
-        block_texts = [block[4] for block in blocks if isinstance(block[4], str)]
-        return ' '.join(block_texts)
+        return {
+            page_number: PDFProcessor._extract_page_text(doc.load_page(page_number - 1))
+            for page_number in page_numbers
+        }
 
     @staticmethod
     def extract_text_from_page_range(pdf_source, start_page=1, end_page=None, max_pages=None):
-        fitz = load_pymupdf()
         doc = None
-        temp_path = None
+        resolved = None
+        owned = False
 
         try:
-            doc, temp_path = PDFProcessor._open_document(pdf_source, fitz)
-            page_count = doc.page_count
-            normalized_start, normalized_end = normalize_page_range(start_page, end_page, page_count, max_pages=max_pages)
-
-            page_texts = []
-            for page_num in range(normalized_start - 1, normalized_end):
-                page = doc.load_page(page_num)
-                page_texts.append(PDFProcessor._extract_page_text(page))
-
-            text = ' '.join(part.strip() for part in page_texts if part and part.strip()).strip()
+            resolved, owned = PDFProcessor._resolve(pdf_source)
+            content_hash = resolved.get_content_hash()
+
+            page_count = PageTextStore.get_page_count(content_hash)
+            page_texts = {}
+            if page_count:
+                normalized_start, normalized_end = normalize_page_range(start_page, end_page, page_count, max_pages=max_pages)
+                page_texts = PageTextStore.load_pages(content_hash, normalized_start, normalized_end)
+
+            if not page_count or len(page_texts) < (normalized_end - normalized_start + 1):
+                fitz = load_pymupdf()
+                doc = resolved.open(fitz)
+                page_count = doc.page_count
+                normalized_start, normalized_end = normalize_page_range(start_page, end_page, page_count, max_pages=max_pages)
+
+                missing_pages = [
+                    page_number
+                    for page_number in range(normalized_start, normalized_end + 1)
+                    if page_number not in page_texts
+                ]
+                extracted_pages = PDFProcessor._extract_pages(doc, resolved.path, missing_pages)
+
+                page_texts.update(extracted_pages)
+                PageTextStore.save_pages(content_hash, page_count, extracted_pages)
+
+            text = join_page_texts(page_texts[page_number] for page_number in range(normalized_start, normalized_end + 1))
+            page_offsets = []
+            position = 0
+            for page_number in range(normalized_start, normalized_end + 1):
+                page_length = len((page_texts[page_number] or '').strip())
+                if page_length:
+                    page_offsets.append(position)
+                    position += page_length + 1
             return {
                 'text': text,
+                'content_hash': content_hash,
+                'page_offsets': page_offsets,
                 'page_count': page_count,
                 'start_page': normalized_start,
                 'end_page': normalized_end,
@@ -480,144 +1295,822 @@ class PDFProcessor:
                 'word_count': len(text.split()),
             }
         finally:
-            if doc is not None:
-                doc.close()
-            if temp_path:
-                try:
-                    os.unlink(temp_path)
-                except OSError:
-                    pass
+            PDFProcessor._release_document(doc, resolved, owned)
 
     @staticmethod
-    def extract_text_from_pdf(pdf_source):
-        result = PDFProcessor.extract_text_from_page_range(pdf_source)
-        return result['text'], result['page_count'], None
+    def stream_page_range(pdf_source, start_page=1, end_page=None, max_pages=None, batch_size=PAGE_STREAM_BATCH_SIZE):
+        """Validate the page range up front and return a lazy ``(page_number, text)`` iterator.
 
-class AIProcessor:
-    """Utility class for AI-related processing"""
+        Only one batch of pages is held in memory at a time; pages missing from the
+        page text store are extracted as they are reached and written back per batch.
+        """
+        doc = None
+        resolved, owned = PDFProcessor._resolve(pdf_source)
+        try:
+            content_hash = resolved.get_content_hash()
+            page_count = PageTextStore.get_page_count(content_hash)
+            if not page_count:
+                doc = resolved.open(load_pymupdf())
+                page_count = doc.page_count
+            normalized_start, normalized_end = normalize_page_range(start_page, end_page, page_count, max_pages=max_pages)
+        except Exception:
+            PDFProcessor._release_document(doc, resolved, owned)
+            raise
+
+        def generate_pages():
+            nonlocal doc
+            try:
+                for batch_start in range(normalized_start, normalized_end + 1, batch_size):
+                    batch_end = min(normalized_end, batch_start + batch_size - 1)
+                    stored_pages = PageTextStore.load_pages(content_hash, batch_start, batch_end)
+                    extracted_pages = {}
+                    for page_number in range(batch_start, batch_end + 1):
+                        page_text = stored_pages.get(page_number)
+                        if page_text is None:
+                            if doc is None:
+                                doc = resolved.open(load_pymupdf())
+                            page_text = PDFProcessor._extract_page_text(doc.load_page(page_number - 1))
+                            extracted_pages[page_number] = page_text
+                        yield page_number, page_text
+                    PageTextStore.save_pages(content_hash, page_count, extracted_pages)
+            finally:
+                PDFProcessor._release_document(doc, resolved, owned)
+
+        return {
+            'page_count': page_count,
+            'start_page': normalized_start,
+            'end_page': normalized_end,
+            'pages': generate_pages(),
+        }
 
     @staticmethod
-    def chunk_text(text, max_chunk_size=4000):
-        """Split text into chunks for processing"""
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_size = 0
-        
-        for word in words:
-            word_size = len(word) + 1  # +1 for space
-            if current_size + word_size > max_chunk_size and current_chunk:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_size = word_size
-            else:
-                current_chunk.append(word)
-                current_size += word_size
-        
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
-        
-        return chunks
+    def analyze_page_range(pdf_source, start_page=1, end_page=None):
+        """Compute analytics in one pass over the page stream without joining the book text."""
+        page_stream = PDFProcessor.stream_page_range(pdf_source, start_page=start_page, end_page=end_page)
+        accumulator = BookAnalyticsAccumulator()
+        for page_number, page_text in page_stream['pages']:
+            accumulator.add_page(page_number, page_text)
+        return accumulator.as_analytics(page_stream['page_count'])
 
     @staticmethod
-    def clean_generated_text(text):
-        cleaned = re.sub(r'\s+', ' ', (text or '')).strip()
-        return cleaned.strip('"').strip()
+    def get_page_count(pdf_source):
+        doc = None
+        resolved, owned = PDFProcessor._resolve(pdf_source)
+        try:
+            page_count = PageTextStore.get_page_count(resolved.get_content_hash())
+            if not page_count:
+                doc = resolved.open(load_pymupdf())
+                page_count = doc.page_count
+            return page_count
+        finally:
+            PDFProcessor._release_document(doc, resolved, owned)
 
     @staticmethod
-    def build_summary_source_text(text, max_input_chars=MAX_SUMMARY_SOURCE_CHARS, max_chunks=SUMMARY_SAMPLE_CHUNKS):
-        normalized = re.sub(r'\s+', ' ', (text or '')).strip()
-        if not normalized:
-            return '', False
+    def get_page_offset_index(pdf_source):
+        """Return ``(content_hash, index)``, extracting the whole book first if its index is not built yet."""
+        resolved, owned = PDFProcessor._resolve(pdf_source)
+        try:
+            content_hash = resolved.get_content_hash()
+            index = PageTextStore.get_offset_index(content_hash)
+            if index is None:
+                PDFProcessor.extract_text_from_page_range(resolved)
+                index = PageTextStore.get_offset_index(content_hash)
+            if index is None:
+                raise RuntimeError('Unable to build the page offset index for this PDF.')
+            return content_hash, index
+        finally:
+            PDFProcessor._release_document(None, resolved, owned)
 
-        if len(normalized) <= max_input_chars:
-            return normalized, False
+    @staticmethod
+    def extract_text_from_pdf(pdf_source):
+        result = PDFProcessor.extract_text_from_page_range(pdf_source)
+        return result['text'], result['page_count'], None
 
-        target_chunk_size = max(1800, max_input_chars // max(1, max_chunks))
-        chunks = AIProcessor.chunk_text(normalized, max_chunk_size=target_chunk_size)
-        selected_indexes = select_balanced_chunk_indexes(len(chunks), max_chunks)
-        separator_length = max(0, (len(selected_indexes) - 1) * 2)
-        per_chunk_limit = max(350, (max_input_chars - separator_length) // max(1, len(selected_indexes)))
-        selected_chunks = []
+class PageTextStore:
+    """Persistent per-page text store keyed by the SHA-256 of the PDF bytes"""
 
-        for position, index in enumerate(selected_indexes):
-            chunk = chunks[index]
-            if len(chunk) <= per_chunk_limit:
-                selected_chunks.append(chunk)
-                continue
+    @staticmethod
+    def compress_text(text):
+        return zlib.compress(text.encode('utf-8'), 6)
 
-            if position == 0:
-                trimmed_chunk = chunk[:per_chunk_limit].rsplit(' ', 1)[0].strip()
-            elif position == len(selected_indexes) - 1:
-                trimmed_chunk = chunk[-per_chunk_limit:].split(' ', 1)[-1].strip()
-            else:
-                midpoint = len(chunk) // 2
-                half_window = per_chunk_limit // 2
-                start = max(0, midpoint - half_window)
-                end = min(len(chunk), start + per_chunk_limit)
-                trimmed_chunk = chunk[start:end].strip()
-                if ' ' in trimmed_chunk:
-                    trimmed_chunk = trimmed_chunk.split(' ', 1)[-1].rsplit(' ', 1)[0].strip()
+    @staticmethod
+    def decompress_text(payload):
+        return zlib.decompress(bytes(payload)).decode('utf-8')
 
-            selected_chunks.append(trimmed_chunk or chunk[:per_chunk_limit].strip())
+    @staticmethod
+    def get_page_count(content_hash):
+        try:
+            return PdfTextDocument.objects.filter(content_hash=content_hash).values_list('page_count', flat=True).first() or 0
+        except Exception as exc:
+            logger.warning(f'Page text store lookup failed: {str(exc)}')
+            return 0
 
-        combined = '\n\n'.join(selected_chunks).strip()
-        if len(combined) > max_input_chars:
-            combined = combined[:max_input_chars].rsplit(' ', 1)[0].strip()
+    @staticmethod
+    def load_pages(content_hash, start_page, end_page):
+        try:
+            rows = PdfPageText.objects.filter(
+                document__content_hash=content_hash,
+                page_number__gte=start_page,
+                page_number__lte=end_page,
+            ).values_list('page_number', 'text')
+            return {page_number: PageTextStore.decompress_text(payload) for page_number, payload in rows}
+        except Exception as exc:
+            logger.warning(f'Page text store read failed: {str(exc)}')
+            return {}
 
-        return combined, True
+    @staticmethod
+    def save_pages(content_hash, page_count, page_texts):
+        if not page_texts:
+            return
+        try:
+            document, _ = PdfTextDocument.objects.get_or_create(
+                content_hash=content_hash,
+                defaults={'page_count': page_count},
+            )
+            PdfPageText.objects.bulk_create(
+                [
+                    PdfPageText(
+                        document=document,
+                        page_number=page_number,
+                        text=PageTextStore.compress_text(page_text),
+                        character_count=len(page_text.strip()),
+                        word_count=len(page_text.split()),
+                    )
+                    for page_number, page_text in page_texts.items()
+                ],
+                ignore_conflicts=True,
+            )
+            if not document.char_offsets:
+                PageTextStore.build_offset_index(document)
+        except Exception as exc:
+            logger.warning(f'Page text store write failed: {str(exc)}')
 
     @staticmethod
-    def build_summary_prompt(book, source_text, source_is_sampled):
-        metadata = [
-            f'Title: {book.title}',
-            f'Author: {book.author}',
-            f'Genre: {book.genre or "Unknown"}',
-            f'Published year: {book.published_year or "Unknown"}',
-        ]
-        sampling_note = (
-            'The book text below is a representative sample collected from across the book. '
-            'Do not invent details that are not supported by the provided text.'
-            if source_is_sampled
-            else 'The book text below was extracted from the available book content. Summarize it faithfully.'
+    def build_offset_index(document):
+        page_counts = list(
+            document.pages.order_by('page_number').values_list('character_count', 'word_count')
         )
+        if len(page_counts) < document.page_count:
+            return False
 
-        return (
-            'Write a clear reader-facing summary in 2 short paragraphs. '
-            'Focus on the central subject or storyline, the most important themes, and the reading tone. '
-            'Keep the summary factual, concise, and spoiler-aware.\n\n'
-            f'{sampling_note}\n\n'
-            'Book metadata:\n'
-            f'{"\n".join(metadata)}\n\n'
-            'Book text:\n'
-            f'{source_text}'
-        )
+        document.char_offsets, document.word_offsets = build_page_offsets(page_counts)
+        document.save(update_fields=['char_offsets', 'word_offsets'])
+        return True
 
     @staticmethod
-    def generate_summary_with_openai(book, source_text, source_is_sampled):
-        client = load_openai_client()
-        if client is None:
+    def get_offset_index(content_hash):
+        document = PdfTextDocument.objects.filter(content_hash=content_hash).only(
+            'page_count', 'char_offsets', 'word_offsets'
+        ).first()
+        if document is None:
+            return None
+        if not document.char_offsets and not PageTextStore.build_offset_index(document):
+            return None
+        return {
+            'page_count': document.page_count,
+            'char_offsets': document.char_offsets,
+            'word_offsets': document.word_offsets,
+        }
+
+class BookAnalyticsAccumulator:
+    """Single-pass word, character and keyword statistics over a stream of pages.
+
+    Memory grows with the vocabulary and the number of pages, never with the text
+    itself, and accumulators built over separate page shards can be merged.
+    """
+
+    def __init__(self):
+        self.word_count = 0
+        self.page_character_total = 0
+        self.non_empty_pages = 0
+        self.keyword_counts = Counter()
+        self.page_stats = {}
+
+    def add_page(self, page_number, page_text):
+        page_text = (page_text or '').strip()
+        words = page_text.split()
+        self.word_count += len(words)
+        if page_text:
+            self.page_character_total += len(page_text)
+            self.non_empty_pages += 1
+        self.keyword_counts.update(
+            token
+            for token in (word.lower().strip(KEYWORD_STRIP_CHARS) for word in words)
+            if len(token) > 3 and token not in COMMON_STOP_WORDS
+        )
+        self.page_stats[page_number] = {'characters': len(page_text), 'words': len(words)}
+        return self
+
+    def merge(self, other):
+        self.word_count += other.word_count
+        self.page_character_total += other.page_character_total
+        self.non_empty_pages += other.non_empty_pages
+        self.keyword_counts.update(other.keyword_counts)
+        self.page_stats.update(other.page_stats)
+        return self
+
+    @property
+    def character_count(self):
+        # Matches the joined book text, where non-empty pages are separated by a single space.
+        return self.page_character_total + max(0, self.non_empty_pages - 1)
+
+    def top_keywords(self, limit=10):
+        top_items = heapq.nlargest(limit, self.keyword_counts.items(), key=itemgetter(1))
+        return [{'word': word, 'frequency': frequency} for word, frequency in top_items]
+
+    def as_analytics(self, page_count, keyword_limit=10):
+        word_count = self.word_count
+        character_count = self.character_count
+        return {
+            'page_count': page_count,
+            'word_count': word_count,
+            'character_count': character_count,
+            'estimated_reading_time_minutes': estimate_minutes(word_count, 200),
+            'estimated_audio_duration_minutes': estimate_minutes(word_count, 150),
+            'top_keywords': self.top_keywords(keyword_limit),
+            'average_words_per_page': word_count // page_count if page_count > 0 else 0,
+            'average_characters_per_page': character_count // page_count if page_count > 0 else 0,
+        }
+
+def get_summarizer_model_name():
+    return getattr(settings, 'SUMMARIZER_MODEL', '') or DEFAULT_SUMMARIZER_MODEL
+
+
+def get_cpu_inference_profile():
+    return build_cpu_inference_profile(
+        threads=getattr(settings, 'SUMMARIZER_TORCH_THREADS', 0),
+        quantize=getattr(settings, 'SUMMARIZER_QUANTIZE', 'none'),
+        max_input_tokens=getattr(settings, 'SUMMARIZER_MAX_INPUT_TOKENS', 0),
+        inference_mode=getattr(settings, 'SUMMARIZER_INFERENCE_MODE', True),
+    )
+
+
+def get_summarizer_batch_size():
+    return max(1, int(getattr(settings, 'SUMMARIZER_BATCH_SIZE', 8)))
+
+
+def estimate_pipeline_bytes(summarizer):
+    model = getattr(summarizer, 'model', None)
+    if model is None or not hasattr(model, 'parameters'):
+        return 0
+    return sum(parameter.numel() * parameter.element_size() for parameter in model.parameters())
+
+
+class SummarizerModelRegistry:
+    """Process-wide registry that loads each summarization pipeline once and shares it between requests"""
+
+    _lock = threading.Lock()
+    _load_locks = {}
+    _models = OrderedDict()
+    _reaper = None
+
+    @classmethod
+    def get(cls, model_name=None):
+        model_name = model_name or get_summarizer_model_name()
+        cls.evict_idle()
+        with cls._lock:
+            entry = cls._touch_locked(model_name)
+            if entry is not None:
+                return entry['pipeline']
+            load_lock = cls._load_locks.setdefault(model_name, threading.Lock())
+
+        # Loading takes seconds, so only requests for the same model wait on each other.
+        with load_lock:
+            with cls._lock:
+                entry = cls._touch_locked(model_name)
+                if entry is not None:
+                    return entry['pipeline']
+
+            pipeline, torch = load_summarization_stack()
+            use_gpu = torch.cuda.is_available()
+            summarizer = pipeline(
+                'summarization',
+                model=model_name,
+                device=0 if use_gpu else -1,
+            )
+            if not use_gpu:
+                summarizer = apply_cpu_inference_profile(summarizer, torch, get_cpu_inference_profile())
+            with cls._lock:
+                cls._models[model_name] = {
+                    'pipeline': summarizer,
+                    'size_bytes': estimate_pipeline_bytes(summarizer),
+                    'last_used': time.monotonic(),
+                }
+                evicted = cls._enforce_budget_locked(keep=model_name)
+            cls._start_reaper()
+
+        if evicted:
+            cls._free_memory()
+        return summarizer
+
+    @classmethod
+    def _touch_locked(cls, model_name):
+        entry = cls._models.get(model_name)
+        if entry is not None:
+            entry['last_used'] = time.monotonic()
+            cls._models.move_to_end(model_name)
+        return entry
+
+    @classmethod
+    def _enforce_budget_locked(cls, keep=None):
+        budget = getattr(settings, 'SUMMARIZER_MODEL_MEMORY_BUDGET_MB', 0) * 1024 * 1024
+        evicted = []
+        if budget <= 0:
+            return evicted
+        total = sum(entry['size_bytes'] for entry in cls._models.values())
+        for model_name in list(cls._models):
+            if total <= budget:
+                break
+            if model_name == keep:
+                continue
+            total -= cls._models.pop(model_name)['size_bytes']
+            evicted.append(model_name)
+        return evicted
+
+    @classmethod
+    def evict_idle(cls, idle_seconds=None):
+        if idle_seconds is None:
+            idle_seconds = getattr(settings, 'SUMMARIZER_MODEL_IDLE_SECONDS', 0)
+        if idle_seconds <= 0:
+            return []
+        cutoff = time.monotonic() - idle_seconds
+        with cls._lock:
+            evicted = [name for name, entry in cls._models.items() if entry['last_used'] < cutoff]
+            for model_name in evicted:
+                del cls._models[model_name]
+        if evicted:
+            cls._free_memory()
+        return evicted
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._models.clear()
+        cls._free_memory()
+
+    @classmethod
+    def loaded_models(cls):
+        with cls._lock:
+            return {name: entry['size_bytes'] for name, entry in cls._models.items()}
+
+    @classmethod
+    def _free_memory(cls):
+        gc.collect()
+        try:
+            torch = import_module('torch')
+        except ModuleNotFoundError:
+            return
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    @classmethod
+    def _start_reaper(cls):
+        idle_seconds = getattr(settings, 'SUMMARIZER_MODEL_IDLE_SECONDS', 0)
+        if idle_seconds <= 0 or (cls._reaper is not None and cls._reaper.is_alive()):
+            return
+
+        def reap():
+            while True:
+                time.sleep(max(30, idle_seconds / 2))
+                cls.evict_idle(idle_seconds)
+
+        cls._reaper = threading.Thread(target=reap, name='summarizer-model-reaper', daemon=True)
+        cls._reaper.start()
+
+class SummarizationBatcher:
+    """Micro-batching scheduler that groups chunk summarization calls from concurrent requests into padded batches"""
+
+    _lock = threading.Lock()
+    _batchers = {}
+
+    def __init__(self, model_name, max_batch_size, max_wait_seconds):
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.pending = queue.Queue()
+        self.worker = threading.Thread(
+            target=self.run,
+            name=f'summarizer-batcher-{model_name}',
+            daemon=True,
+        )
+        self.worker.start()
+
+    @classmethod
+    def for_model(cls, model_name):
+        with cls._lock:
+            batcher = cls._batchers.get(model_name)
+            if batcher is None:
+                batcher = cls(
+                    model_name,
+                    get_summarizer_batch_size(),
+                    getattr(settings, 'SUMMARIZER_BATCH_WAIT_MS', 25) / 1000,
+                )
+                cls._batchers[model_name] = batcher
+            return batcher
+
+    def submit(self, text, max_length, min_length):
+        future = Future()
+        self.pending.put((text, max_length, min_length, future))
+        return future
+
+    def collect_batch(self):
+        batch = [self.pending.get()]
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.pending.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def run(self):
+        while True:
+            batch = self.collect_batch()
+            try:
+                # Generation lengths are pipeline arguments, so only calls that share them can run together.
+                groups = {}
+                for item in batch:
+                    groups.setdefault((item[1], item[2]), []).append(item)
+                for (max_length, min_length), items in groups.items():
+                    self.run_group(items, max_length, min_length)
+            except Exception as exc:
+                # This thread serves every later request for the model, so it must survive, and no caller
+                # may be left waiting on a future nobody will resolve.
+                logger.error(f'Summarization batcher for {self.model_name} failed: {str(exc)}')
+                for item in batch:
+                    if not item[3].done():
+                        item[3].set_exception(exc)
+
+    def run_group(self, items, max_length, min_length):
+        items = [item for item in items if item[3].set_running_or_notify_cancel()]
+        if len(items) == 1:
+            self.run_single(items[0], max_length, min_length)
+            return
+        if not items:
+            return
+
+        # Sorting by length keeps similarly sized chunks together and cuts padding inside the batch.
+        items.sort(key=lambda item: len(item[0]))
+        try:
+            summarizer = SummarizerModelRegistry.get(self.model_name)
+            with inference_context(get_cpu_inference_profile()):
+                outputs = summarizer(
+                    [item[0] for item in items],
+                    batch_size=len(items),
+                    max_length=max_length,
+                    min_length=min_length,
+                    truncation=True,
+                    do_sample=False,
+                )
+            summaries = [output['summary_text'] for output in outputs]
+            if len(summaries) != len(items):
+                raise ValueError(f'expected {len(items)} summaries, got {len(summaries)}')
+        except Exception as exc:
+            logger.error(f'Batched summarization of {len(items)} chunks failed, retrying one by one: {str(exc)}')
+            # One bad chunk should not fail every other request that shared its batch.
+            for item in items:
+                self.run_single(item, max_length, min_length)
+            return
+
+        for item, summary in zip(items, summaries):
+            item[3].set_result(summary)
+
+    def run_single(self, item, max_length, min_length):
+        text, _, _, future = item
+        try:
+            summarizer = SummarizerModelRegistry.get(self.model_name)
+            with inference_context(get_cpu_inference_profile()):
+                summary = summarizer(
+                    text,
+                    max_length=max_length,
+                    min_length=min_length,
+                    truncation=True,
+                    do_sample=False,
+                )[0]['summary_text']
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(summary)
+
+def summarize_chunks(model_name, chunks, max_length, min_length):
+    """Summarize ``chunks`` in order; chunks that fail come back as ``None``."""
+    if get_summarizer_batch_size() <= 1:
+        summarizer = SummarizerModelRegistry.get(model_name)
+        profile = get_cpu_inference_profile()
+        summaries = []
+        for chunk in chunks:
+            try:
+                with inference_context(profile):
+                    summary = summarizer(
+                        chunk,
+                        max_length=max_length,
+                        min_length=min_length,
+                        truncation=True,
+                        do_sample=False,
+                    )[0]['summary_text']
+                summaries.append(summary)
+            except Exception as exc:
+                logger.error(f'Error summarizing chunk: {str(exc)}')
+                summaries.append(None)
+        return summaries
+
+    batcher = SummarizationBatcher.for_model(model_name)
+    futures = [batcher.submit(chunk, max_length, min_length) for chunk in chunks]
+    # A bound on the whole call, so a stuck batcher degrades to missing chunks instead of a hung request.
+    deadline = time.monotonic() + getattr(settings, 'SUMMARIZER_BATCH_RESULT_TIMEOUT_SECONDS', 300)
+    summaries = []
+    for future in futures:
+        try:
+            summaries.append(future.result(timeout=max(0, deadline - time.monotonic())))
+        except Exception as exc:
+            # Drops the chunk from the queue if it timed out before the batcher reached it.
+            future.cancel()
+            logger.error(f'Error summarizing chunk: {str(exc) or type(exc).__name__}')
+            summaries.append(None)
+    return summaries
+
+def split_text_into_stable_chunks(text, max_chunk_size=DEFAULT_MAP_REDUCE_CHUNK_CHARS):
+    """Split text on content-defined word boundaries.
+
+    A cut is made after words whose hash hits a fixed pattern, once the chunk is at least half
+    the target size. Because cut points depend on the words rather than on absolute offsets,
+    an edit early in the book only changes the chunks around it instead of shifting every later one.
+    """
+    min_chunk_size = max_chunk_size // 2
+    # Aim for cut points roughly a quarter of the target apart once past the minimum size.
+    divisor = max(1, max_chunk_size // 24)
+    chunks = []
+    current_chunk = []
+    current_size = 0
+    for word in text.split():
+        current_chunk.append(word)
+        current_size += len(word) + 1
+        at_boundary = current_size >= min_chunk_size and zlib.crc32(word.encode('utf-8')) % divisor == 0
+        if at_boundary or current_size >= max_chunk_size:
+            chunks.append(' '.join(current_chunk))
+            current_chunk = []
+            current_size = 0
+    if current_chunk:
+        chunks.append(' '.join(current_chunk))
+    return chunks
+
+
+def group_section_summaries(summaries, max_group_size=DEFAULT_MAP_REDUCE_CHUNK_CHARS):
+    """Pack consecutive summaries into groups for the next reduce level; every group holds at least two."""
+    groups = []
+    current_group = []
+    current_size = 0
+    for summary in summaries:
+        if current_group and len(current_group) >= 2 and current_size + len(summary) > max_group_size:
+            groups.append('\n\n'.join(current_group))
+            current_group = []
+            current_size = 0
+        current_group.append(summary)
+        current_size += len(summary) + 2
+    if current_group:
+        if len(current_group) == 1 and groups:
+            groups[-1] = f'{groups[-1]}\n\n{current_group[0]}'
+        else:
+            groups.append('\n\n'.join(current_group))
+    return groups
+
+class SummaryCache:
+    """Content-addressed cache of generated summaries, shared by every book with the same source text"""
+
+    _lock = threading.Lock()
+    _stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    @staticmethod
+    def get_max_entries():
+        return getattr(settings, 'SUMMARY_CACHE_MAX_ENTRIES', 20000)
+
+    @staticmethod
+    def build_key(provider, model, source):
+        digest = hashlib.sha256()
+        for part in (provider, model or '', str(SUMMARY_PROMPT_VERSION)):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(source.encode('utf-8'))
+        return digest.hexdigest()
+
+    @classmethod
+    def _count(cls, name, amount=1):
+        with cls._lock:
+            cls._stats[name] += amount
+
+    @classmethod
+    def get(cls, cache_key):
+        if cls.get_max_entries() <= 0:
+            return None
+        try:
+            entry = SummaryCacheEntry.objects.filter(cache_key=cache_key).first()
+            if entry is not None:
+                SummaryCacheEntry.objects.filter(pk=entry.pk).update(
+                    hit_count=F('hit_count') + 1,
+                    last_used_at=timezone.now(),
+                )
+        except DatabaseError as exc:
+            logger.error(f'Error reading summary cache: {str(exc)}')
+            return None
+
+        if entry is None:
+            cls._count('misses')
+            return None
+        cls._count('hits')
+        return {
+            'summary': entry.summary,
+            'provider': entry.provider,
+            'model': entry.model or None,
+            'source_is_sampled': entry.source_is_sampled,
+            'cache_hit': True,
+        }
+
+    @classmethod
+    def get_many(cls, cache_keys):
+        """Return ``{cache_key: summary}`` for the keys that are cached, using one query."""
+        if cls.get_max_entries() <= 0 or not cache_keys:
+            return {}
+        try:
+            entries = dict(
+                SummaryCacheEntry.objects.filter(cache_key__in=set(cache_keys)).values_list('cache_key', 'summary')
+            )
+            if entries:
+                SummaryCacheEntry.objects.filter(cache_key__in=entries).update(
+                    hit_count=F('hit_count') + 1,
+                    last_used_at=timezone.now(),
+                )
+        except DatabaseError as exc:
+            logger.error(f'Error reading summary cache: {str(exc)}')
+            return {}
+
+        cls._count('hits', len(entries))
+        cls._count('misses', len(set(cache_keys)) - len(entries))
+        return entries
+
+    @classmethod
+    def set(cls, cache_key, result):
+        if cls.get_max_entries() <= 0:
+            return
+        try:
+            SummaryCacheEntry.objects.update_or_create(
+                cache_key=cache_key,
+                defaults={
+                    'provider': result['provider'],
+                    'model': result.get('model') or '',
+                    'summary': result['summary'],
+                    'source_is_sampled': result.get('source_is_sampled', False),
+                    'last_used_at': timezone.now(),
+                },
+            )
+            cls._count('stores')
+            cls.enforce_limit()
+        except DatabaseError as exc:
+            logger.error(f'Error writing summary cache: {str(exc)}')
+
+    @classmethod
+    def enforce_limit(cls):
+        excess = SummaryCacheEntry.objects.count() - cls.get_max_entries()
+        if excess <= 0:
+            return 0
+        stale_ids = list(
+            SummaryCacheEntry.objects.order_by('last_used_at', 'id').values_list('id', flat=True)[:excess]
+        )
+        evicted, _ = SummaryCacheEntry.objects.filter(id__in=stale_ids).delete()
+        cls._count('evictions', evicted)
+        return evicted
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            stats = dict(cls._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['entries'] = SummaryCacheEntry.objects.count()
+        stats['max_entries'] = cls.get_max_entries()
+        return stats
+
+class AIProcessor:
+    """Utility class for AI-related processing"""
+
+    @staticmethod
+    def chunk_text(text, max_chunk_size=4000, max_tokens=None, count_tokens=None):
+        """Split text into chunks for processing, ending each chunk on a sentence boundary"""
+        return list(iter_chunks(text, max_chars=max_chunk_size, max_tokens=max_tokens, count_tokens=count_tokens))
+
+    @staticmethod
+    def clean_generated_text(text):
+        cleaned = re.sub(r'\s+', ' ', (text or '')).strip()
+        return cleaned.strip('"').strip()
+
+    @staticmethod
+    def build_summary_source_text(text, max_input_chars=MAX_SUMMARY_SOURCE_CHARS, max_chunks=SUMMARY_SAMPLE_CHUNKS):
+        normalized = re.sub(r'\s+', ' ', (text or '')).strip()
+        if not normalized:
+            return '', False
+
+        if len(normalized) <= max_input_chars:
+            return normalized, False
+
+        target_chunk_size = max(1800, max_input_chars // max(1, max_chunks))
+        # Only offsets are kept for the whole book; just the sampled chunks are sliced out.
+        chunk_spans = list(iter_chunk_spans(normalized, max_chars=target_chunk_size))
+        selected_indexes = select_balanced_chunk_indexes(len(chunk_spans), max_chunks)
+        separator_length = max(0, (len(selected_indexes) - 1) * 2)
+        per_chunk_limit = max(350, (max_input_chars - separator_length) // max(1, len(selected_indexes)))
+        selected_chunks = []
+
+        for position, index in enumerate(selected_indexes):
+            chunk_start, chunk_end = chunk_spans[index]
+            chunk = normalized[chunk_start:chunk_end]
+            if len(chunk) <= per_chunk_limit:
+                selected_chunks.append(chunk)
+                continue
+
+            if position == 0:
+                trimmed_chunk = chunk[:per_chunk_limit].rsplit(' ', 1)[0].strip()
+            elif position == len(selected_indexes) - 1:
+                trimmed_chunk = chunk[-per_chunk_limit:].split(' ', 1)[-1].strip()
+            else:
+                midpoint = len(chunk) // 2
+                half_window = per_chunk_limit // 2
+                start = max(0, midpoint - half_window)
+                end = min(len(chunk), start + per_chunk_limit)
+                trimmed_chunk = chunk[start:end].strip()
+                if ' ' in trimmed_chunk:
+                    trimmed_chunk = trimmed_chunk.split(' ', 1)[-1].rsplit(' ', 1)[0].strip()
+
+            selected_chunks.append(trimmed_chunk or chunk[:per_chunk_limit].strip())
+
+        combined = '\n\n'.join(selected_chunks).strip()
+        if len(combined) > max_input_chars:
+            combined = combined[:max_input_chars].rsplit(' ', 1)[0].strip()
+
+        return combined, True
+
+    @staticmethod
+    def build_summary_prompt(book, source_text, source_is_sampled, sampling_note=None):
+        metadata = [
+            f'Title: {book.title}',
+            f'Author: {book.author}',
+            f'Genre: {book.genre or "Unknown"}',
+            f'Published year: {book.published_year or "Unknown"}',
+        ]
+        sampling_note = sampling_note or (
+            'The book text below is a representative sample collected from across the book. '
+            'Do not invent details that are not supported by the provided text.'
+            if source_is_sampled
+            else 'The book text below was extracted from the available book content. Summarize it faithfully.'
+        )
+        metadata_text = '\n'.join(metadata)
+
+        return (
+            'Write a clear reader-facing summary in 2 short paragraphs. '
+            'Focus on the central subject or storyline, the most important themes, and the reading tone. '
+            'Keep the summary factual, concise, and spoiler-aware.\n\n'
+            f'{sampling_note}\n\n'
+            'Book metadata:\n'
+            f'{metadata_text}\n\n'
+            'Book text:\n'
+            f'{source_text}'
+        )
+
+    @staticmethod
+    def generate_summary_with_openai(book, source_text, source_is_sampled, sampling_note=None):
+        if load_openai_client() is None:
             return None
 
         model = getattr(settings, 'OPENAI_SUMMARY_MODEL', 'gpt-5.4-mini')
-        response = client.responses.create(
-            model=model,
-            instructions=(
-                'You are a careful book summarizer. Summaries must stay grounded in the source text, '
-                'read naturally, and avoid made-up plot points or unsupported claims.'
+        instructions = OPENAI_SUMMARY_INSTRUCTIONS
+        prompt = AIProcessor.build_summary_prompt(book, source_text, source_is_sampled, sampling_note=sampling_note)
+        cache_key = SummaryCache.build_key('openai', model, f'{instructions}\n{prompt}')
+        cached_result = SummaryCache.get(cache_key)
+        if cached_result:
+            return cached_result
+
+        response = OpenAIClientManager.call(
+            'summary',
+            lambda client, timeout: client.responses.create(
+                model=model,
+                instructions=instructions,
+                input=prompt,
+                timeout=timeout,
             ),
-            input=AIProcessor.build_summary_prompt(book, source_text, source_is_sampled),
         )
         summary = AIProcessor.clean_generated_text(getattr(response, 'output_text', ''))
         if not summary:
             raise RuntimeError('The OpenAI summary response did not contain any text.')
 
-        return {
+        result = {
             'summary': summary,
             'provider': 'openai',
             'model': model,
             'source_is_sampled': source_is_sampled,
         }
+        SummaryCache.set(cache_key, result)
+        return result
 
     @staticmethod
     def generate_extractive_summary(text, limit=5):
@@ -625,23 +2118,237 @@ class AIProcessor:
         if not sentences:
             return 'Summary unavailable.'
 
-        keyword_stats = AIProcessor.build_keyword_stats(text, limit=20)
-        keyword_weights = {item['word']: item['frequency'] for item in keyword_stats}
-        scored_sentences = []
+        method = getattr(settings, 'EXTRACTIVE_SUMMARY_METHOD', 'textrank')
+        selected = summarize_sentences(sentences, limit=limit, method=method, stop_words=COMMON_STOP_WORDS)
+        return AIProcessor.clean_generated_text(' '.join(sentences[index] for index in selected))
 
-        for index, sentence in enumerate(sentences[:80]):
-            words = [word.lower().strip('.,!?";:()[]{}') for word in sentence.split()]
-            score = sum(keyword_weights.get(word, 0) for word in words)
-            score += max(0, 3 - index) * 0.5
-            scored_sentences.append((score, index, sentence))
+    @staticmethod
+    def generate_summary_with_transformers(source_text, source_is_sampled, max_length=150, min_length=50):
+        summarizer_model = get_summarizer_model_name()
+        cache_key = SummaryCache.build_key('transformers', summarizer_model, f'{max_length}:{min_length}\n{source_text}')
+        cached_result = SummaryCache.get(cache_key)
+        if cached_result:
+            return cached_result
+
+        # Load up front so a missing model fails once here instead of once per chunk.
+        summarizer = SummarizerModelRegistry.get(summarizer_model)
+
+        # If text is too long, summarize balanced samples across the book
+        max_input_tokens = get_cpu_inference_profile()['max_input_tokens']
+        tokenizer = getattr(summarizer, 'tokenizer', None)
+        if max_input_tokens and tokenizer is not None:
+            # With an input cap, size chunks in model tokens so truncation never drops the end of a chunk.
+            chunk_spans = list(iter_chunk_spans(
+                source_text,
+                max_tokens=max_input_tokens,
+                count_tokens=lambda chunk: len(tokenizer.encode(chunk)),
+            ))
+        else:
+            chunk_spans = list(iter_chunk_spans(source_text, max_chars=3000))
+        selected_chunks = [
+            source_text[chunk_spans[index][0]:chunk_spans[index][1]]
+            for index in select_balanced_chunk_indexes(len(chunk_spans), 3)
+        ]
+        # The sampled chunks go through the shared batcher together, alongside chunks from concurrent requests.
+        summaries = [
+            summary
+            for summary in summarize_chunks(summarizer_model, selected_chunks, max_length, min_length)
+            if summary
+        ]
+        if not summaries:
+            return None
 
-        selected = sorted(scored_sentences, key=lambda item: (-item[0], item[1]))[:limit]
-        ordered = [sentence for _, _, sentence in sorted(selected, key=lambda item: item[1])]
-        return AIProcessor.clean_generated_text(' '.join(ordered))
+        summary = summaries[0]
+        provider = 'transformers'
+        # If multiple summaries, combine them
+        if len(summaries) > 1:
+            summary = " ".join(summaries)
+            # Summarize the combined summaries if too long
+            if len(summary) > 1000:
+                final_summary = summarize_chunks(summarizer_model, [summary], max_length, min_length)[0]
+                if final_summary:
+                    summary = final_summary
+                else:
+                    summary = summary[:500] + "..."
+                    provider = 'transformers-trimmed'
+
+        result = {
+            'summary': AIProcessor.clean_generated_text(summary),
+            'provider': provider,
+            'model': summarizer_model,
+            'source_is_sampled': source_is_sampled,
+        }
+        # A trimmed result is a degraded fallback, so leave it out of the cache and try again next time.
+        if provider == 'transformers':
+            SummaryCache.set(cache_key, result)
+        return result
+
+    @staticmethod
+    def summarize_sections(provider, model, sections, summarize_many):
+        """Summarize ``sections`` in order, reusing persisted section summaries and running only the missing ones."""
+        cache_keys = [SummaryCache.build_key(f'{provider}-section', model, section) for section in sections]
+        cached = SummaryCache.get_many(cache_keys)
+        missing = [index for index, cache_key in enumerate(cache_keys) if cache_key not in cached]
+        summaries = [cached.get(cache_key) for cache_key in cache_keys]
+
+        if missing:
+            fresh_summaries = summarize_many([sections[index] for index in missing])
+            for index, summary in zip(missing, fresh_summaries):
+                summary = AIProcessor.clean_generated_text(summary)
+                if not summary:
+                    continue
+                summaries[index] = summary
+                SummaryCache.set(cache_keys[index], {'summary': summary, 'provider': f'{provider}-section', 'model': model})
+
+        summaries = [summary for summary in summaries if summary]
+        if not summaries:
+            raise RuntimeError('No section of the book could be summarized.')
+        return summaries
+
+    @staticmethod
+    def reduce_section_tree(sections, summarize_level, max_chunk_size):
+        """Summarize every section, then summarize groups of summaries until they fit in one input.
+
+        Each level runs concurrently, so wall-clock time grows with the depth of the tree rather
+        than the number of sections. Returns the remaining summaries and the depth reached.
+        """
+        # A book that already fits in one input skips straight to the final summary.
+        if len(sections) <= 1:
+            return sections, 0
+
+        summaries = summarize_level(sections)
+        depth = 1
+        while len(summaries) > 1 and sum(len(summary) + 2 for summary in summaries) > max_chunk_size:
+            summaries = summarize_level(group_section_summaries(summaries, max_chunk_size))
+            depth += 1
+        return summaries, depth
 
     @staticmethod
-    def generate_summary(book, text, max_length=150, min_length=50):
+    def generate_map_reduce_summary_with_openai(book, sections, max_chunk_size):
+        if load_openai_client() is None:
+            return None
+
+        model = getattr(settings, 'OPENAI_SUMMARY_MODEL', 'gpt-5.4-mini')
+
+        def summarize_section(section):
+            prompt = (
+                'Summarize this passage from a longer book in one concise paragraph. Keep the people, events '
+                'and ideas that matter to the overall work and do not add anything that is not in the passage.\n\n'
+                f'Passage:\n{section}'
+            )
+            try:
+                response = OpenAIClientManager.call(
+                    'summary',
+                    lambda client, timeout: client.responses.create(
+                        model=model,
+                        instructions=OPENAI_SUMMARY_INSTRUCTIONS,
+                        input=prompt,
+                        timeout=timeout,
+                    ),
+                )
+                return getattr(response, 'output_text', '')
+            except Exception as exc:
+                logger.error(f'Error summarizing book section with OpenAI: {str(exc)}')
+                return None
+
+        # The client manager caps in-flight requests, so the pool only needs to keep that many busy.
+        with ThreadPoolExecutor(max_workers=max(1, getattr(settings, 'OPENAI_MAX_CONCURRENCY', 4))) as executor:
+            def summarize_level(inputs):
+                return AIProcessor.summarize_sections(
+                    'openai',
+                    model,
+                    inputs,
+                    lambda missing: list(executor.map(summarize_section, missing)),
+                )
+
+            summaries, depth = AIProcessor.reduce_section_tree(sections, summarize_level, max_chunk_size)
+
+        combined = '\n\n'.join(summaries)
+        sampling_note = (
+            'The text below is a set of section summaries covering the whole book, in reading order. '
+            'Do not invent details that are not supported by them.'
+            if depth
+            else None
+        )
+        result = AIProcessor.generate_summary_with_openai(book, combined, False, sampling_note=sampling_note)
+        if result:
+            result.update({'provider': 'openai-map-reduce', 'section_count': len(sections), 'tree_depth': depth})
+        return result
+
+    @staticmethod
+    def generate_map_reduce_summary_with_transformers(sections, max_chunk_size, max_length=150, min_length=50):
+        summarizer_model = get_summarizer_model_name()
+        # Section inputs are summarized with the same lengths, so they are part of the cache identity.
+        cache_model = f'{summarizer_model}:{max_length}:{min_length}'
+
+        def summarize_level(inputs):
+            return AIProcessor.summarize_sections(
+                'transformers',
+                cache_model,
+                inputs,
+                lambda missing: summarize_chunks(summarizer_model, missing, max_length, min_length),
+            )
+
+        # Load up front so a missing model fails once here instead of once per section.
+        SummarizerModelRegistry.get(summarizer_model)
+        summaries, depth = AIProcessor.reduce_section_tree(sections, summarize_level, max_chunk_size)
+        if depth and len(summaries) == 1:
+            final_summary = summaries[0]
+        else:
+            final_summary = summarize_level(['\n\n'.join(summaries)])[0]
+        return {
+            'summary': AIProcessor.clean_generated_text(final_summary),
+            'provider': 'transformers-map-reduce',
+            'model': summarizer_model,
+            'source_is_sampled': False,
+            'section_count': len(sections),
+            'tree_depth': depth,
+        }
+
+    @staticmethod
+    def generate_map_reduce_summary(book, text, max_length=150, min_length=50):
+        """Summarize the whole book: every section in parallel, then a tree of reduce passes over the partial summaries"""
+        normalized = re.sub(r'\s+', ' ', (text or '')).strip()
+        if not normalized:
+            return None
+
+        max_chunk_size = getattr(settings, 'SUMMARY_MAP_REDUCE_CHUNK_CHARS', DEFAULT_MAP_REDUCE_CHUNK_CHARS)
+        sections = split_text_into_stable_chunks(normalized, max_chunk_size)
+
+        try:
+            openai_result = AIProcessor.generate_map_reduce_summary_with_openai(book, sections, max_chunk_size)
+            if openai_result and openai_result.get('summary'):
+                return openai_result
+        except OptionalDependencyError:
+            raise
+        except Exception as exc:
+            logger.error(f'Error in OpenAI map-reduce summarization: {str(exc)}')
+
+        try:
+            return AIProcessor.generate_map_reduce_summary_with_transformers(
+                sections,
+                max_chunk_size,
+                max_length=max_length,
+                min_length=min_length,
+            )
+        except Exception as exc:
+            logger.error(f'Error in transformers map-reduce summarization: {str(exc)}')
+        return None
+
+    @staticmethod
+    def generate_summary(book, text, max_length=150, min_length=50, mode=None):
         """Generate AI summary of text"""
+        mode = mode or getattr(settings, 'SUMMARY_MODE', 'sampled')
+        if mode == 'map_reduce':
+            try:
+                map_reduce_result = AIProcessor.generate_map_reduce_summary(book, text, max_length, min_length)
+                if map_reduce_result and map_reduce_result.get('summary'):
+                    return map_reduce_result
+            except OptionalDependencyError:
+                raise
+            except Exception as exc:
+                logger.error(f'Error in map-reduce summarization, falling back to sampled summary: {str(exc)}')
+
         source_text, source_is_sampled = AIProcessor.build_summary_source_text(text)
         if not source_text:
             return {
@@ -661,100 +2368,366 @@ class AIProcessor:
             logger.error(f'Error in OpenAI summarization: {str(exc)}')
 
         try:
-            pipeline, torch = load_summarization_stack()
-            # Initialize summarizer
-            summarizer = pipeline(
-                "summarization", 
-                model="sshleifer/distilbart-cnn-12-6",
-                device=0 if torch.cuda.is_available() else -1
+            transformers_result = AIProcessor.generate_summary_with_transformers(
+                source_text,
+                source_is_sampled,
+                max_length=max_length,
+                min_length=min_length,
             )
-            
-            # If text is too long, summarize balanced samples across the book
-            chunks = AIProcessor.chunk_text(source_text, max_chunk_size=3000)
-            summaries = []
-            
-            for index in select_balanced_chunk_indexes(len(chunks), 3):
-                chunk = chunks[index]
-                try:
-                    summary = summarizer(
-                        chunk, 
-                        max_length=max_length, 
-                        min_length=min_length, 
-                        do_sample=False
-                    )[0]['summary_text']
-                    summaries.append(summary)
-                except Exception as e:
-                    logger.error(f"Error summarizing chunk: {str(e)}")
-                    continue
-            
-            # If multiple summaries, combine them
-            if len(summaries) > 1:
-                combined_summary = " ".join(summaries)
-                # Summarize the combined summaries if too long
-                if len(combined_summary) > 1000:
-                    try:
-                        final_summary = summarizer(
-                            combined_summary, 
-                            max_length=max_length, 
-                            min_length=min_length, 
-                            do_sample=False
-                        )[0]['summary_text']
-                        return {
-                            'summary': AIProcessor.clean_generated_text(final_summary),
-                            'provider': 'transformers',
-                            'model': 'sshleifer/distilbart-cnn-12-6',
-                            'source_is_sampled': source_is_sampled,
-                        }
-                    except Exception:
-                        return {
-                            'summary': AIProcessor.clean_generated_text(combined_summary[:500] + "..."),
-                            'provider': 'transformers-trimmed',
-                            'model': 'sshleifer/distilbart-cnn-12-6',
-                            'source_is_sampled': source_is_sampled,
-                        }
-                return {
-                    'summary': AIProcessor.clean_generated_text(combined_summary),
-                    'provider': 'transformers',
-                    'model': 'sshleifer/distilbart-cnn-12-6',
-                    'source_is_sampled': source_is_sampled,
-                }
-            elif summaries:
-                return {
-                    'summary': AIProcessor.clean_generated_text(summaries[0]),
-                    'provider': 'transformers',
-                    'model': 'sshleifer/distilbart-cnn-12-6',
-                    'source_is_sampled': source_is_sampled,
-                }
-
+            if transformers_result:
+                return transformers_result
         except Exception as e:
             logger.error(f"Error in AI summarization: {str(e)}")
 
         return {
-            'summary': AIProcessor.generate_extractive_summary(source_text),
+            # The extractive engine is cheap enough to rank every sentence, not just the sample.
+            'summary': AIProcessor.generate_extractive_summary(re.sub(r'\s+', ' ', text).strip()),
             'provider': 'extractive-fallback',
             'model': None,
-            'source_is_sampled': source_is_sampled,
+            'source_is_sampled': False,
         }
 
     @staticmethod
     def build_keyword_stats(text, limit=10):
-        words = [word.lower().strip('.,!?";:()[]{}') for word in text.split()]
-        word_freq = {}
-        for word in words:
-            if len(word) > 3 and word not in COMMON_STOP_WORDS:
-                word_freq[word] = word_freq.get(word, 0) + 1
+        return BookAnalyticsAccumulator().add_page(1, text).top_keywords(limit)
+
+class AudioCache:
+    """Size-bounded cache of generated book audio, sharded into subdirectories and swept in the background"""
+
+    BOOK_AUDIO_PATTERN = re.compile(r'^book_(\d+)_(.+)_v([^_]+)\.mp3$')
+    TEMP_FILE_MAX_AGE_SECONDS = 3600
+
+    _lock = threading.Lock()
+    _stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'stale_deletions': 0}
+    _sweep_thread = None
+
+    @staticmethod
+    def get_max_bytes():
+        return getattr(settings, 'AUDIO_CACHE_MAX_BYTES', 0)
+
+    @staticmethod
+    def get_relative_path(filename):
+        shard = hashlib.sha256(filename.encode('utf-8')).hexdigest()[:2]
+        return f'{shard}/{filename}'
+
+    @staticmethod
+    def get_path(filename):
+        return os.path.join(get_audio_storage_dir(), *AudioCache.get_relative_path(filename).split('/'))
+
+    @staticmethod
+    def get_cache_roots():
+        roots = [get_audio_storage_dir()]
+        segment_dir = SpeechSegmentCache.get_cache_dir()
+        if os.path.commonpath([roots[0], os.path.abspath(segment_dir)]) != roots[0]:
+            roots.append(segment_dir)
+        return roots
+
+    @staticmethod
+    def _touch(audio_path):
+        # Access time drives LRU eviction; set it explicitly because many hosts mount with noatime.
+        try:
+            os.utime(audio_path, (time.time(), os.stat(audio_path).st_mtime))
+        except OSError:
+            pass
+
+    @classmethod
+    def _count(cls, name, amount=1):
+        with cls._lock:
+            cls._stats[name] += amount
+
+    @classmethod
+    def lookup(cls, filename):
+        """Return the cached path for ``filename`` or ``None``, moving files from the old flat layout into their shard."""
+        audio_path = cls.get_path(filename)
+        if not os.path.exists(audio_path) and not cls._migrate(os.path.join(get_audio_storage_dir(), filename), audio_path):
+            cls._count('misses')
+            return None
+        cls._touch(audio_path)
+        cls._count('hits')
+        return audio_path
+
+    @staticmethod
+    def _migrate(legacy_path, audio_path):
+        if not os.path.exists(legacy_path):
+            return False
+        try:
+            os.makedirs(os.path.dirname(audio_path), exist_ok=True)
+            os.replace(legacy_path, audio_path)
+            return True
+        except OSError:
+            return False
+
+    @classmethod
+    def record_store(cls):
+        cls._count('stores')
+
+    @classmethod
+    def _scan(cls, now, dry_run=False):
+        """Yield ``(path, name, size, atime)`` for cached MP3s, removing temp files left by crashed writers."""
+        audio_dir = get_audio_storage_dir()
+        for root in cls.get_cache_roots():
+            for dirpath, _, filenames in os.walk(root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat_result = os.stat(path)
+                    except OSError:
+                        continue
+                    if name.endswith('.part'):
+                        if not dry_run and now - stat_result.st_mtime > cls.TEMP_FILE_MAX_AGE_SECONDS:
+                            cls._delete(path)
+                        continue
+                    if not name.endswith('.mp3'):
+                        continue
+                    if dirpath == audio_dir and not dry_run:
+                        sharded_path = cls.get_path(name)
+                        if not cls._migrate(path, sharded_path):
+                            continue
+                        path = sharded_path
+                    yield path, name, stat_result.st_size, stat_result.st_atime
+
+    @classmethod
+    def _is_superseded(cls, name, books):
+        """Audio of deleted books, and summary audio for a summary the book no longer has.
+
+        Chapter and full audio versions depend on the PDF content hash, which would mean hashing every PDF
+        here; an old version of those stops being requested and ages out through LRU eviction instead.
+        """
+        match = cls.BOOK_AUDIO_PATTERN.match(name)
+        if not match:
+            return False
+        book = books.get(int(match.group(1)))
+        if book is None:
+            return True
+        return match.group(2) == 'ai_summary_audio' and name != build_summary_audio_filename(book, book.ai_summary)
+
+    @classmethod
+    def sweep(cls, max_bytes=None, dry_run=False):
+        """Delete audio for old book versions, then least recently used files until the cache fits ``max_bytes``.
+
+        Returns a summary of what was (or, with ``dry_run``, would be) removed.
+        """
+        if max_bytes is None:
+            max_bytes = cls.get_max_bytes()
+        audio_dir = get_audio_storage_dir()
+        os.makedirs(audio_dir, exist_ok=True)
+
+        with exclusive_file_lock(os.path.join(audio_dir, '.sweep.lock')):
+            entries = list(cls._scan(time.time(), dry_run=dry_run))
+            book_ids = {
+                int(match.group(1))
+                for match in (cls.BOOK_AUDIO_PATTERN.match(name) for _, name, _, _ in entries)
+                if match
+            }
+            books = Book.objects.filter(id__in=book_ids).only('id', 'ai_summary').in_bulk()
+
+            result = {
+                'files': len(entries),
+                'bytes_before': sum(size for _, _, size, _ in entries),
+                'stale_deleted': 0,
+                'evicted': 0,
+            }
+            remaining = []
+            for path, name, size, atime in entries:
+                if cls._is_superseded(name, books):
+                    if dry_run or cls._delete(path):
+                        result['stale_deleted'] += 1
+                        continue
+                remaining.append((atime, size, path))
+
+            total_size = sum(size for _, size, _ in remaining)
+            if max_bytes > 0:
+                for _, size, path in sorted(remaining):
+                    if total_size <= max_bytes:
+                        break
+                    if dry_run or cls._delete(path):
+                        total_size -= size
+                        result['evicted'] += 1
+            result['bytes_after'] = total_size
+
+        if not dry_run:
+            cls._count('stale_deletions', result['stale_deleted'])
+            cls._count('evictions', result['evicted'])
+        return result
+
+    @staticmethod
+    def _delete(path):
+        try:
+            os.unlink(path)
+        except OSError:
+            return False
+        AudioCache.discard_playlist(path)
+        return True
+
+    @staticmethod
+    def get_playlist_path(audio_path):
+        return audio_path[:-len('.mp3')] + '.m3u8'
+
+    @staticmethod
+    def discard_playlist(audio_path):
+        try:
+            os.unlink(AudioCache.get_playlist_path(audio_path))
+        except OSError:
+            pass
+
+    @staticmethod
+    def ensure_playlist(audio_path):
+        """Write the byte-range HLS playlist for ``audio_path`` unless a current one exists; returns its path, or ``None``."""
+        playlist_path = AudioCache.get_playlist_path(audio_path)
+        try:
+            # A playlist older than its MP3 indexes frames from before the file was regenerated.
+            if os.stat(playlist_path).st_mtime >= os.stat(audio_path).st_mtime:
+                return playlist_path
+        except FileNotFoundError:
+            pass
+        with open(audio_path, 'rb') as audio_file:
+            try:
+                mapping = mmap.mmap(audio_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return None
+            try:
+                segments = build_segment_index(mapping, getattr(settings, 'AUDIO_PLAYLIST_SEGMENT_SECONDS', 10))
+            finally:
+                mapping.close()
+        if not segments:
+            return None
+        with atomic_output_file(playlist_path) as playlist_file:
+            playlist_file.write(build_hls_playlist(segments, os.path.basename(audio_path)).encode('utf-8'))
+        return playlist_path
+
+    @classmethod
+    def schedule_sweep(cls):
+        """Start a background sweep if none ran on this host within ``AUDIO_CACHE_SWEEP_INTERVAL_SECONDS``."""
+        interval = getattr(settings, 'AUDIO_CACHE_SWEEP_INTERVAL_SECONDS', 3600)
+        if interval <= 0:
+            return False
+        marker_path = os.path.join(get_audio_storage_dir(), '.last_sweep')
+        try:
+            last_sweep = os.stat(marker_path).st_mtime
+        except OSError:
+            last_sweep = 0
+        if time.time() - last_sweep < interval:
+            return False
+
+        with cls._lock:
+            if cls._sweep_thread is not None and cls._sweep_thread.is_alive():
+                return False
+            # Touch the marker before starting so other workers skip this round.
+            with open(marker_path, 'a'):
+                os.utime(marker_path)
+            cls._sweep_thread = threading.Thread(target=cls._run_background_sweep, name='audio-cache-sweep', daemon=True)
+            cls._sweep_thread.start()
+        return True
+
+    @classmethod
+    def _run_background_sweep(cls):
+        try:
+            result = cls.sweep()
+            logger.info(
+                f"Audio cache sweep removed {result['stale_deleted']} superseded and {result['evicted']} "
+                f"least recently used files; {result['bytes_after']} bytes remain"
+            )
+        except Exception as exc:
+            logger.error(f'Audio cache sweep failed: {str(exc)}')
+        finally:
+            connections.close_all()
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            stats = dict(cls._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['max_bytes'] = cls.get_max_bytes()
+        return stats
+
+
+class SpeechSegmentCache:
+    """Content-addressed MP3 segments, so overlapping page ranges reuse audio that was already synthesized"""
+
+    _lock = threading.Lock()
+    _stats = {'hits': 0, 'misses': 0, 'stores': 0}
+
+    @staticmethod
+    def is_enabled():
+        return getattr(settings, 'TTS_SEGMENT_CACHE_ENABLED', True)
+
+    @staticmethod
+    def get_cache_dir():
+        return getattr(settings, 'TTS_SEGMENT_CACHE_DIR', '') or os.path.join(get_audio_storage_dir(), 'segments')
+
+    @staticmethod
+    def build_key(provider, voice_signature, text):
+        digest = hashlib.sha256()
+        for part in (provider, *voice_signature):
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_path(cache_key):
+        return os.path.join(SpeechSegmentCache.get_cache_dir(), cache_key[:2], f'{cache_key}.mp3')
+
+    @classmethod
+    def _count(cls, name):
+        with cls._lock:
+            cls._stats[name] += 1
+
+    @classmethod
+    def get(cls, cache_key):
+        segment_path = cls.get_path(cache_key)
+        try:
+            # Touch the segment so age-based cleanup keeps the ones readers are still using.
+            os.utime(segment_path)
+        except OSError:
+            cls._count('misses')
+            return None
+        cls._count('hits')
+        return segment_path
+
+    @classmethod
+    def record_store(cls):
+        cls._count('stores')
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            stats = dict(cls._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
 
-        top_keywords = sorted(word_freq.items(), key=lambda item: item[1], reverse=True)[:limit]
-        return [{'word': word, 'frequency': frequency} for word, frequency in top_keywords]
 
 class AudioProcessor:
     """Utility class for audio processing"""
 
     @staticmethod
-    def text_to_speech_openai(text):
-        client = load_openai_client()
-        if client is None:
-            return None, None, None, None
+    def get_narration_signature():
+        """Settings that change narrated audio for the same text, whichever provider ends up speaking."""
+        return (
+            *AudioProcessor.get_voice_signature('openai'),
+            *AudioProcessor.get_voice_signature('gtts'),
+            getattr(settings, 'TTS_SEGMENT_CHARS', 3500),
+            getattr(settings, 'TTS_SEGMENT_SILENCE_MS', 250),
+        )
+
+    @staticmethod
+    def get_voice_signature(provider, language='en', slow=False):
+        """Everything besides the text that changes what a provider says, for segment cache keys."""
+        if provider == 'openai':
+            return (
+                getattr(settings, 'OPENAI_TTS_MODEL', 'gpt-4o-mini-tts'),
+                getattr(settings, 'OPENAI_TTS_VOICE', 'marin'),
+                getattr(settings, 'OPENAI_TTS_INSTRUCTIONS', ''),
+            )
+        return (language, bool(slow))
+
+    @staticmethod
+    def text_to_speech_openai(text, output_file):
+        """Stream OpenAI speech for ``text`` into ``output_file``; returns ``(audio_error, audio_status, audio_provider)``."""
+        if load_openai_client() is None:
+            return None, None, None
 
         model = getattr(settings, 'OPENAI_TTS_MODEL', 'gpt-4o-mini-tts')
         voice = getattr(settings, 'OPENAI_TTS_VOICE', 'marin')
@@ -764,11 +2737,7 @@ class AudioProcessor:
             'Speak clearly, warmly, and naturally like an attentive audiobook narrator.',
         )
 
-        temp_audio_path = None
         try:
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_audio:
-                temp_audio_path = temp_audio.name
-
             request_kwargs = {
                 'model': model,
                 'voice': voice,
@@ -777,70 +2746,156 @@ class AudioProcessor:
             if model == 'gpt-4o-mini-tts' and instructions:
                 request_kwargs['instructions'] = instructions
 
-            with client.audio.speech.with_streaming_response.create(**request_kwargs) as response:
-                response.stream_to_file(temp_audio_path)
-
-            with open(temp_audio_path, 'rb') as audio_file:
-                audio_buffer = io.BytesIO(audio_file.read())
-                audio_buffer.seek(0)
+            def stream_speech(client, timeout):
+                # A retried attempt starts the file over rather than appending to a partial stream.
+                output_file.seek(0)
+                output_file.truncate()
+                with client.audio.speech.with_streaming_response.create(**request_kwargs, timeout=timeout) as response:
+                    for chunk in response.iter_bytes(chunk_size=65536):
+                        output_file.write(chunk)
 
-            return audio_buffer, None, status.HTTP_200_OK, 'openai'
+            OpenAIClientManager.call('tts', stream_speech)
+            return None, status.HTTP_200_OK, 'openai'
         except OptionalDependencyError:
             raise
         except Exception as exc:
-            return None, f'Error generating audio: {str(exc)}', status.HTTP_500_INTERNAL_SERVER_ERROR, 'openai'
-        finally:
-            if temp_audio_path and os.path.exists(temp_audio_path):
-                try:
-                    os.unlink(temp_audio_path)
-                except OSError:
-                    pass
+            return f'Error generating audio: {str(exc)}', status.HTTP_500_INTERNAL_SERVER_ERROR, 'openai'
 
     @staticmethod
-    def text_to_speech_gtts(text, language='en', slow=False):
-        """Convert text to speech using gTTS"""
+    def text_to_speech_gtts(text, output_file, language='en', slow=False):
+        """Write gTTS speech for ``text`` into ``output_file``"""
         try:
             gTTS = load_gtts()
-            # Create gTTS object
             tts = gTTS(text=text, lang=language, slow=slow)
-            
-            # Save to temporary file
-            audio_buffer = io.BytesIO()
-            tts.write_to_fp(audio_buffer)
-            audio_buffer.seek(0)
+            tts.write_to_fp(output_file)
 
-            return audio_buffer, None, status.HTTP_200_OK, 'gtts'
+            return None, status.HTTP_200_OK, 'gtts'
         except OptionalDependencyError as exc:
-            return None, str(exc), status.HTTP_503_SERVICE_UNAVAILABLE, 'gtts'
+            return str(exc), status.HTTP_503_SERVICE_UNAVAILABLE, 'gtts'
         except Exception as e:
-            return None, f"Error generating audio: {str(e)}", status.HTTP_500_INTERNAL_SERVER_ERROR, 'gtts'
+            return f"Error generating audio: {str(e)}", status.HTTP_500_INTERNAL_SERVER_ERROR, 'gtts'
 
     @staticmethod
-    def text_to_speech(text, language='en', slow=False):
-        try:
-            audio_buffer, audio_error, audio_status, audio_provider = AudioProcessor.text_to_speech_openai(text)
-            if audio_buffer:
-                return audio_buffer, None, audio_status, audio_provider
-            if audio_error and audio_status != status.HTTP_503_SERVICE_UNAVAILABLE:
-                logger.error(audio_error)
-        except OptionalDependencyError as exc:
-            logger.warning(str(exc))
+    def write_speech(text_to_speech, text, output_file):
+        """Run one provider into ``output_file``, raising ``SegmentSynthesisError`` if it produced no audio."""
+        audio_error, audio_status, _ = text_to_speech(text, output_file)
+        if audio_error or not output_file.tell():
+            error = SegmentSynthesisError(audio_error or 'The speech provider returned no audio.')
+            error.status_code = audio_status or status.HTTP_500_INTERNAL_SERVER_ERROR
+            raise error
+
+    @staticmethod
+    def ensure_cached_segment(text_to_speech, text, cache_key):
+        """Return the segment cache path for ``text``, synthesizing it only on a miss."""
+        segment_path = SpeechSegmentCache.get(cache_key)
+        if segment_path is None:
+            segment_path = SpeechSegmentCache.get_path(cache_key)
+            with atomic_output_file(segment_path) as segment_file:
+                AudioProcessor.write_speech(text_to_speech, text, segment_file)
+            SpeechSegmentCache.record_store()
+        return segment_path
 
-        return AudioProcessor.text_to_speech_gtts(text, language=language, slow=slow)
+    @staticmethod
+    def synthesize_segment(text_to_speech, text, cache_key=None):
+        if cache_key is not None:
+            with open(AudioProcessor.ensure_cached_segment(text_to_speech, text, cache_key), 'rb') as segment_file:
+                return segment_file.read()
+        # Segments are a few thousand characters, so each one is small enough to buffer before joining.
+        audio_buffer = io.BytesIO()
+        AudioProcessor.write_speech(text_to_speech, text, audio_buffer)
+        return audio_buffer.getvalue()
 
     @staticmethod
-    def save_audio_file(audio_buffer, filename, audio_dir):
-        """Save audio buffer to file"""
+    def build_segment_spans(text, segment_breaks=None):
+        """Sentence-aligned segment spans that never cross ``segment_breaks`` (page starts, for example).
+
+        Breaking at page starts makes a page's segments identical in every range that contains it.
+        """
+        max_chars = getattr(settings, 'TTS_SEGMENT_CHARS', 3500)
+        bounds = sorted({0, len(text), *(offset for offset in segment_breaks or () if 0 < offset < len(text))})
+        spans = []
+        for start, end in zip(bounds, bounds[1:]):
+            spans.extend(iter_chunk_spans(text, max_chars=max_chars, start=start, end=end))
+        return spans
+
+    @staticmethod
+    def write_segmented_audio(text, spans, synthesize, output_file):
+        """Synthesize ``spans`` of ``text`` on a bounded pool and append them to ``output_file`` in order."""
+        workers = max(1, getattr(settings, 'TTS_MAX_WORKERS', 4))
+        concatenator = MP3Concatenator(output_file, silence_ms=getattr(settings, 'TTS_SEGMENT_SILENCE_MS', 250))
+        span_iter = iter(spans)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tts-segment')
         try:
-            os.makedirs(audio_dir, exist_ok=True)
-            file_path = os.path.join(audio_dir, filename)
+            # A small window of segments in flight keeps every worker busy without buffering the whole book.
+            pending = deque(
+                executor.submit(synthesize, text[start:end])
+                for start, end in islice(span_iter, workers * 2)
+            )
+            while pending:
+                audio = pending.popleft().result()
+                next_span = next(span_iter, None)
+                if next_span is not None:
+                    pending.append(executor.submit(synthesize, text[next_span[0]:next_span[1]]))
+                concatenator.append(audio)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return concatenator
 
-            with open(file_path, 'wb') as f:
-                f.write(audio_buffer.getvalue())
+    @staticmethod
+    def text_to_speech_to_file(text, output_path, language='en', slow=False, segment_breaks=None):
+        """Narrate text of any length into ``output_path`` as sentence-aligned segments joined into one MP3.
+
+        Returns ``(audio_error, audio_status, audio_provider)``; ``audio_error`` is ``None`` on success.
+        Every segment comes from the same provider so the stream format matches; if a segment fails,
+        the next provider redoes the whole text. Segments are reused from ``SpeechSegmentCache`` when enabled;
+        otherwise text that fits in one segment is streamed straight to disk. The file is written atomically,
+        so readers never see partial audio.
+        """
+        spans = AudioProcessor.build_segment_spans(text, segment_breaks)
+        if not spans:
+            return 'No text to convert to audio.', status.HTTP_400_BAD_REQUEST, None
+
+        providers = []
+        try:
+            if load_openai_client() is not None:
+                providers.append(('openai', AudioProcessor.text_to_speech_openai))
+        except OptionalDependencyError as exc:
+            logger.warning(str(exc))
+        providers.append((
+            'gtts',
+            lambda segment, output_file: AudioProcessor.text_to_speech_gtts(
+                segment, output_file, language=language, slow=slow,
+            ),
+        ))
 
-            return file_path
-        except Exception:
-            return None
+        use_cache = SpeechSegmentCache.is_enabled()
+        audio_error = 'Error generating audio.'
+        audio_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+        for provider, text_to_speech in providers:
+            voice_signature = AudioProcessor.get_voice_signature(provider, language=language, slow=slow)
+
+            def synthesize(segment):
+                cache_key = SpeechSegmentCache.build_key(provider, voice_signature, segment) if use_cache else None
+                return AudioProcessor.synthesize_segment(text_to_speech, segment, cache_key=cache_key)
+
+            try:
+                with atomic_output_file(output_path) as output_file:
+                    if len(spans) > 1:
+                        AudioProcessor.write_segmented_audio(text, spans, synthesize, output_file)
+                    elif use_cache:
+                        segment = text[spans[0][0]:spans[0][1]]
+                        cache_key = SpeechSegmentCache.build_key(provider, voice_signature, segment)
+                        with open(AudioProcessor.ensure_cached_segment(text_to_speech, segment, cache_key), 'rb') as segment_file:
+                            shutil.copyfileobj(segment_file, output_file)
+                    else:
+                        AudioProcessor.write_speech(text_to_speech, text[spans[0][0]:spans[0][1]], output_file)
+                return None, status.HTTP_200_OK, provider
+            except Exception as exc:
+                audio_error = str(exc)
+                audio_status = getattr(exc, 'status_code', status.HTTP_500_INTERNAL_SERVER_ERROR)
+                if audio_status != status.HTTP_503_SERVICE_UNAVAILABLE:
+                    logger.error(f'{provider} speech failed: {audio_error}')
+        return audio_error, audio_status, None
 
 class BookTextExtractionView(APIView):
     """Extract text from PDF for reading purposes"""
@@ -856,6 +2911,13 @@ class BookTextExtractionView(APIView):
         try:
             start_page = parse_positive_int(request.query_params.get('start_page'), 'start_page', default=1)
             end_page = parse_positive_int(request.query_params.get('end_page'), 'end_page', default=None)
+            if parse_bool_param(request.query_params.get('stream')):
+                page_stream = PDFProcessor.stream_page_range(
+                    pdf_source,
+                    start_page=start_page,
+                    end_page=end_page,
+                )
+                return self.build_streaming_response(page_stream)
             extraction = PDFProcessor.extract_text_from_page_range(
                 pdf_source,
                 start_page=start_page,
@@ -883,11 +2945,60 @@ class BookTextExtractionView(APIView):
             'cached': False,
         }, status=status.HTTP_200_OK)
 
-class BookChapterAudioView(APIView):
-    """Generate audio for specific pages/chapters"""
+    @staticmethod
+    def iter_ndjson_records(page_stream):
+        """Yield NDJSON lines: a ``meta`` record, one ``page`` record per page, then a ``summary`` record."""
+        yield json.dumps({
+            'type': 'meta',
+            'page_count': page_stream['page_count'],
+            'start_page': page_stream['start_page'],
+            'end_page': page_stream['end_page'],
+        }) + '\n'
+
+        word_count = 0
+        character_count = 0
+        non_empty_pages = 0
+        try:
+            for page_number, page_text in page_stream['pages']:
+                page_text = page_text.strip()
+                page_words = len(page_text.split())
+                word_count += page_words
+                if page_text:
+                    # Matches the joined text of the non-streaming response, where pages are separated by one space.
+                    character_count += len(page_text) + (1 if non_empty_pages else 0)
+                    non_empty_pages += 1
+                yield json.dumps({
+                    'type': 'page',
+                    'page': page_number,
+                    'text': page_text,
+                    'character_count': len(page_text),
+                    'word_count': page_words,
+                }) + '\n'
+        except Exception as exc:
+            logger.error(f'Error streaming PDF text: {str(exc)}')
+            yield json.dumps({'type': 'error', 'detail': f'Error extracting text from PDF: {str(exc)}'}) + '\n'
+            return
+
+        yield json.dumps({
+            'type': 'summary',
+            'character_count': character_count,
+            'word_count': word_count,
+        }) + '\n'
+
+    def build_streaming_response(self, page_stream):
+        response = StreamingHttpResponse(
+            self.iter_ndjson_records(page_stream),
+            content_type='application/x-ndjson',
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+class BookPageTextView(APIView):
+    """Cursor-paginated per-page text with character and word boundaries"""
     permission_classes = [IsAuthenticated]
 
-    def post(self, request, id):
+    def get(self, request, id):
         book = get_object_or_404(Book, pk=id)
 
         pdf_source = get_book_pdf_source(book)
@@ -895,15 +3006,30 @@ class BookChapterAudioView(APIView):
             return Response({'detail': 'No PDF available for this book.'}, status=status.HTTP_404_NOT_FOUND)
 
         try:
-            start_page = parse_positive_int(request.data.get('start_page'), 'start_page', default=1)
-            end_page = parse_positive_int(request.data.get('end_page'), 'end_page', default=start_page)
-            force_refresh = parse_bool_param(request.data.get('refresh'))
-            extraction = PDFProcessor.extract_text_from_page_range(
-                pdf_source,
-                start_page=start_page,
-                end_page=end_page,
-                max_pages=MAX_CHAPTER_AUDIO_PAGES,
+            limit = min(
+                parse_positive_int(request.query_params.get('limit'), 'limit', default=DEFAULT_PAGE_TEXT_LIMIT),
+                MAX_PAGE_TEXT_LIMIT,
             )
+            content_hash, index = PDFProcessor.get_page_offset_index(pdf_source)
+            page_count = index['page_count']
+
+            char_offset = request.query_params.get('char_offset')
+            word_offset = request.query_params.get('word_offset')
+            cursor = request.query_params.get('cursor')
+            if cursor:
+                start_page = decode_page_cursor(cursor)
+            elif char_offset not in (None, ''):
+                start_page = find_page_for_offset(index['char_offsets'], parse_non_negative_int(char_offset, 'char_offset'))
+            elif word_offset not in (None, ''):
+                start_page = find_page_for_offset(index['word_offsets'], parse_non_negative_int(word_offset, 'word_offset'))
+            else:
+                start_page = parse_positive_int(request.query_params.get('page'), 'page', default=1)
+
+            start_page, end_page = normalize_page_range(start_page, min(page_count, start_page + limit - 1), page_count)
+            page_texts = PageTextStore.load_pages(content_hash, start_page, end_page)
+            if len(page_texts) < end_page - start_page + 1:
+                extraction_pages = PDFProcessor.stream_page_range(pdf_source, start_page, end_page)['pages']
+                page_texts = dict(extraction_pages)
         except OptionalDependencyError as exc:
             return dependency_error_response(exc)
         except FileNotFoundError as exc:
@@ -911,53 +3037,145 @@ class BookChapterAudioView(APIView):
         except ValueError as exc:
             return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as exc:
-            return Response({'detail': f'Error reading PDF: {str(exc)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return Response({'detail': f'Error extracting text from PDF: {str(exc)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        if not extraction['text']:
-            return Response({'detail': 'No readable text found in specified pages.'}, status=status.HTTP_400_BAD_REQUEST)
+        pages = []
+        for page_number in range(start_page, end_page + 1):
+            page_text = page_texts[page_number].strip()
+            char_start = index['char_offsets'][page_number - 1]
+            word_start = index['word_offsets'][page_number - 1]
+            pages.append({
+                'page': page_number,
+                'text': page_text,
+                'char_start': char_start,
+                'char_end': char_start + len(page_text),
+                'word_start': word_start,
+                'word_end': word_start + len(page_text.split()),
+            })
 
-        audio_filename = build_audio_cache_filename(
-            book,
-            'chapter_audio',
-            extraction['start_page'],
-            extraction['end_page'],
+        return Response({
+            'page_count': page_count,
+            'character_count': index['char_offsets'][-1],
+            'word_count': index['word_offsets'][-1],
+            'start_page': start_page,
+            'end_page': end_page,
+            'pages': pages,
+            'next_cursor': encode_page_cursor(end_page + 1) if end_page < page_count else None,
+            'previous_cursor': encode_page_cursor(max(1, start_page - limit)) if start_page > 1 else None,
+        }, status=status.HTTP_200_OK)
+
+def generate_chapter_audio(book, start_page, end_page, build_absolute_uri, force_refresh=False):
+    """Narrate a page range of ``book`` into the audio cache, reusing the cached file when there is one.
+
+    Returns ``(payload, status_code)`` so the view and background pre-generation share one code path.
+    """
+    pdf_source = get_book_pdf_source(book)
+    if not pdf_source:
+        return {'detail': 'No PDF available for this book.'}, status.HTTP_404_NOT_FOUND
+
+    try:
+        extraction = PDFProcessor.extract_text_from_page_range(
+            pdf_source,
+            start_page=start_page,
+            end_page=end_page,
+            max_pages=MAX_CHAPTER_AUDIO_PAGES,
         )
-        _, cached_audio_url = get_cached_audio_url(request, audio_filename)
-        if cached_audio_url and not force_refresh:
-            return Response({
-                'audio_url': cached_audio_url,
-                'start_page': extraction['start_page'],
-                'end_page': extraction['end_page'],
-                'page_count': extraction['page_count'],
-                'text_length': extraction['character_count'],
-                'estimated_duration_minutes': estimate_minutes(extraction['word_count'], 150),
-                'cached': True,
-                'audio_provider': 'cache',
-            }, status=status.HTTP_200_OK)
+    except OptionalDependencyError as exc:
+        return {'detail': str(exc)}, status.HTTP_503_SERVICE_UNAVAILABLE
+    except FileNotFoundError as exc:
+        return {'detail': str(exc)}, status.HTTP_404_NOT_FOUND
+    except ValueError as exc:
+        return {'detail': str(exc)}, status.HTTP_400_BAD_REQUEST
+    except Exception as exc:
+        return {'detail': f'Error reading PDF: {str(exc)}'}, status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    if not extraction['text']:
+        return {'detail': 'No readable text found in specified pages.'}, status.HTTP_400_BAD_REQUEST
+
+    audio_filename = build_audio_cache_filename(
+        book,
+        'chapter_audio',
+        extraction['start_page'],
+        extraction['end_page'],
+        source=extraction['content_hash'],
+    )
+    audio_media_path = build_media_path('audio', AudioCache.get_relative_path(audio_filename))
+    payload = {
+        'start_page': extraction['start_page'],
+        'end_page': extraction['end_page'],
+        'page_count': extraction['page_count'],
+        'text_length': extraction['character_count'],
+        'estimated_duration_minutes': estimate_minutes(extraction['word_count'], 150),
+    }
+    if AudioCache.lookup(audio_filename) and not force_refresh:
+        audio_url = build_absolute_uri(audio_media_path)
+        return {
+            'audio_url': audio_url,
+            'playlist_url': build_playlist_url(audio_url),
+            **payload,
+            'cached': True,
+            'audio_provider': 'cache',
+        }, status.HTTP_200_OK
+
+    # Segments break at page starts, so overlapping ranges reuse the pages they share.
+    audio_error, audio_status, audio_provider = synthesize_cached_audio(
+        extraction['text'],
+        audio_filename,
+        segment_breaks=extraction.get('page_offsets'),
+    )
+    if audio_error:
+        return {'detail': audio_error}, audio_status
+    audio_url = build_absolute_uri(audio_media_path)
+
+    return {
+        'audio_url': audio_url,
+        'playlist_url': build_playlist_url(audio_url),
+        **payload,
+        'cached': False,
+        'audio_provider': audio_provider,
+    }, status.HTTP_200_OK
 
-        audio_buffer, audio_error, audio_status, audio_provider = AudioProcessor.text_to_speech(extraction['text'])
-        if audio_error:
-            return Response({'detail': audio_error}, status=audio_status)
+
+class BookChapterAudioView(APIView):
+    """Generate audio for specific pages/chapters"""
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, id):
+        book = get_object_or_404(Book, pk=id)
 
         try:
-            audio_path = AudioProcessor.save_audio_file(audio_buffer, audio_filename, get_audio_storage_dir())
-            if not audio_path:
-                raise RuntimeError('Unable to save generated chapter audio.')
-            audio_url = build_media_url(request, 'audio', audio_filename)
-        except Exception as exc:
-            logger.error(f"Error saving audio file: {str(exc)}")
-            return Response({'detail': f'Error saving audio file: {str(exc)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            start_page = parse_positive_int(request.data.get('start_page'), 'start_page', default=1)
+            end_page = parse_positive_int(request.data.get('end_page'), 'end_page', default=start_page)
+        except ValueError as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response({
-            'audio_url': audio_url,
-            'start_page': extraction['start_page'],
-            'end_page': extraction['end_page'],
-            'page_count': extraction['page_count'],
-            'text_length': extraction['character_count'],
-            'estimated_duration_minutes': estimate_minutes(extraction['word_count'], 150),
-            'cached': False,
-            'audio_provider': audio_provider,
-        }, status=status.HTTP_200_OK)
+        payload, status_code = generate_chapter_audio(
+            book,
+            start_page,
+            end_page,
+            request.build_absolute_uri,
+            force_refresh=parse_bool_param(request.data.get('refresh')),
+        )
+        return Response(payload, status=status_code)
+
+def apply_book_analytics(book, analytics):
+    """Store the analytics payload from ``BookAnalyticsAccumulator.as_analytics`` on ``book``."""
+    book.word_count = analytics['word_count']
+    book.character_count = analytics['character_count']
+    book.estimated_reading_time = analytics['estimated_reading_time_minutes']
+    book.estimated_audio_duration = analytics['estimated_audio_duration_minutes']
+    book.top_keywords = analytics['top_keywords']
+    book.total_pages = analytics['page_count'] if analytics['page_count'] > 0 else book.total_pages
+    # Jobs for the same book run concurrently, so only write the fields analytics owns.
+    book.save(update_fields=[
+        'word_count',
+        'character_count',
+        'estimated_reading_time',
+        'estimated_audio_duration',
+        'top_keywords',
+        'total_pages',
+    ])
+    return analytics
 
 class BookAnalyticsView(APIView):
     """Get analytics and insights about the book"""
@@ -989,7 +3207,7 @@ class BookAnalyticsView(APIView):
             return Response({'detail': 'No PDF available for this book.'}, status=status.HTTP_404_NOT_FOUND)
 
         try:
-            extraction = PDFProcessor.extract_text_from_page_range(pdf_source)
+            analytics = PDFProcessor.analyze_page_range(pdf_source)
         except OptionalDependencyError as exc:
             return dependency_error_response(exc)
         except FileNotFoundError as exc:
@@ -999,35 +3217,158 @@ class BookAnalyticsView(APIView):
         except Exception as exc:
             return Response({'detail': f'Error analyzing PDF: {str(exc)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        if not extraction['text']:
+        if not analytics['word_count']:
             return Response({'detail': 'No readable text found in PDF.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        word_count = extraction['word_count']
-        character_count = extraction['character_count']
-        estimated_reading_time = estimate_minutes(word_count, 200)
-        estimated_audio_duration = estimate_minutes(word_count, 150)
-        top_keywords = AIProcessor.build_keyword_stats(extraction['text'])
-
-        book.word_count = word_count
-        book.character_count = character_count
-        book.estimated_reading_time = estimated_reading_time
-        book.estimated_audio_duration = estimated_audio_duration
-        book.top_keywords = top_keywords
-        book.total_pages = extraction['page_count'] if extraction['page_count'] > 0 else book.total_pages
-        book.save()
-
         return Response({
-            'page_count': extraction['page_count'],
-            'word_count': word_count,
-            'character_count': character_count,
-            'estimated_reading_time_minutes': estimated_reading_time,
-            'estimated_audio_duration_minutes': estimated_audio_duration,
-            'top_keywords': top_keywords,
-            'average_words_per_page': word_count // extraction['page_count'] if extraction['page_count'] > 0 else 0,
-            'average_characters_per_page': character_count // extraction['page_count'] if extraction['page_count'] > 0 else 0,
+            **apply_book_analytics(book, analytics),
             'cached': False,
         }, status=status.HTTP_200_OK)
 
+def mark_ai_processing_failed(book, detail, status_code):
+    book.ai_processing_status = 'failed'
+    book.save(update_fields=['ai_processing_status'])
+    return {'detail': detail}, status_code
+
+
+def generate_ai_summary_audio(book, build_absolute_uri, force_refresh=False, summary_mode=None):
+    """Extract, summarize and narrate a book, recording progress on ``book.ai_processing_status``.
+
+    Returns ``(payload, status_code)`` so the synchronous view and the background job share one code path.
+    """
+    if book.ai_summary and book.ai_processing_status == 'completed' and not force_refresh:
+        cached_audio_filename = build_summary_audio_filename(book, book.ai_summary)
+        cached_audio_media_path = build_media_path('audio', AudioCache.get_relative_path(cached_audio_filename))
+        audio_error = None
+        audio_provider = 'cache'
+        if not AudioCache.lookup(cached_audio_filename):
+            # The stored URL outlives the file once the cache sweep evicts it, so narrate the kept summary again.
+            audio_error, _, audio_provider = synthesize_cached_audio(book.ai_summary, cached_audio_filename)
+        cached_audio_url = None if audio_error else build_absolute_uri(cached_audio_media_path)
+        if book.ai_summary_audio_url != cached_audio_url:
+            book.ai_summary_audio_url = cached_audio_url
+            book.save(update_fields=['ai_summary_audio_url'])
+
+        cached_payload = {
+            'summary': book.ai_summary,
+            'audio_url': cached_audio_url,
+            'playlist_url': build_playlist_url(cached_audio_url),
+            'page_count': book.total_pages,
+            'cached': True,
+            'audio_available': bool(cached_audio_url),
+            'processing_status': book.ai_processing_status,
+            'summary_provider': 'cached',
+            'summary_model': None,
+            'audio_provider': audio_provider if cached_audio_url else None,
+        }
+        if audio_error:
+            cached_payload['audio_error'] = audio_error
+        return cached_payload, status.HTTP_200_OK
+
+    book.ai_processing_status = 'processing'
+    book.save(update_fields=['ai_processing_status'])
+
+    pdf_source = get_book_pdf_source(book)
+    if not pdf_source:
+        return mark_ai_processing_failed(book, 'No PDF available for this book.', status.HTTP_404_NOT_FOUND)
+
+    try:
+        extraction = None
+        if force_refresh or not book.ai_summary or book.total_pages <= 0:
+            extraction = PDFProcessor.extract_text_from_page_range(pdf_source)
+            if not extraction['text']:
+                return mark_ai_processing_failed(book, 'No readable text found in PDF.', status.HTTP_400_BAD_REQUEST)
+            summary_result = AIProcessor.generate_summary(
+                book,
+                extraction['text'],
+                max_length=150,
+                min_length=50,
+                mode=summary_mode,
+            )
+        else:
+            summary_result = {
+                'summary': book.ai_summary,
+                'provider': 'cached',
+                'model': None,
+                'source_is_sampled': False,
+            }
+            extraction = {
+                'page_count': book.total_pages,
+            }
+    except OptionalDependencyError as exc:
+        return mark_ai_processing_failed(book, str(exc), status.HTTP_503_SERVICE_UNAVAILABLE)
+    except FileNotFoundError as exc:
+        return mark_ai_processing_failed(book, str(exc), status.HTTP_404_NOT_FOUND)
+    except ValueError as exc:
+        return mark_ai_processing_failed(book, str(exc), status.HTTP_400_BAD_REQUEST)
+    except Exception as exc:
+        return mark_ai_processing_failed(
+            book,
+            f'Error generating AI summary: {str(exc)}',
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    summary = AIProcessor.clean_generated_text(summary_result.get('summary'))
+    if not summary:
+        return mark_ai_processing_failed(
+            book,
+            'Unable to generate a summary for this book.',
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    audio_url = None
+    audio_error = None
+    audio_provider = None
+    audio_filename = build_summary_audio_filename(book, summary)
+    audio_media_path = build_media_path('audio', AudioCache.get_relative_path(audio_filename))
+    if not force_refresh and AudioCache.lookup(audio_filename):
+        audio_url = build_absolute_uri(audio_media_path)
+        audio_provider = 'cache'
+    else:
+        audio_error, _, audio_provider = synthesize_cached_audio(summary, audio_filename)
+        if not audio_error:
+            audio_url = build_absolute_uri(audio_media_path)
+
+    book.ai_summary = summary
+    book.ai_summary_audio_url = audio_url
+    book.total_pages = extraction['page_count'] if extraction.get('page_count', 0) > 0 else book.total_pages
+    book.ai_processing_status = 'completed' if summary else 'failed'
+    book.last_ai_processed = timezone.now()
+    book.save(update_fields=[
+        'ai_summary',
+        'ai_summary_audio_url',
+        'total_pages',
+        'ai_processing_status',
+        'last_ai_processed',
+    ])
+
+    response_payload = {
+        'summary': summary,
+        'audio_url': audio_url,
+        'playlist_url': build_playlist_url(audio_url),
+        'page_count': book.total_pages,
+        'cached': False,
+        'audio_available': bool(audio_url),
+        'processing_status': book.ai_processing_status,
+        'summary_provider': summary_result.get('provider'),
+        'summary_model': summary_result.get('model'),
+        'source_is_sampled': summary_result.get('source_is_sampled', False),
+        'summary_cache_hit': summary_result.get('cache_hit', False),
+        'audio_provider': audio_provider,
+    }
+    if audio_error:
+        response_payload['audio_error'] = audio_error
+
+    return response_payload, status.HTTP_200_OK
+
+
+def parse_summary_mode(value):
+    summary_mode = value or None
+    if summary_mode and summary_mode not in SUMMARY_MODES:
+        raise ValueError(f'mode must be one of: {", ".join(sorted(SUMMARY_MODES))}.')
+    return summary_mode
+
+
 class BookAISummaryAudioView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -1035,117 +3376,84 @@ class BookAISummaryAudioView(APIView):
         book = get_object_or_404(Book, pk=id)
 
         force_refresh = parse_bool_param(request.query_params.get('refresh'))
-        cached_audio_filename = build_audio_cache_filename(book, 'ai_summary_audio')
-        _, cached_audio_url = get_cached_audio_url(request, cached_audio_filename)
-        reusable_audio_url = book.ai_summary_audio_url or cached_audio_url
+        try:
+            summary_mode = parse_summary_mode(request.query_params.get('mode'))
+        except ValueError as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
-        if book.ai_summary and book.ai_processing_status == 'completed' and not force_refresh:
-            return Response({
-                'summary': book.ai_summary,
-                'audio_url': reusable_audio_url,
-                'page_count': book.total_pages,
-                'cached': True,
-                'audio_available': bool(reusable_audio_url),
-                'processing_status': book.ai_processing_status,
-                'summary_provider': 'cached',
-                'summary_model': None,
-                'audio_provider': 'cache' if reusable_audio_url else None,
-            }, status=status.HTTP_200_OK)
+        payload, status_code = generate_ai_summary_audio(
+            book,
+            request.build_absolute_uri,
+            force_refresh=force_refresh,
+            summary_mode=summary_mode,
+        )
+        return Response(payload, status=status_code)
+
+def serialize_book_job(request, book, job, status_url_name, attached=False):
+    payload = {
+        'job_id': job.id,
+        'job_status': job.status,
+        'attached': attached,
+        'status_url': request.build_absolute_uri(
+            reverse(status_url_name, kwargs={'id': book.id, 'job_id': job.id})
+        ),
+        'created_at': job.created_at,
+        'finished_at': job.finished_at,
+    }
+    if job.status == 'completed':
+        payload['result'] = job.result
+    elif job.status == 'failed':
+        payload['error'] = job.last_error
+    return payload
+
+def serialize_ai_summary_job(request, book, job, attached=False):
+    payload = serialize_book_job(request, book, job, 'book-ai-summary-audio-job-status', attached=attached)
+    payload['processing_status'] = book.ai_processing_status
+    return payload
+
+class BookAISummaryAudioJobView(APIView):
+    """Start AI summary and audio generation in the background and return ``202 Accepted`` with a job to poll"""
 
-        book.ai_processing_status = 'processing'
-        book.save(update_fields=['ai_processing_status'])
+    permission_classes = [IsAuthenticated]
 
-        pdf_source = get_book_pdf_source(book)
-        if not pdf_source:
-            book.ai_processing_status = 'failed'
-            book.save(update_fields=['ai_processing_status'])
-            return Response({'detail': 'No PDF available for this book.'}, status=status.HTTP_404_NOT_FOUND)
+    def post(self, request, id):
+        book = get_object_or_404(Book, pk=id)
 
+        force_refresh = parse_bool_param(request.data.get('refresh', request.query_params.get('refresh')))
         try:
-            extraction = None
-            if force_refresh or not book.ai_summary or book.total_pages <= 0:
-                extraction = PDFProcessor.extract_text_from_page_range(pdf_source)
-                if not extraction['text']:
-                    book.ai_processing_status = 'failed'
-                    book.save(update_fields=['ai_processing_status'])
-                    return Response({'detail': 'No readable text found in PDF.'}, status=status.HTTP_400_BAD_REQUEST)
-                summary_result = AIProcessor.generate_summary(book, extraction['text'], max_length=150, min_length=50)
-            else:
-                summary_result = {
-                    'summary': book.ai_summary,
-                    'provider': 'cached',
-                    'model': None,
-                    'source_is_sampled': False,
-                }
-                extraction = {
-                    'page_count': book.total_pages,
-                }
-        except OptionalDependencyError as exc:
-            book.ai_processing_status = 'failed'
-            book.save(update_fields=['ai_processing_status'])
-            return dependency_error_response(exc)
-        except FileNotFoundError as exc:
-            book.ai_processing_status = 'failed'
-            book.save(update_fields=['ai_processing_status'])
-            return Response({'detail': str(exc)}, status=status.HTTP_404_NOT_FOUND)
+            summary_mode = parse_summary_mode(request.data.get('mode', request.query_params.get('mode')))
         except ValueError as exc:
-            book.ai_processing_status = 'failed'
-            book.save(update_fields=['ai_processing_status'])
             return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as exc:
-            book.ai_processing_status = 'failed'
-            book.save(update_fields=['ai_processing_status'])
-            return Response({'detail': f'Error generating AI summary: {str(exc)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        summary = AIProcessor.clean_generated_text(summary_result.get('summary'))
-        if not summary:
-            book.ai_processing_status = 'failed'
-            book.save(update_fields=['ai_processing_status'])
-            return Response({'detail': 'Unable to generate a summary for this book.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if book.ai_summary and book.ai_processing_status == 'completed' and not force_refresh:
+            payload, status_code = generate_ai_summary_audio(book, request.build_absolute_uri)
+            return Response(payload, status=status_code)
+        if not get_book_pdf_source(book):
+            return Response({'detail': 'No PDF available for this book.'}, status=status.HTTP_404_NOT_FOUND)
 
-        audio_url = None
-        audio_error = None
-        audio_provider = None
-        if not force_refresh and cached_audio_url:
-            audio_url = cached_audio_url
-            audio_provider = 'cache'
-        else:
-            audio_buffer, audio_error, audio_status, audio_provider = AudioProcessor.text_to_speech(summary)
-            if audio_buffer:
-                try:
-                    audio_path = AudioProcessor.save_audio_file(audio_buffer, cached_audio_filename, get_audio_storage_dir())
-                    if not audio_path:
-                        raise RuntimeError('Unable to save generated AI summary audio.')
-                    audio_url = build_media_url(request, 'audio', cached_audio_filename)
-                except Exception as exc:
-                    logger.error(f"Error saving audio file: {str(exc)}")
-                    audio_error = f'Error saving audio file: {str(exc)}'
-            elif audio_error and audio_status != status.HTTP_503_SERVICE_UNAVAILABLE:
-                logger.error(audio_error)
-
-        book.ai_summary = summary
-        book.ai_summary_audio_url = audio_url
-        book.total_pages = extraction['page_count'] if extraction.get('page_count', 0) > 0 else book.total_pages
-        book.ai_processing_status = 'completed' if summary else 'failed'
-        book.last_ai_processed = timezone.now()
-        book.save()
-
-        response_payload = {
-            'summary': summary,
-            'audio_url': audio_url,
-            'page_count': book.total_pages,
-            'cached': False,
-            'audio_available': bool(audio_url),
-            'processing_status': book.ai_processing_status,
-            'summary_provider': summary_result.get('provider'),
-            'summary_model': summary_result.get('model'),
-            'source_is_sampled': summary_result.get('source_is_sampled', False),
-            'audio_provider': audio_provider,
-        }
-        if audio_error:
-            response_payload['audio_error'] = audio_error
+        job, created = enqueue_ai_summary_audio_job(
+            book,
+            base_url=request.build_absolute_uri('/'),
+            force_refresh=force_refresh,
+            summary_mode=summary_mode,
+        )
+        book.refresh_from_db(fields=['ai_processing_status'])
+        payload = serialize_ai_summary_job(request, book, job, attached=not created)
+        response = Response(payload, status=status.HTTP_202_ACCEPTED)
+        response['Location'] = payload['status_url']
+        return response
 
-        return Response(response_payload, status=status.HTTP_200_OK)
+class BookAISummaryAudioJobStatusView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, id, job_id):
+        book = get_object_or_404(Book, pk=id)
+        job = get_object_or_404(BackgroundJob, pk=job_id, book=book, kind=JOB_AI_SUMMARY_AUDIO)
+        payload = serialize_ai_summary_job(request, book, job)
+        # Clients can keep polling until the book leaves the processing state.
+        if book.ai_processing_status == 'processing' and job.status in {'queued', 'running'}:
+            payload['retry_after'] = AI_SUMMARY_JOB_POLL_SECONDS
+        return Response(payload, status=status.HTTP_200_OK)
 
 # class BookReadAloudView(APIView):
 #     permission_classes = [IsAuthenticated]
@@ -1310,103 +3618,191 @@ class BookRecommendationView(APIView):
         serializer = BookSerializer(recommended, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
-class BookFullAudioView(APIView):
-    permission_classes = [IsAuthenticated]
+def record_audio_library_entry(user_id, book, estimated_duration):
+    library_entry, created = Library.objects.get_or_create(
+        user_id=user_id,
+        book=book,
+        type='audio',
+        defaults={'total': estimated_duration, 'progress': 0},
+    )
+    if not created:
+        library_entry.total = estimated_duration
+        library_entry.save()
+    return library_entry
 
-    def get(self, request, id):
-        book = get_object_or_404(Book, pk=id)
 
-        force_refresh = parse_bool_param(request.query_params.get('refresh'))
-        cached_audio_filename = build_audio_cache_filename(book, 'full_audio')
-        _, cached_audio_url = get_cached_audio_url(request, cached_audio_filename)
+def get_full_audio_max_characters():
+    return getattr(settings, 'FULL_AUDIO_MAX_CHARACTERS', MAX_FULL_AUDIO_CHARACTERS)
 
-        if book.full_audio_url and not force_refresh:
-            return Response({
-                'audio_url': book.full_audio_url,
-                'page_count': book.total_pages,
-                'text_length': book.character_count,
-                'estimated_duration_minutes': book.estimated_audio_duration,
-                'cached': True,
-                'audio_provider': 'cache',
-            }, status=status.HTTP_200_OK)
-        if cached_audio_url and not force_refresh:
-            if book.full_audio_url != cached_audio_url:
-                book.full_audio_url = cached_audio_url
+
+def generate_full_audio(book, build_absolute_uri, force_refresh=False, cached_only=False):
+    """Narrate the whole of ``book`` into the audio cache, reusing the cached file when there is one.
+
+    Returns ``(payload, status_code)`` so the view and the background job share one code path. With
+    ``cached_only`` nothing is synthesized and a cache miss returns ``(None, None)``.
+    """
+    pdf_source = get_book_pdf_source(book)
+    if not pdf_source:
+        return {'detail': 'No PDF available for this book.'}, status.HTTP_404_NOT_FOUND
+
+    resolved = None
+    try:
+        resolved = PDFProcessor.resolve_source(pdf_source)
+        # Versioned by the PDF bytes, so the cached file is found without extracting the whole book.
+        audio_filename = build_audio_cache_filename(book, 'full_audio', source=resolved.get_content_hash())
+        audio_media_path = build_media_path('audio', AudioCache.get_relative_path(audio_filename))
+        if AudioCache.lookup(audio_filename) and not force_refresh:
+            audio_url = build_absolute_uri(audio_media_path)
+            if book.full_audio_url != audio_url:
+                book.full_audio_url = audio_url
                 book.save(update_fields=['full_audio_url'])
-            return Response({
-                'audio_url': cached_audio_url,
+            return {
+                'audio_url': audio_url,
+                'playlist_url': build_playlist_url(audio_url),
                 'page_count': book.total_pages,
                 'text_length': book.character_count,
                 'estimated_duration_minutes': book.estimated_audio_duration,
                 'cached': True,
                 'audio_provider': 'cache',
-            }, status=status.HTTP_200_OK)
+            }, status.HTTP_200_OK
+        if cached_only:
+            return None, None
+
+        extraction = PDFProcessor.extract_text_from_page_range(resolved)
+    except OptionalDependencyError as exc:
+        return {'detail': str(exc)}, status.HTTP_503_SERVICE_UNAVAILABLE
+    except FileNotFoundError as exc:
+        return {'detail': str(exc)}, status.HTTP_404_NOT_FOUND
+    except ValueError as exc:
+        return {'detail': str(exc)}, status.HTTP_400_BAD_REQUEST
+    except Exception as exc:
+        return {'detail': f'Error generating full audio: {str(exc)}'}, status.HTTP_500_INTERNAL_SERVER_ERROR
+    finally:
+        if resolved is not None:
+            resolved.release()
+
+    if not extraction['text']:
+        return {'detail': 'No readable text found in PDF.'}, status.HTTP_400_BAD_REQUEST
+
+    max_characters = get_full_audio_max_characters()
+    if extraction['character_count'] > max_characters:
+        return {
+            'detail': 'Text is too long for full audio conversion. Please use the summary audio feature instead.',
+            'text_length': extraction['character_count'],
+            'estimated_duration_minutes': estimate_minutes(extraction['word_count'], 150),
+            'max_supported_characters': max_characters,
+        }, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    # Long books are narrated as parallel segments and streamed into the cache file.
+    audio_error, audio_status, audio_provider = synthesize_cached_audio(
+        extraction['text'],
+        audio_filename,
+        segment_breaks=extraction.get('page_offsets'),
+    )
+    if audio_error:
+        return {'detail': audio_error}, audio_status
+    audio_url = build_absolute_uri(audio_media_path)
+
+    estimated_duration = estimate_minutes(extraction['word_count'], 150)
+    book.full_audio_url = audio_url
+    book.total_pages = extraction['page_count'] if extraction['page_count'] > 0 else book.total_pages
+    book.character_count = extraction['character_count']
+    book.word_count = extraction['word_count']
+    book.estimated_audio_duration = estimated_duration
+    if not book.estimated_reading_time:
+        book.estimated_reading_time = estimate_minutes(extraction['word_count'], 200)
+    book.save(update_fields=[
+        'full_audio_url',
+        'total_pages',
+        'character_count',
+        'word_count',
+        'estimated_audio_duration',
+        'estimated_reading_time',
+    ])
+
+    return {
+        'audio_url': audio_url,
+        'playlist_url': build_playlist_url(audio_url),
+        'page_count': extraction['page_count'],
+        'text_length': extraction['character_count'],
+        'estimated_duration_minutes': estimated_duration,
+        'cached': False,
+        'audio_provider': audio_provider,
+    }, status.HTTP_200_OK
+
+
+def serialize_full_audio_job(request, book, job, attached=False):
+    payload = serialize_book_job(request, book, job, 'book-full-audio-job-status', attached=attached)
+    if job.status in {'queued', 'running'}:
+        payload['retry_after'] = FULL_AUDIO_JOB_POLL_SECONDS
+    return payload
 
-        pdf_source = get_book_pdf_source(book)
-        if not pdf_source:
-            return Response({'detail': 'No PDF available for this book.'}, status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            extraction = PDFProcessor.extract_text_from_page_range(pdf_source)
-        except OptionalDependencyError as exc:
-            return dependency_error_response(exc)
-        except FileNotFoundError as exc:
-            return Response({'detail': str(exc)}, status=status.HTTP_404_NOT_FOUND)
-        except ValueError as exc:
-            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as exc:
-            return Response({'detail': f'Error generating full audio: {str(exc)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+class BookFullAudioView(APIView):
+    """Return cached full-book audio, or narrate it in the background and return ``202 Accepted`` with a job to poll
 
-        if not extraction['text']:
-            return Response({'detail': 'No readable text found in PDF.'}, status=status.HTTP_400_BAD_REQUEST)
+    A whole book can take hundreds of TTS segments, far longer than a web worker may hold a request.
+    """
+    permission_classes = [IsAuthenticated]
 
-        if extraction['character_count'] > MAX_FULL_AUDIO_CHARACTERS:
+    def get(self, request, id):
+        book = get_object_or_404(Book, pk=id)
+
+        force_refresh = parse_bool_param(request.query_params.get('refresh'))
+        if book.full_audio_url and not force_refresh:
+            # The stored URL outlives the file when the cache sweep evicts it, so confirm it is still on disk.
+            stored_filename = get_audio_filename_from_url(book.full_audio_url)
+            if AudioCache.lookup(stored_filename):
+                audio_url = build_media_url(request, 'audio', AudioCache.get_relative_path(stored_filename))
+                if book.full_audio_url != audio_url:
+                    book.full_audio_url = audio_url
+                    book.save(update_fields=['full_audio_url'])
+                return Response({
+                    'audio_url': audio_url,
+                    'playlist_url': build_playlist_url(audio_url),
+                    'page_count': book.total_pages,
+                    'text_length': book.character_count,
+                    'estimated_duration_minutes': book.estimated_audio_duration,
+                    'cached': True,
+                    'audio_provider': 'cache',
+                }, status=status.HTTP_200_OK)
+            book.full_audio_url = None
+            book.save(update_fields=['full_audio_url'])
+
+        # Refuse books already known to be too long before queueing any work; the job checks again after extraction.
+        max_characters = get_full_audio_max_characters()
+        if book.character_count > max_characters:
             return Response({
                 'detail': 'Text is too long for full audio conversion. Please use the summary audio feature instead.',
-                'text_length': extraction['character_count'],
-                'estimated_duration_minutes': estimate_minutes(extraction['word_count'], 150),
-                'max_supported_characters': MAX_FULL_AUDIO_CHARACTERS,
+                'text_length': book.character_count,
+                'estimated_duration_minutes': book.estimated_audio_duration,
+                'max_supported_characters': max_characters,
             }, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
 
-        audio_buffer, audio_error, audio_status, audio_provider = AudioProcessor.text_to_speech(extraction['text'])
-        if audio_error:
-            return Response({'detail': audio_error}, status=audio_status)
+        payload, status_code = generate_full_audio(
+            book,
+            request.build_absolute_uri,
+            force_refresh=force_refresh,
+            cached_only=True,
+        )
+        if payload is not None:
+            return Response(payload, status=status_code)
 
-        try:
-            audio_path = AudioProcessor.save_audio_file(audio_buffer, cached_audio_filename, get_audio_storage_dir())
-            if not audio_path:
-                raise RuntimeError('Unable to save generated full audio.')
-            audio_url = build_media_url(request, 'audio', cached_audio_filename)
-        except Exception as exc:
-            logger.error(f"Error saving audio file: {str(exc)}")
-            return Response({'detail': f'Error saving audio file: {str(exc)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        estimated_duration = estimate_minutes(extraction['word_count'], 150)
-        book.full_audio_url = audio_url
-        book.total_pages = extraction['page_count'] if extraction['page_count'] > 0 else book.total_pages
-        book.character_count = extraction['character_count']
-        book.word_count = extraction['word_count']
-        book.estimated_audio_duration = estimated_duration
-        if not book.estimated_reading_time:
-            book.estimated_reading_time = estimate_minutes(extraction['word_count'], 200)
-        book.save()
-
-        library_entry, created = Library.objects.get_or_create(
-            user=request.user,
-            book=book,
-            type='audio',
-            defaults={'total': estimated_duration, 'progress': 0},
+        job, created = enqueue_full_audio_job(
+            book,
+            base_url=request.build_absolute_uri('/'),
+            force_refresh=force_refresh,
+            user_id=request.user.pk,
         )
-        if not created:
-            library_entry.total = estimated_duration
-            library_entry.save()
+        payload = serialize_full_audio_job(request, book, job, attached=not created)
+        response = Response(payload, status=status.HTTP_202_ACCEPTED)
+        response['Location'] = payload['status_url']
+        return response
 
-        return Response({
-            'audio_url': audio_url,
-            'page_count': extraction['page_count'],
-            'text_length': extraction['character_count'],
-            'estimated_duration_minutes': estimated_duration,
-            'cached': False,
-            'audio_provider': audio_provider,
-        }, status=status.HTTP_200_OK)
+class BookFullAudioJobStatusView(APIView):
+    permission_classes = [IsAuthenticated]
 
+    def get(self, request, id, job_id):
+        book = get_object_or_404(Book, pk=id)
+        job = get_object_or_404(BackgroundJob, pk=job_id, book=book, kind=JOB_FULL_AUDIO)
+        return Response(serialize_full_audio_job(request, book, job), status=status.HTTP_200_OK)
@@ -65,6 +65,70 @@ OPENAI_TTS_INSTRUCTIONS = os.getenv(
     'OPENAI_TTS_INSTRUCTIONS',
     'Speak clearly, warmly, and naturally like an attentive audiobook narrator.',
 )
+OPENAI_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', 4))
+OPENAI_MAX_CONNECTIONS = int(os.getenv('OPENAI_MAX_CONNECTIONS', 20))
+OPENAI_KEEPALIVE_SECONDS = int(os.getenv('OPENAI_KEEPALIVE_SECONDS', 60))
+OPENAI_TIMEOUT = float(os.getenv('OPENAI_TIMEOUT', 60))
+OPENAI_SUMMARY_TIMEOUT = float(os.getenv('OPENAI_SUMMARY_TIMEOUT', 90))
+OPENAI_TTS_TIMEOUT = float(os.getenv('OPENAI_TTS_TIMEOUT', 120))
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', 3))
+OPENAI_RETRY_BASE_DELAY = float(os.getenv('OPENAI_RETRY_BASE_DELAY', 0.5))
+OPENAI_RETRY_MAX_DELAY = float(os.getenv('OPENAI_RETRY_MAX_DELAY', 20))
+TTS_SEGMENT_CHARS = int(os.getenv('TTS_SEGMENT_CHARS', 3500))
+TTS_MAX_WORKERS = int(os.getenv('TTS_MAX_WORKERS', 4))
+TTS_SEGMENT_SILENCE_MS = int(os.getenv('TTS_SEGMENT_SILENCE_MS', 250))
+FULL_AUDIO_MAX_CHARACTERS = int(os.getenv('FULL_AUDIO_MAX_CHARACTERS', 2000000))
+TTS_SEGMENT_CACHE_ENABLED = os.getenv('TTS_SEGMENT_CACHE_ENABLED', 'True').strip().lower() in {'1', 'true', 'yes', 'on'}
+# Empty keeps segments under MEDIA_ROOT/media/audio/segments.
+TTS_SEGMENT_CACHE_DIR = os.getenv('TTS_SEGMENT_CACHE_DIR', '').strip()
+AUDIO_CACHE_MAX_BYTES = int(os.getenv('AUDIO_CACHE_MAX_BYTES', 5 * 1024 * 1024 * 1024))
+AUDIO_CACHE_SWEEP_INTERVAL_SECONDS = int(os.getenv('AUDIO_CACHE_SWEEP_INTERVAL_SECONDS', 3600))
+
+SUMMARIZER_MODEL = os.getenv('SUMMARIZER_MODEL', 'sshleifer/distilbart-cnn-12-6')
+SUMMARIZER_PRELOAD = os.getenv('SUMMARIZER_PRELOAD', 'False').strip().lower() in {'1', 'true', 'yes', 'on'}
+SUMMARIZER_MODEL_MEMORY_BUDGET_MB = int(os.getenv('SUMMARIZER_MODEL_MEMORY_BUDGET_MB', 2048))
+SUMMARIZER_MODEL_IDLE_SECONDS = int(os.getenv('SUMMARIZER_MODEL_IDLE_SECONDS', 3600))
+SUMMARIZER_TORCH_THREADS = int(os.getenv('SUMMARIZER_TORCH_THREADS', 0))
+SUMMARIZER_QUANTIZE = os.getenv('SUMMARIZER_QUANTIZE', 'none').strip().lower()
+SUMMARIZER_MAX_INPUT_TOKENS = int(os.getenv('SUMMARIZER_MAX_INPUT_TOKENS', 0))
+SUMMARIZER_INFERENCE_MODE = os.getenv('SUMMARIZER_INFERENCE_MODE', 'True').strip().lower() in {'1', 'true', 'yes', 'on'}
+SUMMARIZER_BATCH_SIZE = int(os.getenv('SUMMARIZER_BATCH_SIZE', 8))
+SUMMARIZER_BATCH_WAIT_MS = int(os.getenv('SUMMARIZER_BATCH_WAIT_MS', 25))
+SUMMARIZER_BATCH_RESULT_TIMEOUT_SECONDS = float(os.getenv('SUMMARIZER_BATCH_RESULT_TIMEOUT_SECONDS', 300))
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv('SUMMARY_CACHE_MAX_ENTRIES', 20000))
+SUMMARY_MODE = os.getenv('SUMMARY_MODE', 'sampled').strip().lower()
+SUMMARY_MAP_REDUCE_CHUNK_CHARS = int(os.getenv('SUMMARY_MAP_REDUCE_CHUNK_CHARS', 3000))
+EXTRACTIVE_SUMMARY_METHOD = os.getenv('EXTRACTIVE_SUMMARY_METHOD', 'textrank').strip().lower()
+
+# Empty keeps downloads under MEDIA_ROOT/media/pdf_cache.
+PDF_DOWNLOAD_CACHE_DIR = os.getenv('PDF_DOWNLOAD_CACHE_DIR', '').strip()
+PDF_DOWNLOAD_CACHE_MAX_BYTES = int(os.getenv('PDF_DOWNLOAD_CACHE_MAX_BYTES', 1024 * 1024 * 1024))
+PDF_DOWNLOAD_CACHE_REVALIDATE_SECONDS = int(os.getenv('PDF_DOWNLOAD_CACHE_REVALIDATE_SECONDS', 300))
+PDF_PARALLEL_EXTRACTION_MIN_PAGES = int(os.getenv('PDF_PARALLEL_EXTRACTION_MIN_PAGES', 200))
+PDF_EXTRACTION_WORKERS = int(os.getenv('PDF_EXTRACTION_WORKERS', 0))
+PDF_IN_MEMORY_MAX_BYTES = int(os.getenv('PDF_IN_MEMORY_MAX_BYTES', 64 * 1024 * 1024))
+PDF_MMAP_LOCAL_FILES = os.getenv('PDF_MMAP_LOCAL_FILES', 'True').strip().lower() in {'1', 'true', 'yes', 'on'}
+PDF_CACHE_MAX_AGE = int(os.getenv('PDF_CACHE_MAX_AGE', 3600))
+AUDIO_CACHE_MAX_AGE = int(os.getenv('AUDIO_CACHE_MAX_AGE', 31536000))
+AUDIO_PLAYLIST_SEGMENT_SECONDS = int(os.getenv('AUDIO_PLAYLIST_SEGMENT_SECONDS', 10))
+
+BACKGROUND_JOB_MAX_ATTEMPTS = int(os.getenv('BACKGROUND_JOB_MAX_ATTEMPTS', 3))
+BACKGROUND_JOB_LOCK_TIMEOUT = int(os.getenv('BACKGROUND_JOB_LOCK_TIMEOUT', 1800))
+
+# Off-peak pre-generation of summary and opening-chapter audio for the most active books.
+PREGENERATION_WINDOWS = os.getenv('PREGENERATION_WINDOWS', '01:00-06:00')
+PREGENERATION_DAILY_CHARACTER_BUDGET = int(os.getenv('PREGENERATION_DAILY_CHARACTER_BUDGET', 500000))
+PREGENERATION_ACTIVITY_DAYS = int(os.getenv('PREGENERATION_ACTIVITY_DAYS', 7))
+PREGENERATION_MAX_BOOKS = int(os.getenv('PREGENERATION_MAX_BOOKS', 20))
+PREGENERATION_CHAPTERS = int(os.getenv('PREGENERATION_CHAPTERS', 2))
+PREGENERATION_CHAPTER_PAGES = int(os.getenv('PREGENERATION_CHAPTER_PAGES', 5))
+PREGENERATION_REFRESH_HOURS = int(os.getenv('PREGENERATION_REFRESH_HOURS', 24))
+# Absolute site URL used in stored audio links; required when pre-generation runs.
+PREGENERATION_BASE_URL = os.getenv('PREGENERATION_BASE_URL', '').strip()
+
+# Set to `x-accel-redirect` (nginx) or `x-sendfile` (Apache/lighttpd) to let the front-end server stream files.
+FILE_SENDFILE_MODE = os.getenv('FILE_SENDFILE_MODE', '').strip().lower()
+FILE_ACCEL_REDIRECT_PREFIX = os.getenv('FILE_ACCEL_REDIRECT_PREFIX', '/protected-media/')
 
 
 # Application definition
@@ -237,7 +301,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'api.CustomUser'
 
-MEDIA_ROOT = BASE_DIR
+# Uploads and generated audio live here; point it at a persistent disk in production.
+MEDIA_ROOT = Path(os.getenv('MEDIA_ROOT', '').strip() or BASE_DIR)
 MEDIA_URL = '/media/'
 
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
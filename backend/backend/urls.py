@@ -17,6 +17,7 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path, re_path
 from django.views.static import serve
+from api.views import serve_audio
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -37,5 +38,6 @@ urlpatterns = [
 urlpatterns += [
     re_path(r'^media/covers/(?P<path>.*)$', serve, {'document_root': os.path.join(settings.MEDIA_ROOT, 'covers')}),
     re_path(r'^media/pdfs/(?P<path>.*)$', serve, {'document_root': os.path.join(settings.MEDIA_ROOT, 'pdfs')}),
-    re_path(r'^media/audio/(?P<path>.*)$', serve, {'document_root': os.path.join(settings.MEDIA_ROOT, 'media', 'audio')}),
+    # Range requests, immutable caching and HLS playlists for generated audio.
+    re_path(r'^media/audio/(?P<path>.*)$', serve_audio),
 ]
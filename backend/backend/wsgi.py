@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_wsgi_application()
+
+# Load the summarization model (when SUMMARIZER_PRELOAD is on) before the first request, not during manage.py commands.
+from api.apps import preload_summarizer  # noqa: E402
+
+preload_summarizer()
@@ -394,13 +394,32 @@ export const fetchBookAISummaryAudio = async (id, options = {}) => {
   }
 };
 
+const wait = (seconds) => new Promise((resolve) => setTimeout(resolve, seconds * 1000));
+// Long enough for a novel-length book; past this the job worker is most likely not running.
+const FULL_AUDIO_MAX_WAIT_SECONDS = 30 * 60;
+
 export const fetchBookFullAudio = async (id, options = {}) => {
   try {
-    return await apiRequest(`/books/${id}/full-audio/`, {
+    let data = await apiRequest(`/books/${id}/full-audio/`, {
       headers: getAuthHeaders(),
       params: options.refresh ? { refresh: 1 } : {},
       fallbackMessage: 'Failed to generate full audio.',
     });
+    // Books without cached audio are narrated in the background; poll the job until it finishes.
+    const deadline = Date.now() + FULL_AUDIO_MAX_WAIT_SECONDS * 1000;
+    while (data?.job_id) {
+      if (data.job_status === 'completed') return data.result;
+      if (data.job_status === 'failed') throw new Error(data.error || 'Failed to generate full audio.');
+      if (Date.now() >= deadline) {
+        throw new Error('Full audio is taking longer than expected. Please try again later.');
+      }
+      await wait(data.retry_after || 10);
+      data = await apiRequest(`/books/${id}/full-audio/jobs/${data.job_id}/`, {
+        headers: getAuthHeaders(),
+        fallbackMessage: 'Failed to generate full audio.',
+      });
+    }
+    return data;
   } catch (err) {
     throw new Error(extractApiError(err, 'Failed to generate full audio.'));
   }